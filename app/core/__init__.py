@@ -3,16 +3,32 @@ Core module for ASL Mobile App
 Contains the main engine and utility classes
 """
 
+import importlib
+
 # Core module initialization
 __version__ = "1.0.0"
 __author__ = "ASL Mobile App Team"
 
-# Make imports available at package level
-try:
-    from .asl_engine import ASLEngine
-    from .settings_manager import SettingsManager
-    from .speech_engine import speech_engine
-except ImportError as e:
-    print(f"⚠️ Core module import warning: {e}")
-    # These will be available when the full project is set up
-    pass
\ No newline at end of file
+# Package-level names are imported lazily: asl_engine pulls in TensorFlow,
+# which must not load just because a screen imported a lightweight helper.
+_LAZY_EXPORTS = {
+    'ASLEngine': '.asl_engine',
+    'SettingsManager': '.settings_manager',
+    'speech_engine': '.speech_engine',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError as e:
+        print(f"⚠️ Core module import warning: {e}")
+        # These will be available when the full project is set up
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
+
+    globals()[name] = value
+    return value
@@ -448,8 +448,13 @@ import os
 import numpy as np
 from typing import Optional, Dict, Any, List, Tuple
 import logging
+import time
 from pathlib import Path
 
+from .tflite_utils import model_store, auto_tune_num_threads
+from .latency_tracker import LatencyTracker, measure_warmup
+from .prediction_result import PredictionResult
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -499,8 +504,17 @@ except ImportError:
 class ASLEngine:
     """ASL Sign Language Recognition Engine"""
 
-    def __init__(self):
-        """Initialize the ASL recognition engine"""
+    def __init__(self, num_threads: Optional[int] = None, use_xnnpack: bool = True,
+                 auto_tune_threads: bool = False, warmup_runs: int = 3):
+        """
+        Initialize the ASL recognition engine
+
+        Args:
+            num_threads: TFLite CPU threads (None or 0 lets TFLite decide)
+            use_xnnpack: Use the XNNPACK CPU delegate for TFLite models
+            auto_tune_threads: Benchmark thread counts at load time and keep the fastest
+            warmup_runs: Inferences on a blank frame in load_model, before the model reports loaded
+        """
 
         # Model state
         self.model = None
@@ -516,8 +530,43 @@ class ASLEngine:
         # Prediction state
         self.last_prediction = None
         self.last_confidence = 0.0
+        self.last_probabilities = None  # Full softmax of the last prediction (reused buffer)
+
+        # Per-frame embeddings for temporal models (off until enable_embeddings())
+        self.embeddings_enabled = False
+        self.embedding_index = None  # Extra TFLite output with backbone features, if the model has one
+        self.embedding_size = self.num_classes
+        self.last_embedding = None
         self.prediction_history = []
 
+        # TFLite runtime options
+        self.num_threads = num_threads
+        self.use_xnnpack = use_xnnpack
+        self.auto_tune_threads = auto_tune_threads
+        self.thread_timings = {}
+
+        # Load-time warm-up (first-inference setup is paid here, not by the first sign)
+        self.warmup_runs = warmup_runs
+        self.load_time_ms = None
+        self.warmup_stats = {}
+
+        # Cached TFLite tensor info (set in _load_tflite_model)
+        self.input_index = None
+        self.output_index = None
+        self._resize_buffer = None
+
+        # Quantization info for full-integer (uint8/int8) models
+        self.quantized_input = False
+        self.quantized_output = False
+        self.input_quantization = (0.0, 0)
+        self.output_quantization = (0.0, 0)
+        self.input_dtype = np.dtype(np.float32)
+        self._input_mode = 'float'  # 'float', 'identity', 'int8_shift' or 'lut'
+        self._input_lut = None
+
+        # Per-stage latency (camera screen adds its own stages to the same tracker)
+        self.latency = LatencyTracker()
+
         # Demo mode
         self.demo_mode = not TENSORFLOW_AVAILABLE
         self.demo_index = 0
@@ -558,6 +607,7 @@ class ASLEngine:
                 return False
 
             print(f"📥 Loading model from {model_path}")
+            load_start = time.perf_counter()
 
             # Determine model type and load accordingly
             if model_path.endswith('.tflite') and MODEL_TYPE == 'tflite':
@@ -569,6 +619,8 @@ class ASLEngine:
                 return False
 
             if success:
+                self.load_time_ms = (time.perf_counter() - load_start) * 1000
+                self.warm_up(self.warmup_runs)
                 self.model_loaded = True
                 self.model_path = model_path
                 print(f"✅ Model loaded successfully!")
@@ -587,7 +639,13 @@ class ASLEngine:
     def _load_tflite_model(self, model_path: str) -> bool:
         """Load TensorFlow Lite model"""
         try:
-            self.model = tflite.Interpreter(model_path=model_path)
+            if self.auto_tune_threads:
+                self.num_threads, self.thread_timings = auto_tune_num_threads(
+                    model_path, use_xnnpack=self.use_xnnpack)
+
+            # Built over the process-wide mapping of the model file (shared with other engines)
+            self.model = model_store.create_interpreter(model_path, num_threads=self.num_threads,
+                                                        use_xnnpack=self.use_xnnpack)
             self.model.allocate_tensors()
 
             # Get input and output details
@@ -595,17 +653,132 @@ class ASLEngine:
             output_details = self.model.get_output_details()
 
             # Update input shape from model
-            self.input_shape = input_details[0]['shape'][1:4]  # Remove batch dimension
-            self.num_classes = output_details[0]['shape'][1]
+            self.input_shape = tuple(int(d) for d in input_details[0]['shape'][1:4])  # Remove batch dimension
+            self.num_classes = int(output_details[0]['shape'][1])
             self.model_type = 'tflite'
 
-            print(f"✅ TensorFlow Lite model loaded")
+            # Cache tensor indices so the per-frame path never queries details
+            self.input_index = input_details[0]['index']
+            self.output_index = output_details[0]['index']
+
+            # Reusable resize target (written by cv2.resize on every frame)
+            height, width, channels = self.input_shape
+            self._resize_buffer = np.empty((height, width, channels), dtype=np.uint8)
+
+            # Reusable (dequantized) probability vector for smoothing
+            self.last_probabilities = np.zeros(self.num_classes, dtype=np.float32)
+
+            # A second 2-D output (e.g. the penultimate Dense layer) is used as the embedding;
+            # otherwise the logits, recovered from the probabilities, are
+            self.embedding_index = None
+            self.embedding_size = self.num_classes
+            for detail in output_details[1:]:
+                if len(detail['shape']) == 2 and detail['dtype'] == np.float32:
+                    self.embedding_index = detail['index']
+                    self.embedding_size = int(detail['shape'][1])
+                    break
+            self.last_embedding = np.zeros(self.embedding_size, dtype=np.float32)
+
+            # Detect full-integer quantized tensors
+            self._configure_quantization(input_details[0], output_details[0])
+
+            print(f"✅ TensorFlow Lite model loaded "
+                  f"(threads: {self.num_threads or 'default'}, XNNPACK: {self.use_xnnpack})")
             return True
 
         except Exception as e:
             print(f"❌ TensorFlow Lite loading failed: {e}")
             return False
 
+    def warm_up(self, runs: int = 3) -> Dict[str, Any]:
+        """
+        Run inferences on a blank frame so the first real one is not the cold start
+
+        load_model calls this before reporting the model loaded (the app loads
+        on a background thread, so the UI never waits on it). The stage
+        latency samples of the warm-up are discarded.
+
+        Args:
+            runs: Number of warm-up inferences
+
+        Returns:
+            Dict with warmup_runs, cold_start_ms and warm_latency_ms
+        """
+        if self.model_type == 'tflite':
+            frame = np.zeros(self.input_shape, dtype=np.uint8)
+            run = lambda: self._predict_tflite_inplace(frame)
+        elif self.model_type == 'keras':
+            blank = np.zeros((1, *self.input_shape), dtype=np.float32)
+            run = lambda: self._predict_keras(blank)
+        else:
+            return {}
+
+        self.warmup_stats = measure_warmup(run, runs)
+        self.latency.reset()
+
+        if self.warmup_stats['warmup_runs']:
+            warm = self.warmup_stats['warm_latency_ms']
+            print(f"🔥 Warm-up: cold start {self.warmup_stats['cold_start_ms']:.1f}ms"
+                  + (f", warm {warm:.1f}ms" if warm is not None else ""))
+        return self.warmup_stats
+
+    def _configure_quantization(self, input_detail: Dict[str, Any], output_detail: Dict[str, Any]):
+        """
+        Work out how camera pixels map onto a quantized input tensor
+
+        A uint8 input with scale 1/255 and zero point 0 takes raw pixels as-is,
+        and the int8 equivalent (zero point -128) is a sign-bit flip. Anything
+        else goes through a 256-entry lookup table built once here.
+        """
+        input_dtype = np.dtype(input_detail['dtype'])
+        output_dtype = np.dtype(output_detail['dtype'])
+
+        self.quantized_input = input_dtype in (np.uint8, np.int8)
+        self.quantized_output = output_dtype in (np.uint8, np.int8)
+        self.input_quantization = tuple(input_detail.get('quantization', (0.0, 0)))
+        self.output_quantization = tuple(output_detail.get('quantization', (0.0, 0)))
+        self.input_dtype = input_dtype
+        self._input_lut = None
+
+        if not self.quantized_input:
+            self._input_mode = 'float'
+            return
+
+        scale, zero_point = self.input_quantization
+        unit_scale = scale > 0 and abs(scale * 255.0 - 1.0) < 1e-3
+
+        if unit_scale and input_dtype == np.uint8 and zero_point == 0:
+            self._input_mode = 'identity'
+        elif unit_scale and input_dtype == np.int8 and zero_point == -128:
+            self._input_mode = 'int8_shift'
+        else:
+            # q = round(pixel / 255 / scale + zero_point), stored as raw bytes
+            info = np.iinfo(input_dtype)
+            pixels = np.arange(256, dtype=np.float64) / 255.0
+            quantized = np.clip(np.round(pixels / scale + zero_point), info.min, info.max)
+            self._input_lut = quantized.astype(input_dtype).view(np.uint8)
+            self._input_mode = 'lut'
+
+        print(f"🔢 Quantized model detected (input: {input_dtype.name}, output: {output_dtype.name}, "
+              f"pixel mapping: {self._input_mode})")
+
+    def _quantize_input(self, image: np.ndarray) -> np.ndarray:
+        """Convert a normalized float batch to the quantized input dtype"""
+        if not self.quantized_input:
+            return image
+
+        scale, zero_point = self.input_quantization
+        info = np.iinfo(self.input_dtype)
+        return np.clip(np.round(image / scale + zero_point), info.min, info.max).astype(self.input_dtype)
+
+    def _dequantize_output(self, output: np.ndarray) -> np.ndarray:
+        """Convert a quantized output vector back to probabilities"""
+        if not self.quantized_output:
+            return output
+
+        scale, zero_point = self.output_quantization
+        return (output.astype(np.float32) - zero_point) * scale
+
     def _load_keras_model(self, model_path: str) -> bool:
         """Load Keras/TensorFlow model"""
         try:
@@ -618,6 +791,9 @@ class ASLEngine:
             self.input_shape = input_shape[1:4]  # Remove batch dimension
             self.num_classes = self.model.output_shape[1]
             self.model_type = 'keras'
+            self.embedding_index = None
+            self.embedding_size = self.num_classes
+            self.last_embedding = np.zeros(self.embedding_size, dtype=np.float32)
 
             print(f"✅ Keras model loaded")
             return True
@@ -683,7 +859,7 @@ class ASLEngine:
             print(f"❌ Image preprocessing failed: {e}")
             return None
 
-    def predict(self, image_data) -> Optional[Tuple[str, float]]:
+    def predict(self, image_data) -> Optional[PredictionResult]:
         """
         Predict ASL sign from image
 
@@ -691,7 +867,8 @@ class ASLEngine:
             image_data: Input image
 
         Returns:
-            Tuple of (predicted_class, confidence) or None if failed
+            PredictionResult (unpacks as (predicted_class, confidence)) carrying
+            the full probability vector and lazy top-k, or None if failed
         """
         if self.demo_mode:
             return self._demo_predict()
@@ -701,27 +878,41 @@ class ASLEngine:
             return None
 
         try:
-            # Preprocess image
-            processed_image = self.preprocess_image(image_data)
-            if processed_image is None:
-                return None
-
             # Make prediction
             if self.model_type == 'tflite':
-                prediction = self._predict_tflite(processed_image)
+                # Pixels go straight into the interpreter's input tensor
+                prediction = self._predict_tflite_inplace(image_data)
+                if prediction is None:
+                    return None
+                class_index, confidence = prediction
+                probabilities = self.last_probabilities.copy()  # The engine buffer is reused
+                if self.embeddings_enabled:
+                    self._update_embedding()
             elif self.model_type == 'keras':
+                start = time.perf_counter()
+                processed_image = self.preprocess_image(image_data)
+                if processed_image is None:
+                    return None
+
+                invoke_start = time.perf_counter()
                 prediction = self._predict_keras(processed_image)
+                if prediction is None:
+                    return None
+
+                postprocess_start = time.perf_counter()
+                class_index = int(np.argmax(prediction))
+                confidence = float(prediction[class_index])
+                self.last_probabilities = probabilities = prediction
+                if self.embeddings_enabled:
+                    self._update_embedding()
+
+                self.latency.record('preprocess', invoke_start - start)
+                self.latency.record('invoke', postprocess_start - invoke_start)
+                self.latency.record('postprocess', time.perf_counter() - postprocess_start)
             else:
                 print("❌ Unknown model type")
                 return None
 
-            if prediction is None:
-                return None
-
-            # Get class and confidence
-            class_index = np.argmax(prediction)
-            confidence = float(prediction[class_index])
-
             # Get class name
             if class_index < len(self.class_names):
                 class_name = self.class_names[class_index]
@@ -743,7 +934,9 @@ class ASLEngine:
             if len(self.prediction_history) > 100:
                 self.prediction_history = self.prediction_history[-50:]
 
-            return class_name, confidence
+            embedding = self.last_embedding.copy() if self.embeddings_enabled else None
+            return PredictionResult(class_name, confidence, probabilities, self.class_names, class_index,
+                                    embedding)
 
         except Exception as e:
             print(f"❌ Prediction failed: {e}")
@@ -753,23 +946,138 @@ class ASLEngine:
     def _predict_tflite(self, image: np.ndarray) -> Optional[np.ndarray]:
         """Make prediction using TensorFlow Lite model"""
         try:
-            input_details = self.model.get_input_details()
-            output_details = self.model.get_output_details()
-
             # Set input tensor
-            self.model.set_tensor(input_details[0]['index'], image)
+            self.model.set_tensor(self.input_index, self._quantize_input(image))
 
             # Run inference
             self.model.invoke()
 
             # Get output
-            output_data = self.model.get_tensor(output_details[0]['index'])
-            return output_data[0]  # Remove batch dimension
+            output_data = self.model.get_tensor(self.output_index)
+            return self._dequantize_output(output_data[0])  # Remove batch dimension
+
+        except Exception as e:
+            print(f"❌ TensorFlow Lite prediction failed: {e}")
+            return None
+
+    def _write_tflite_input(self, image_data) -> bool:
+        """
+        Preprocess an image directly into the interpreter's input tensor
+
+        Args:
+            image_data: Input image (numpy array, PIL Image, or file path)
+
+        Returns:
+            bool: True if the input tensor was written
+        """
+        height, width, channels = self.input_shape
+
+        if (OPENCV_AVAILABLE and isinstance(image_data, np.ndarray) and image_data.dtype == np.uint8
+                and image_data.ndim == 3 and image_data.shape[2] == channels):
+            # Resize into the reusable buffer (no-op when already the right size)
+            if image_data.shape[:2] == (height, width):
+                resized = image_data
+            else:
+                resized = cv2.resize(image_data, (width, height), dst=self._resize_buffer)
+
+            # Normalize straight into the interpreter-owned buffer. The view must be
+            # released before invoke(), so it is never stored on self.
+            input_view = self.model.tensor(self.input_index)()
+            pixels = input_view[0]
+            if self._input_mode == 'float':
+                np.copyto(pixels, resized, casting='unsafe')  # uint8 -> float32, unbuffered
+                np.divide(pixels, 255.0, out=pixels)
+            elif self._input_mode == 'identity':
+                np.copyto(pixels, resized)  # Raw uint8 pixels, no normalization
+            elif self._input_mode == 'int8_shift':
+                np.bitwise_xor(resized, 0x80, out=pixels.view(np.uint8))  # pixel - 128 as int8
+            else:
+                cv2.LUT(np.ascontiguousarray(resized), self._input_lut, dst=pixels.view(np.uint8))
+            del pixels, input_view
+            return True
+
+        # Other input types take the general (allocating) path
+        processed_image = self.preprocess_image(image_data)
+        if processed_image is None:
+            return False
+
+        self.model.set_tensor(self.input_index, self._quantize_input(processed_image))
+        return True
+
+    def _predict_tflite_inplace(self, image_data) -> Optional[Tuple[int, float]]:
+        """
+        Allocation-free TFLite prediction
+
+        Args:
+            image_data: Input image
+
+        Returns:
+            Tuple of (class_index, confidence) or None if failed
+        """
+        try:
+            start = time.perf_counter()
+            if not self._write_tflite_input(image_data):
+                return None
+
+            # Run inference
+            invoke_start = time.perf_counter()
+            self.model.invoke()
+            postprocess_start = time.perf_counter()
+
+            # Copy the scores into the reusable probability buffer (no allocation)
+            # and dequantize them there for the smoother
+            output_view = self.model.tensor(self.output_index)()
+            probabilities = self.last_probabilities
+            np.copyto(probabilities, output_view[0], casting='unsafe')
+            del output_view
+
+            if self.quantized_output:
+                scale, zero_point = self.output_quantization
+                probabilities -= zero_point
+                probabilities *= scale
+
+            class_index = int(probabilities.argmax())
+            confidence = float(probabilities[class_index])
+
+            self.latency.record('preprocess', invoke_start - start)
+            self.latency.record('invoke', postprocess_start - invoke_start)
+            self.latency.record('postprocess', time.perf_counter() - postprocess_start)
+
+            return class_index, confidence
 
         except Exception as e:
             print(f"❌ TensorFlow Lite prediction failed: {e}")
             return None
 
+    def enable_embeddings(self, enabled: bool = True):
+        """
+        Attach a per-frame embedding to every PredictionResult
+
+        Args:
+            enabled: Compute embeddings (off by default; the single-frame path skips the work)
+        """
+        self.embeddings_enabled = enabled and self.last_embedding is not None
+
+    def _update_embedding(self):
+        """Fill last_embedding from the frame that was just predicted (no allocation)"""
+        embedding = self.last_embedding
+        if self.embedding_index is not None:
+            embedding_view = self.model.tensor(self.embedding_index)()
+            np.copyto(embedding, embedding_view[0], casting='unsafe')
+            del embedding_view
+            return
+
+        # Logits up to a constant: log-softmax, centred so the constant cancels
+        np.maximum(self.last_probabilities, 1e-7, out=embedding)
+        np.log(embedding, out=embedding)
+        embedding -= embedding.mean()
+
+    def get_embedding(self) -> Optional[np.ndarray]:
+        """Embedding of the last prediction (copy), or None if embeddings are off"""
+        if not self.embeddings_enabled:
+            return None
+        return self.last_embedding.copy()
+
     def _predict_keras(self, image: np.ndarray) -> Optional[np.ndarray]:
         """Make prediction using Keras model"""
         try:
@@ -780,7 +1088,7 @@ class ASLEngine:
             print(f"❌ Keras prediction failed: {e}")
             return None
 
-    def _demo_predict(self) -> Tuple[str, float]:
+    def _demo_predict(self) -> PredictionResult:
         """Generate demo predictions for testing"""
         # Cycle through letters for demo
         demo_letters = ['C', 'N', 'J', 'G', 'O', 'W', 'M', 'F', 'B', 'A', 'E', 'I', 'L', 'R', 'S', 'T']
@@ -790,7 +1098,7 @@ class ASLEngine:
 
         self.demo_index += 1
 
-        return letter, confidence
+        return PredictionResult(letter, confidence, class_index=self.class_names.index(letter))
 
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -807,9 +1115,21 @@ class ASLEngine:
             'classes': self.num_classes,
             'class_names': self.class_names[:10],  # First 10 for brevity
             'demo_mode': self.demo_mode,
+            'num_threads': self.num_threads,
+            'use_xnnpack': self.use_xnnpack,
+            'quantized': self.quantized_input or self.quantized_output,
+            'thread_timings': self.thread_timings,
+            'load_time_ms': self.load_time_ms,
+            'cold_start_ms': self.warmup_stats.get('cold_start_ms'),
+            'warm_latency_ms': self.warmup_stats.get('warm_latency_ms'),
+            'warmup_runs': self.warmup_stats.get('warmup_runs', 0),
+            'model_store': model_store.get_stats(),
+            'embedding_size': self.embedding_size if self.embeddings_enabled else None,
             'last_prediction': self.last_prediction,
             'last_confidence': self.last_confidence,
-            'prediction_count': len(self.prediction_history)
+            'prediction_count': len(self.prediction_history),
+            'fps': self.latency.get_fps(),
+            'latency': self.latency.get_stats()
         }
 
     def get_prediction_history(self, limit: int = 10) -> List[Dict[str, Any]]:
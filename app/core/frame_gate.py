@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Frame Gate - Skips inference on static or empty frames
+Compares a tiny grayscale copy of the ROI against the frame the model last
+saw (motion) and against a background learned from NOTHING predictions
+(presence), so the CNN only runs when something in the ROI changed
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Gate decisions
+GATE_RUN = 'run'        # Run the model
+GATE_STATIC = 'static'  # Nothing moved since the last inference: reuse its result
+GATE_EMPTY = 'empty'    # ROI matches the learned empty background: NOTHING
+
+
+class FrameGate:
+    """Cheap motion/presence check in front of the model"""
+
+    def __init__(self, size: Tuple[int, int] = (32, 32), motion_threshold: float = 3.0,
+                 empty_threshold: float = 4.0, max_reuse: int = 30, background_confidence: float = 0.8):
+        """
+        Initialize the frame gate
+
+        Args:
+            size: (width, height) of the downscaled grayscale ROI
+            motion_threshold: Mean absolute grey-level change that counts as motion
+            empty_threshold: Mean absolute difference from the background below which the ROI is empty
+            max_reuse: Force an inference after this many consecutive skipped frames
+            background_confidence: NOTHING confidence needed to (re)learn the background
+        """
+        self.size = tuple(size)
+        self.motion_threshold = float(motion_threshold)
+        self.empty_threshold = float(empty_threshold)
+        self.max_reuse = int(max_reuse)
+        self.background_confidence = float(background_confidence)
+
+        width, height = self.size
+        self._gray = None
+        self._tiny = np.empty((height, width), dtype=np.uint8)
+        self._reference = np.empty((height, width), dtype=np.uint8)  # Frame at the last inference
+        self._background = np.empty((height, width), dtype=np.uint8)
+        self._diff = np.empty((height, width), dtype=np.uint8)
+        self.has_reference = False
+        self.has_background = False
+
+        self.last_result = None
+        self.skipped_in_a_row = 0
+
+        # Counters
+        self.frames_checked = 0
+        self.frames_run = 0
+        self.static_hits = 0
+        self.empty_hits = 0
+
+    def _mean_abs_diff(self, a: np.ndarray, b: np.ndarray) -> float:
+        cv2.absdiff(a, b, dst=self._diff)
+        return float(cv2.mean(self._diff)[0])
+
+    def check(self, roi: np.ndarray) -> str:
+        """
+        Decide whether the model needs to run on this ROI
+
+        Args:
+            roi: RGB uint8 ROI (any size)
+
+        Returns:
+            GATE_RUN, GATE_STATIC or GATE_EMPTY
+        """
+        self.frames_checked += 1
+
+        # Grey first, then area-average down: the averaging hides sensor noise
+        if self._gray is None or self._gray.shape != roi.shape[:2]:
+            self._gray = np.empty(roi.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(roi, cv2.COLOR_RGB2GRAY, dst=self._gray)
+        cv2.resize(self._gray, self.size, dst=self._tiny, interpolation=cv2.INTER_AREA)
+
+        if self.skipped_in_a_row < self.max_reuse:
+            if self.has_background and self._mean_abs_diff(self._tiny, self._background) < self.empty_threshold:
+                self.skipped_in_a_row += 1
+                self.empty_hits += 1
+                return GATE_EMPTY
+
+            if (self.has_reference and self.last_result is not None
+                    and self._mean_abs_diff(self._tiny, self._reference) < self.motion_threshold):
+                self.skipped_in_a_row += 1
+                self.static_hits += 1
+                return GATE_STATIC
+
+        # The model will see this frame; later frames are compared against it
+        np.copyto(self._reference, self._tiny)
+        self.has_reference = True
+        self.skipped_in_a_row = 0
+        self.frames_run += 1
+        return GATE_RUN
+
+    def record_result(self, result: Any, class_name: Optional[str] = None, confidence: float = 0.0):
+        """
+        Remember the model's result for the frame that was just run
+
+        Args:
+            result: Result to reuse on static frames
+            class_name: Predicted class (a confident NOTHING teaches the background)
+            confidence: Predicted confidence
+        """
+        self.last_result = result
+
+        if class_name == 'NOTHING' and confidence >= self.background_confidence:
+            np.copyto(self._background, self._reference)
+            self.has_background = True
+
+    def reset(self):
+        """Forget the reference frame, background and cached result"""
+        self.has_reference = False
+        self.has_background = False
+        self.last_result = None
+        self.skipped_in_a_row = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get gate statistics
+
+        Returns:
+            Dict with frame counters and the share of frames that skipped the model
+        """
+        skipped = self.static_hits + self.empty_hits
+        return {
+            'frames_checked': self.frames_checked,
+            'frames_run': self.frames_run,
+            'static_hits': self.static_hits,
+            'empty_hits': self.empty_hits,
+            'hit_rate': skipped / self.frames_checked if self.frames_checked else 0.0
+        }
+
+    def reset_stats(self):
+        """Reset counters"""
+        self.frames_checked = 0
+        self.frames_run = 0
+        self.static_hits = 0
+        self.empty_hits = 0
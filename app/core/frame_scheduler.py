@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Frame Scheduler - Adaptive sampling rate for the recognition loop
+Raises the rate while a letter is being disambiguated, backs off when the
+stream is stable or idle, and never samples faster than inference (or the
+CPU budget) can keep up with
+"""
+
+import os
+import time
+from typing import Callable, Dict, Any, Optional
+
+# Recognition states reported by the camera loop
+STATE_ACTIVE = 'active'  # Hand present, letter not yet committed: sample fast
+STATE_STABLE = 'stable'  # Letter held: moderate rate is enough
+STATE_IDLE = 'idle'      # Empty or static scene: sample slowly
+
+
+class AdaptiveFrameScheduler:
+    """Chooses the frame sampling rate from recognition state, latency and CPU use"""
+
+    def __init__(self, min_fps: float = 2.0, max_fps: float = 30.0, stable_fraction: float = 0.5,
+                 max_cpu_utilization: float = 0.8, latency_alpha: float = 0.2, update_interval: float = 0.5,
+                 clock: Callable[[], float] = time.perf_counter,
+                 cpu_clock: Callable[[], float] = time.process_time,
+                 cpu_count: Optional[int] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            min_fps: Lowest sampling rate (idle)
+            max_fps: Highest sampling rate (the camera_fps setting)
+            stable_fraction: Share of max_fps used while a letter is held
+            max_cpu_utilization: Process CPU share (of all cores) above which the rate backs off
+            latency_alpha: EMA weight for new inference latency samples
+            update_interval: Seconds between rate decisions
+            clock: Wall clock (injectable for tests)
+            cpu_clock: Process CPU clock (injectable for tests)
+            cpu_count: Cores available to the process (default: os.cpu_count())
+        """
+        self.min_fps = float(min_fps)
+        self.max_fps = max(float(max_fps), self.min_fps)
+        self.stable_fraction = float(stable_fraction)
+        self.max_cpu_utilization = float(max_cpu_utilization)
+        self.latency_alpha = float(latency_alpha)
+        self.update_interval = float(update_interval)
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.cpu_count = cpu_count or os.cpu_count() or 1
+
+        self.current_fps = self.max_fps
+        self.state = STATE_ACTIVE
+        self.latency_ema = None
+        self.cpu_utilization = 0.0
+        self.cpu_factor = 1.0  # Multiplicative back-off while over the CPU budget
+
+        self._last_update = self.clock()
+        self._last_cpu = self.cpu_clock()
+
+    @property
+    def interval(self) -> float:
+        """Seconds between frame grabs at the current rate"""
+        return 1.0 / self.current_fps
+
+    def record_inference(self, seconds: float):
+        """Add one measured inference latency"""
+        if seconds <= 0:
+            return
+
+        if self.latency_ema is None:
+            self.latency_ema = seconds
+        else:
+            self.latency_ema += self.latency_alpha * (seconds - self.latency_ema)
+
+    def target_fps(self, state: str) -> float:
+        """Rate for a state before CPU back-off, capped by what inference sustains"""
+        if state == STATE_IDLE:
+            fps = self.min_fps
+        elif state == STATE_STABLE:
+            fps = self.max_fps * self.stable_fraction
+        else:
+            fps = self.max_fps
+
+        # Frames arriving faster than inference are dropped by the worker anyway
+        if self.latency_ema:
+            fps = min(fps, 1.0 / self.latency_ema)
+
+        return fps
+
+    def update(self, state: str) -> Optional[float]:
+        """
+        Report the recognition state; maybe pick a new rate
+
+        Args:
+            state: STATE_ACTIVE, STATE_STABLE or STATE_IDLE
+
+        Returns:
+            New interval in seconds if the rate changed, otherwise None
+        """
+        self.state = state
+        now = self.clock()
+        elapsed = now - self._last_update
+        if elapsed < self.update_interval:
+            return None
+
+        # Process CPU share since the last decision (all threads, all cores)
+        cpu_now = self.cpu_clock()
+        self.cpu_utilization = (cpu_now - self._last_cpu) / (elapsed * self.cpu_count)
+        self._last_update, self._last_cpu = now, cpu_now
+
+        if self.cpu_utilization > self.max_cpu_utilization:
+            self.cpu_factor = max(self.cpu_factor * 0.8, self.min_fps / self.max_fps)
+        else:
+            self.cpu_factor = min(self.cpu_factor * 1.1, 1.0)
+
+        fps = min(max(self.target_fps(state) * self.cpu_factor, self.min_fps), self.max_fps)
+
+        # Ignore small changes so the Clock event is not rescheduled constantly
+        # (but always settle exactly on a bound)
+        at_bound = fps in (self.min_fps, self.max_fps)
+        if fps == self.current_fps or (abs(fps - self.current_fps) < 0.1 * self.current_fps and not at_bound):
+            return None
+
+        self.current_fps = fps
+        return self.interval
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler state
+
+        Returns:
+            Dict with the current rate, state, latency estimate and CPU use
+        """
+        return {
+            'fps': self.current_fps,
+            'state': self.state,
+            'latency_ms': self.latency_ema * 1000 if self.latency_ema else None,
+            'cpu_utilization': self.cpu_utilization,
+            'min_fps': self.min_fps,
+            'max_fps': self.max_fps
+        }
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Hand Tracker - Localizes the hand and keeps a tight, stable ROI on it
+Detects every few frames (MediaPipe Hands when installed, otherwise a
+skin-colour detector), follows the hand with template matching in between,
+and smooths the square crop box so the classifier sees a steady hand
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Optional: MediaPipe Hands gives landmark-accurate boxes when available
+try:
+    import mediapipe as mp
+
+    MEDIAPIPE_AVAILABLE = True
+except ImportError:
+    MEDIAPIPE_AVAILABLE = False
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+# Skin range in YCrCb (Chai & Ngan); Y is left open for lighting changes
+SKIN_LOWER = np.array([0, 133, 77], dtype=np.uint8)
+SKIN_UPPER = np.array([255, 173, 127], dtype=np.uint8)
+
+
+class SkinDetector:
+    """Largest skin-coloured blob on a small RGB frame that is not the signer's face"""
+
+    def __init__(self, min_area_fraction: float = 0.02, face_zone: float = 1 / 3):
+        """
+        Initialize the detector
+
+        Args:
+            min_area_fraction: Smallest blob, as a fraction of the frame
+            face_zone: When several blobs are found, the topmost one is taken for
+                the face if it starts within this top fraction of the frame
+        """
+        self.min_area_fraction = min_area_fraction
+        self.face_zone = face_zone
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+        self._previous = None  # Last returned box: the hand keeps priority over other blobs
+
+    def detect(self, image: np.ndarray) -> Optional[Box]:
+        """
+        Find the hand box
+
+        In a front-camera view the face is usually the largest skin blob, so
+        with several blobs the topmost one in the face zone is skipped, and a
+        blob overlapping the previous hand box wins over larger ones.
+
+        Args:
+            image: Upright RGB uint8 image
+
+        Returns:
+            (x1, y1, x2, y2) in image coordinates or None
+        """
+        ycrcb = cv2.cvtColor(image, cv2.COLOR_RGB2YCrCb)
+        mask = cv2.inRange(ycrcb, SKIN_LOWER, SKIN_UPPER)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._kernel)
+
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        min_area = self.min_area_fraction * mask.size
+        blobs = []
+        for contour in contours:
+            area = cv2.contourArea(contour)
+            if area >= min_area:
+                x, y, w, h = cv2.boundingRect(contour)
+                blobs.append((area, (x, y, x + w, y + h)))
+
+        if len(blobs) > 1:
+            face = min(blobs, key=lambda blob: blob[1][1])
+            if face[1][1] < self.face_zone * mask.shape[0]:
+                blobs.remove(face)
+
+        if not blobs:
+            self._previous = None
+            return None
+
+        if self._previous is not None:
+            overlapping = [blob for blob in blobs if self._overlaps(blob[1], self._previous)]
+            blobs = overlapping or blobs
+
+        self._previous = max(blobs, key=lambda blob: blob[0])[1]
+        return self._previous
+
+    @staticmethod
+    def _overlaps(a: Box, b: Box) -> bool:
+        return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class MediaPipeDetector:
+    """Hand box from MediaPipe Hands landmarks"""
+
+    def __init__(self, mediapipe_config: Optional[Dict[str, Any]] = None):
+        config = mediapipe_config or {}
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=1,
+            min_detection_confidence=config.get('min_detection_confidence', 0.5),
+            min_tracking_confidence=config.get('min_tracking_confidence', 0.5)
+        )
+
+    def detect(self, image: np.ndarray) -> Optional[Box]:
+        results = self.hands.process(np.ascontiguousarray(image))
+        if not results.multi_hand_landmarks:
+            return None
+
+        height, width = image.shape[:2]
+        landmarks = results.multi_hand_landmarks[0].landmark
+        xs = [point.x * width for point in landmarks]
+        ys = [point.y * height for point in landmarks]
+        return int(min(xs)), int(min(ys)), int(max(xs)) + 1, int(max(ys)) + 1
+
+    def close(self):
+        self.hands.close()
+
+
+class HandTracker:
+    """Detect occasionally, track cheaply, output a smoothed square crop"""
+
+    def __init__(self, detect_every: int = 10, padding: float = 0.25, min_size_fraction: float = 0.25,
+                 smoothing: float = 0.5, match_threshold: float = 0.5, detector: Optional[Any] = None,
+                 mediapipe_config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the hand tracker
+
+        Args:
+            detect_every: Run the detector at least every N frames (tracking in between)
+            padding: Margin added around the hand on each side, as a fraction of its size
+            min_size_fraction: Smallest crop side, as a fraction of the frame's short side
+            smoothing: EMA weight of the newest box (lower is steadier)
+            match_threshold: Template match score below which the track is considered lost
+            detector: Object with detect(rgb_image) -> box; default MediaPipe or skin colour
+            mediapipe_config: Options for MediaPipe Hands (the Config.mediapipe section)
+        """
+        self.detect_every = max(1, int(detect_every))
+        self.padding = float(padding)
+        self.min_size_fraction = float(min_size_fraction)
+        self.smoothing = float(smoothing)
+        self.match_threshold = float(match_threshold)
+
+        if detector is None:
+            detector = MediaPipeDetector(mediapipe_config) if MEDIAPIPE_AVAILABLE else SkinDetector()
+        self.detector = detector
+
+        self._template = None       # Grey patch around the hand from the last detection/match
+        self._template_box = None   # Where that patch was taken, in thumbnail coordinates
+        self._raw_box = None        # Unsmoothed hand box in thumbnail coordinates
+        self._smoothed = None    # (cx, cy, side) in thumbnail coordinates
+        self._gray = None
+        self.frames_since_detection = 0
+
+        # Counters
+        self.detections = 0
+        self.tracked_frames = 0
+        self.lost_frames = 0
+
+    def reset(self):
+        """Drop the current track"""
+        self._template = None
+        self._template_box = None
+        self._raw_box = None
+        self._smoothed = None
+        self.frames_since_detection = 0
+
+    def update(self, thumbnail: np.ndarray, frame_size: Tuple[int, int]) -> Optional[Box]:
+        """
+        Locate the hand in a new frame
+
+        Args:
+            thumbnail: Small upright RGB copy of the whole frame
+            frame_size: (width, height) of the full frame
+
+        Returns:
+            Square (x1, y1, x2, y2) crop in full-frame coordinates, or None if no hand
+        """
+        thumb_h, thumb_w = thumbnail.shape[:2]
+        if self._gray is None or self._gray.shape != (thumb_h, thumb_w):
+            self._gray = np.empty((thumb_h, thumb_w), dtype=np.uint8)
+        cv2.cvtColor(thumbnail, cv2.COLOR_RGB2GRAY, dst=self._gray)
+
+        box = None
+        if self._template is not None and self.frames_since_detection < self.detect_every:
+            box = self._track()
+            if box is not None:
+                self.tracked_frames += 1
+
+        if box is None:
+            box = self.detector.detect(thumbnail)
+            self.frames_since_detection = 0
+            if box is None:
+                self.lost_frames += 1
+                self.reset()
+                return None
+            self.detections += 1
+
+        self.frames_since_detection += 1
+        self._raw_box = box
+
+        # Keep a margin around the hand in the template: its outline is what matches best
+        x1, y1, x2, y2 = box
+        margin = max(x2 - x1, y2 - y1) // 4
+        self._template_box = (max(0, x1 - margin), max(0, y1 - margin),
+                              min(thumb_w, x2 + margin), min(thumb_h, y2 + margin))
+        tx1, ty1, tx2, ty2 = self._template_box
+        self._template = self._gray[ty1:ty2, tx1:tx2].copy()
+
+        return self._crop_box(box, (thumb_w, thumb_h), frame_size)
+
+    def _track(self) -> Optional[Box]:
+        """Follow the last hand patch within a search window around it"""
+        tx1, ty1, tx2, ty2 = self._template_box
+        w, h = tx2 - tx1, ty2 - ty1
+        thumb_h, thumb_w = self._gray.shape
+
+        # Search a window twice the template's size
+        sx1, sy1 = max(0, tx1 - w // 2), max(0, ty1 - h // 2)
+        sx2, sy2 = min(thumb_w, tx2 + w // 2), min(thumb_h, ty2 + h // 2)
+        search = self._gray[sy1:sy2, sx1:sx2]
+        if search.shape[0] < h or search.shape[1] < w or w < 4 or h < 4:
+            return None
+
+        scores = cv2.matchTemplate(search, self._template, cv2.TM_CCOEFF_NORMED)
+        _, best, _, (mx, my) = cv2.minMaxLoc(scores)
+        if not best >= self.match_threshold:  # Also rejects NaN from flat patches
+            return None
+
+        dx, dy = sx1 + mx - tx1, sy1 + my - ty1
+        x1, y1, x2, y2 = self._raw_box
+        return x1 + dx, y1 + dy, x2 + dx, y2 + dy
+
+    def _crop_box(self, box: Box, thumb_size: Tuple[int, int], frame_size: Tuple[int, int]) -> Box:
+        """Pad, square, smooth and scale a thumbnail box to a full-frame crop"""
+        thumb_w, thumb_h = thumb_size
+        x1, y1, x2, y2 = box
+
+        side = max(x2 - x1, y2 - y1) * (1.0 + 2.0 * self.padding)
+        side = max(side, self.min_size_fraction * min(thumb_w, thumb_h))
+        target = np.array([(x1 + x2) / 2.0, (y1 + y2) / 2.0, side])
+
+        if self._smoothed is None:
+            self._smoothed = target
+        else:
+            self._smoothed += self.smoothing * (target - self._smoothed)
+
+        frame_w, frame_h = frame_size
+        scale = frame_w / thumb_w
+        cx, cy, side = self._smoothed * scale
+        side = int(min(side, frame_w, frame_h))
+
+        # Keep the square inside the frame
+        x1 = int(min(max(cx - side / 2, 0), frame_w - side))
+        y1 = int(min(max(cy - side / 2, 0), frame_h - side))
+        return x1, y1, x1 + side, y1 + side
+
+    def close(self):
+        """Release the detector (MediaPipe keeps its graph until closed)"""
+        close = getattr(self.detector, 'close', None)
+        if close:
+            close()
+        self.reset()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tracker statistics
+
+        Returns:
+            Dict with detection/tracking counters
+        """
+        return {
+            'detector': type(self.detector).__name__,
+            'detections': self.detections,
+            'tracked_frames': self.tracked_frames,
+            'lost_frames': self.lost_frames
+        }
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Inference Worker - Runs ASL predictions off the UI thread
+Uses a one-slot mailbox so only the newest frame is ever processed
+"""
+
+import threading
+import time
+import logging
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceWorker:
+    """Background inference thread with a latest-frame-wins mailbox"""
+
+    def __init__(self, process_fn: Callable[[Any], Any],
+                 on_result: Optional[Callable[[Any], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 name: str = "ASLInferenceWorker"):
+        """
+        Initialize the inference worker
+
+        Args:
+            process_fn: Function run on the worker thread for each frame
+            on_result: Called from the worker thread with each result
+            on_error: Called from the worker thread when process_fn raises
+            name: Thread name (useful when debugging)
+        """
+        self.process_fn = process_fn
+        self.on_result = on_result
+        self.on_error = on_error
+        self.name = name
+
+        # One-slot mailbox: a newer frame simply replaces an unprocessed one
+        self._pending = None
+        self._has_pending = False
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+        # Counters
+        self.frames_submitted = 0
+        self.frames_processed = 0
+        self.frames_dropped = 0
+        self.errors = 0
+        self.total_process_time = 0.0
+        self.last_process_time = 0.0
+
+    def start(self):
+        """Start the worker thread"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        with self._condition:
+            self._running = True
+
+        self._thread = threading.Thread(target=self._worker_loop, name=self.name, daemon=True)
+        self._thread.start()
+        logger.info(f"🧵 {self.name} started")
+
+    def stop(self, timeout: float = 1.0):
+        """
+        Stop the worker thread
+
+        Args:
+            timeout: Seconds to wait for an in-flight frame to finish
+        """
+        with self._condition:
+            self._running = False
+            self._pending = None
+            self._has_pending = False
+            self._condition.notify_all()
+
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+        logger.info(f"🛑 {self.name} stopped "
+                    f"(processed: {self.frames_processed}, dropped: {self.frames_dropped})")
+
+    def is_running(self) -> bool:
+        """Check if the worker thread is running"""
+        return self._running and self._thread is not None and self._thread.is_alive()
+
+    def submit(self, frame: Any) -> bool:
+        """
+        Hand the newest frame to the worker
+
+        Args:
+            frame: Frame data passed to process_fn
+
+        Returns:
+            bool: True if an older, unprocessed frame was overwritten
+        """
+        with self._condition:
+            if not self._running:
+                return False
+
+            dropped = self._has_pending
+            if dropped:
+                self.frames_dropped += 1
+
+            self._pending = frame
+            self._has_pending = True
+            self.frames_submitted += 1
+            self._condition.notify()
+
+        return dropped
+
+    def _worker_loop(self):
+        """Worker thread: wait for a frame, process it, publish the result"""
+        while True:
+            with self._condition:
+                while self._running and not self._has_pending:
+                    self._condition.wait()
+
+                if not self._running:
+                    break
+
+                frame = self._pending
+                self._pending = None
+                self._has_pending = False
+
+            start_time = time.perf_counter()
+            try:
+                result = self.process_fn(frame)
+            except Exception as e:
+                self.errors += 1
+                if self.on_error:
+                    self.on_error(e)
+                else:
+                    logger.error(f"{self.name} processing error: {e}")
+                continue
+            finally:
+                self.last_process_time = time.perf_counter() - start_time
+                self.total_process_time += self.last_process_time
+
+            self.frames_processed += 1
+
+            if self.on_result:
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    logger.error(f"{self.name} result callback error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get worker statistics
+
+        Returns:
+            Dict with frame counters and timing
+        """
+        average = 0.0
+        if self.frames_processed > 0:
+            average = self.total_process_time / self.frames_processed
+
+        return {
+            'running': self.is_running(),
+            'frames_submitted': self.frames_submitted,
+            'frames_processed': self.frames_processed,
+            'frames_dropped': self.frames_dropped,
+            'errors': self.errors,
+            'average_process_time': average,
+            'last_process_time': self.last_process_time
+        }
+
+    def reset_stats(self):
+        """Reset frame counters"""
+        with self._condition:
+            self.frames_submitted = 0
+            self.frames_processed = 0
+            self.frames_dropped = 0
+            self.errors = 0
+            self.total_process_time = 0.0
+            self.last_process_time = 0.0
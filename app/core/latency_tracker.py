@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Latency Tracker - Per-stage timing for the recognition pipeline
+Keeps the most recent samples of each stage in fixed-size ring buffers
+so rolling percentiles are cheap to compute and memory never grows
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterable, Optional
+
+import numpy as np
+
+# Pipeline stages in frame order
+PIPELINE_STAGES = (
+    'texture_read',  # UI thread: copy camera texture pixels
+    'roi',           # Worker: crop/resize/colour-convert the hand region
+    'preprocess',    # Worker: write the ROI into the model input tensor
+    'invoke',        # Worker: model forward pass
+    'postprocess',   # Worker: read scores, argmax, dequantize
+    'smoothing',     # UI thread: stable-letter tracking
+    'ui_update',     # UI thread: update labels and bars
+)
+
+
+class RingBuffer:
+    """Fixed-size float buffer that overwrites its oldest sample"""
+
+    def __init__(self, capacity: int):
+        self.data = np.zeros(capacity, dtype=np.float64)
+        self.capacity = capacity
+        self.index = 0
+        self.count = 0
+
+    def append(self, value: float):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def values(self) -> np.ndarray:
+        """Samples oldest to newest (a copy)"""
+        if self.count < self.capacity:
+            return self.data[:self.count].copy()
+        return np.roll(self.data, -self.index)
+
+    def clear(self):
+        self.index = 0
+        self.count = 0
+
+
+class LatencyTracker:
+    """Thread-safe per-stage latency recorder with rolling percentiles"""
+
+    def __init__(self, stages: Iterable[str] = PIPELINE_STAGES, window: int = 120):
+        """
+        Initialize latency tracker
+
+        Args:
+            stages: Stage names to pre-register (others are added on first use)
+            window: Number of recent samples kept per stage
+        """
+        self.window = window
+        self.lock = threading.Lock()
+        self.stages = {stage: RingBuffer(window) for stage in stages}
+        self.frame_times = RingBuffer(window)
+        self.total_samples = {stage: 0 for stage in self.stages}
+
+    def record(self, stage: str, seconds: float):
+        """Record one duration (in seconds) for a stage"""
+        with self.lock:
+            buffer = self.stages.get(stage)
+            if buffer is None:
+                buffer = self.stages[stage] = RingBuffer(self.window)
+                self.total_samples[stage] = 0
+            buffer.append(seconds * 1000.0)
+            self.total_samples[stage] += 1
+
+    @contextmanager
+    def measure(self, stage: str):
+        """Context manager that records the duration of its block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def mark_frame(self, timestamp: Optional[float] = None):
+        """Record that a frame finished (drives the FPS figure)"""
+        with self.lock:
+            self.frame_times.append(time.perf_counter() if timestamp is None else timestamp)
+
+    def get_fps(self) -> float:
+        """Frames per second over the recent window"""
+        with self.lock:
+            frame_times = self.frame_times.values()
+
+        if len(frame_times) < 2:
+            return 0.0
+
+        elapsed = frame_times[-1] - frame_times[0]
+        if elapsed <= 0:
+            return 0.0
+
+        return float((len(frame_times) - 1) / elapsed)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Rolling statistics for every stage that has samples
+
+        Returns:
+            Dict of stage -> {count, last_ms, mean_ms, p50_ms, p95_ms, p99_ms}
+        """
+        with self.lock:
+            snapshot = {stage: (buffer.values(), self.total_samples[stage])
+                        for stage, buffer in self.stages.items() if buffer.count}
+
+        stats = {}
+        for stage, (values, total) in snapshot.items():
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            stats[stage] = {
+                'count': total,
+                'last_ms': float(values[-1]),
+                'mean_ms': float(values.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99)
+            }
+        return stats
+
+    def format_overlay(self) -> str:
+        """Compact multi-line summary for on-screen display"""
+        lines = [f"FPS: {self.get_fps():.1f}"]
+        stats = self.get_stats()
+        for stage, values in stats.items():
+            lines.append(f"{stage}: {values['p50_ms']:.1f} / {values['p95_ms']:.1f} ms")
+        return "\n".join(lines)
+
+    def reset(self):
+        """Clear all samples"""
+        with self.lock:
+            for stage, buffer in self.stages.items():
+                buffer.clear()
+                self.total_samples[stage] = 0
+            self.frame_times.clear()
+
+
+def measure_warmup(run: Callable[[], Any], runs: int) -> Dict[str, Any]:
+    """
+    Run warm-up inferences and time them
+
+    The first call pays the one-off setup (graph preparation, kernel and
+    delegate initialization, first allocations): that is the cold start.
+    The median of the remaining calls is the warmed steady-state latency.
+
+    Args:
+        run: One inference on synthetic input
+        runs: Number of calls (0 skips the warm-up)
+
+    Returns:
+        Dict with warmup_runs, cold_start_ms and warm_latency_ms (None when not measured)
+    """
+    timings = []
+    for _ in range(max(0, int(runs))):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000.0)
+
+    return {
+        'warmup_runs': len(timings),
+        'cold_start_ms': timings[0] if timings else None,
+        'warm_latency_ms': float(np.median(timings[1:])) if len(timings) > 1 else None
+    }
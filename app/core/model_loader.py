@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Model Loader - Imports and loads the ASL model off the UI thread
+Publishes a readiness event so screens can subscribe instead of polling
+"""
+
+import threading
+import time
+import logging
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelLoader:
+    """Runs a (slow) model load function in a background thread"""
+
+    def __init__(self, load_fn: Callable[[], Any], name: str = "ASLModelLoader"):
+        """
+        Initialize the model loader
+
+        Args:
+            load_fn: Function that imports the backend and returns the loaded engine
+            name: Thread name (useful when debugging)
+        """
+        self.load_fn = load_fn
+        self.name = name
+
+        # Readiness state (set once, from the loader thread, after the subscribers ran)
+        self.ready = threading.Event()
+        self.result = None
+        self.error = None
+        self.load_time = 0.0
+
+        self._callbacks: List[Callable[['ModelLoader'], None]] = []
+        self._finished = False  # Callbacks handed out; later subscribers run immediately
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Start loading in the background"""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._load, name=self.name, daemon=True)
+        self._thread.start()
+        logger.info(f"🧵 {self.name} started")
+
+    def subscribe(self, callback: Callable[['ModelLoader'], None]):
+        """
+        Register a callback for when loading finishes
+
+        The callback runs on the loader thread, or immediately on the calling
+        thread if loading has already finished. It receives this loader;
+        check `error` and `result`. `ready` is set only after every early
+        subscriber returned.
+
+        Args:
+            callback: Function taking the loader
+        """
+        with self._lock:
+            if not self._finished:
+                self._callbacks.append(callback)
+                return
+
+        self._notify(callback)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until loading finishes and the subscribers have been called
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            bool: True if loading finished
+        """
+        return self.ready.wait(timeout)
+
+    def is_ready(self) -> bool:
+        """Check if loading has finished (successfully or not)"""
+        return self.ready.is_set()
+
+    def _load(self):
+        """Loader thread: run load_fn and publish the result"""
+        start_time = time.perf_counter()
+        try:
+            self.result = self.load_fn()
+        except Exception as e:
+            self.error = e
+            logger.error(f"❌ {self.name} failed: {e}")
+        finally:
+            self.load_time = time.perf_counter() - start_time
+
+        with self._lock:
+            self._finished = True
+            callbacks, self._callbacks = self._callbacks, []
+
+        logger.info(f"✅ {self.name} finished in {self.load_time:.2f}s")
+        for callback in callbacks:
+            self._notify(callback)
+
+        # Only now: wait()/is_ready() must not return before the subscribers ran
+        self.ready.set()
+
+    def _notify(self, callback):
+        try:
+            callback(self)
+        except Exception as e:
+            logger.error(f"{self.name} callback error: {e}")
@@ -5,9 +5,10 @@ Loads and manages the trained ASL recognition model
 """
 
 import os
+import time
 import numpy as np
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Callable, Optional, Tuple, List
 import threading
 
 try:
@@ -24,14 +25,144 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+from .tflite_utils import InterpreterPool, model_store, auto_tune_num_threads
+from .latency_tracker import measure_warmup
+from .model_selector import ModelSelector
+
+
+class LoadedModel:
+    """A loaded model and everything needed to run it; replaced as a unit on swaps"""
+    
+    def __init__(self, path: str, model_type: str, input_shape: Tuple[int, ...], model=None,
+                 pool: Optional[InterpreterPool] = None, input_details=None, output_details=None):
+        self.path = path
+        self.model_type = model_type  # 'keras' or 'tflite'
+        self.input_shape = input_shape
+        self.model = model
+        self.pool = pool  # TFLite: one interpreter per concurrent caller, no lock
+        self._interpreter = None  # Created on first use of .interpreter, never in the pool
+        self.input_details = input_details
+        self.output_details = output_details
+        self.lock = threading.Lock()  # Keras models only
+        
+        # Full-integer models (scripts/convert_int8.py) take and return uint8/int8 tensors
+        self.input_dtype = np.dtype(input_details[0]['dtype']) if input_details else np.dtype(np.float32)
+        self.output_dtype = np.dtype(output_details[0]['dtype']) if output_details else np.dtype(np.float32)
+        self.input_quantization = tuple(input_details[0].get('quantization', (0.0, 0))) if input_details else (0.0, 0)
+        self.output_quantization = tuple(output_details[0].get('quantization', (0.0, 0))) if output_details else (0.0, 0)
+    
+    @property
+    def interpreter(self):
+        """Interpreter of its own for callers outside predict() (None for Keras models)
+        
+        It is not part of the pool, so invoking it cannot race a pooled
+        predict(); like any interpreter it is not thread-safe itself.
+        """
+        if self.pool is not None and self._interpreter is None:
+            self._interpreter = self.pool.detached()
+        return self._interpreter
+    
+    @property
+    def quantized(self) -> bool:
+        """Whether the input or output tensor is integer-quantized"""
+        return self.input_dtype in (np.uint8, np.int8) or self.output_dtype in (np.uint8, np.int8)
+    
+    def _quantize_input(self, image: np.ndarray) -> np.ndarray:
+        """Convert a normalized float batch to the input tensor's dtype"""
+        if self.input_dtype not in (np.uint8, np.int8):
+            return image.astype(np.float32)
+        
+        scale, zero_point = self.input_quantization
+        info = np.iinfo(self.input_dtype)
+        return np.clip(np.round(image / scale + zero_point), info.min, info.max).astype(self.input_dtype)
+    
+    def _dequantize_output(self, output: np.ndarray) -> np.ndarray:
+        """Convert a quantized output tensor back to probabilities"""
+        if self.output_dtype not in (np.uint8, np.int8):
+            return output
+        
+        scale, zero_point = self.output_quantization
+        return (output.astype(np.float32) - zero_point) * scale
+    
+    def predict(self, image: np.ndarray) -> Optional[np.ndarray]:
+        """Probability vector (no batch dimension) for a preprocessed (1, H, W, 3) image"""
+        # A frame preprocessed for the previous model may arrive right after a swap
+        if tuple(image.shape[1:3]) != tuple(self.input_shape[:2]):
+            import cv2
+            height, width = self.input_shape[:2]
+            image = cv2.resize(image[0], (width, height))[np.newaxis]
+        
+        if self.model_type == 'tflite':
+            with self.pool.interpreter() as interpreter:
+                # Set input tensor
+                interpreter.set_tensor(self.input_details[0]['index'], self._quantize_input(image))
+                
+                # Run inference
+                interpreter.invoke()
+                
+                # Get output (copied: the tensor buffer is reused by the next invoke)
+                predictions = self._dequantize_output(interpreter.get_tensor(self.output_details[0]['index']))
+        elif self.model_type == 'keras':
+            with self.lock:
+                predictions = self.model.predict(image, verbose=0)
+        else:
+            return None
+        
+        if len(predictions.shape) > 1:
+            predictions = predictions[0]  # Remove batch dimension
+        return predictions
+    
+    def warm_up(self, runs: int = 1) -> dict:
+        """Run every idle interpreter (or the Keras model) on a blank frame to pay first-run costs
+        
+        Returns:
+            Warm-up timings of the first interpreter (see measure_warmup)
+        """
+        blank = np.zeros((1, *self.input_shape), dtype=np.float32)
+        if self.pool is None:
+            return measure_warmup(lambda: self.predict(blank), runs)
+        
+        interpreters = [self.pool.acquire() for _ in range(max(1, self.pool.idle))]
+        try:
+            stats = None
+            for interpreter in interpreters:
+                interpreter.set_tensor(self.input_details[0]['index'], self._quantize_input(blank))
+                interpreter_stats = measure_warmup(interpreter.invoke, runs)
+                stats = stats or interpreter_stats
+        finally:
+            for interpreter in interpreters:
+                self.pool.release(interpreter)
+        return stats
+
+
 class ModelManager:
     """Manages the ASL recognition model"""
     
-    def __init__(self, model_path: Optional[str] = None):
+    def __init__(self, model_path: Optional[str] = None, num_threads: Optional[int] = None,
+                 use_xnnpack: bool = True, auto_tune_threads: bool = False, cascade: bool = False,
+                 accurate_model_path: Optional[str] = None, cascade_threshold: float = 0.8,
+                 cascade_margin: float = 0.2, cascade_log_interval: int = 100, warmup_runs: int = 3,
+                 background_warmup: bool = False, latency_budget_ms: Optional[float] = None,
+                 selection_cache_path: Optional[str] = None, selection_runs: int = 10):
         """Initialize the model manager
         
         Args:
-            model_path: Path to the model file. If None, will search for models.
+            model_path: Path to the model file (the fast model in cascade mode). If None, will search for models.
+            num_threads: TFLite CPU threads (None or 0 lets TFLite decide)
+            use_xnnpack: Use the XNNPACK CPU delegate for TFLite models
+            auto_tune_threads: Benchmark thread counts at load time and keep the fastest
+            cascade: Also load an accurate model and run it only on frames the fast model is unsure about
+            accurate_model_path: Accurate model for cascade mode. If None, searches for a .h5 model.
+            cascade_threshold: Escalate when the fast model's confidence is below this
+            cascade_margin: Escalate when the fast model's top-2 margin is below this
+            cascade_log_interval: Log escalation rate and mean latency every N frames
+            warmup_runs: Inferences on a blank frame after loading, before the model reports ready
+            background_warmup: Warm up on a thread and return at once (see wait_until_ready)
+            latency_budget_ms: Per-frame budget; when set (and no model_path is given), every model
+                found is benchmarked once on this machine and the most accurate one that fits is used
+            selection_cache_path: Where benchmark results are cached (default: model_selection.json
+                next to the models)
+            selection_runs: Timed inferences per candidate when benchmarking
         """
         self.model = None
         self.model_path = model_path
@@ -39,11 +170,50 @@ class ModelManager:
         self.model_type = None  # 'keras' or 'tflite'
         self.input_shape = (224, 224, 3)  # Default input shape
         self.class_names = self._get_asl_classes()
-        self.load_lock = threading.Lock()
+        self.load_lock = threading.Lock()  # Guards the swap bookkeeping only, never inference
+        
+        # Hot swap: predict() runs on whichever LoadedModel _active points to
+        self._active = None
+        self._swap_lock = threading.Lock()
+        self._model_mtime = None
+        self.swap_in_progress = False
+        self.swap_count = 0
+        self.last_swap_error = None
+        
+        # Load-time warm-up: is_model_loaded() stays False until it finished
+        self.warmup_runs = warmup_runs
+        self.warmup_stats = {}
+        self.ready = threading.Event()
+        
+        # Latency-budget model selection (None keeps the fixed .h5-first preference)
+        self.latency_budget_ms = latency_budget_ms
+        self.selection_cache_path = selection_cache_path
+        self.selection_runs = selection_runs
+        self.model_selection = []  # Candidate table of the last selection
+        
+        # TFLite runtime options
+        self.num_threads = num_threads
+        self.use_xnnpack = use_xnnpack
+        self.auto_tune_threads = auto_tune_threads
+        self.thread_timings = {}
+        
+        # Cascade: fast model first, accurate model only for unsure frames
+        self.cascade_requested = cascade
+        self.cascade = False  # True once both models are loaded
+        self.accurate_model = None
+        self.cascade_threshold = cascade_threshold
+        self.cascade_margin = cascade_margin
+        self.cascade_log_interval = cascade_log_interval
+        self._cascade_lock = threading.Lock()  # predict() may run on several threads
+        self.reset_cascade_stats()
         
         # Model loading
         if TENSORFLOW_AVAILABLE:
             self._find_and_load_model()
+            if cascade and self.is_loaded:
+                self._load_accurate_model(accurate_model_path)
+            if self.is_loaded:
+                self._start_warmup(background_warmup)
         else:
             logger.error("TensorFlow not available - cannot load model")
     
@@ -56,86 +226,336 @@ class ModelManager:
             'space', 'del', 'nothing'
         ]
     
+    def _search_model_paths(self) -> List[Path]:
+        """Existing model files in common locations"""
+        possible_paths = [
+            Path("assets/models/best_model.h5"),
+            Path("assets/models/best_model.tflite"),
+            Path("models/best_model.h5"),
+            Path("models/best_model.tflite"),
+            Path("best_model.h5"),
+            Path("best_model.tflite")
+        ]
+        return [p for p in possible_paths if p.exists()]
+    
+    def _find_candidate_models(self) -> List[Path]:
+        """Every .h5/.tflite model in the searched directories"""
+        candidates = []
+        for directory in (Path("assets/models"), Path("models"), Path(".")):
+            if directory.is_dir():
+                candidates += sorted(p for p in directory.iterdir() if p.suffix in ('.h5', '.tflite'))
+        return candidates
+    
     def _find_and_load_model(self):
         """Find and load the best available model"""
         if self.model_path:
             model_paths = [Path(self.model_path)]
+        elif self.latency_budget_ms and not self.cascade_requested:
+            model_paths = self._select_model_by_budget(self._find_candidate_models())
         else:
             # Search for models in common locations
-            possible_paths = [
-                Path("assets/models/best_model.h5"),
-                Path("assets/models/best_model.tflite"),
-                Path("models/best_model.h5"),
-                Path("models/best_model.tflite"),
-                Path("best_model.h5"),
-                Path("best_model.tflite")
-            ]
-            model_paths = [p for p in possible_paths if p.exists()]
+            model_paths = self._search_model_paths()
         
         if not model_paths:
             logger.error("No model files found!")
             return
         
         # Prefer .h5 files for better accuracy, .tflite for speed
+        # (in cascade mode this is the fast stage, so .tflite comes first)
         keras_models = [p for p in model_paths if p.suffix == '.h5']
         tflite_models = [p for p in model_paths if p.suffix == '.tflite']
         
-        if keras_models:
+        if self.cascade_requested and tflite_models:
+            self._load_tflite_model(tflite_models[0])
+        elif keras_models:
             self._load_keras_model(keras_models[0])
         elif tflite_models:
             self._load_tflite_model(tflite_models[0])
     
+    def _select_model_by_budget(self, candidates: List[Path]) -> List[Path]:
+        """Most accurate candidate within latency_budget_ms (see ModelSelector)"""
+        if not candidates:
+            return []
+        
+        cache_path = self.selection_cache_path or candidates[0].parent / "model_selection.json"
+        selector = ModelSelector(self.latency_budget_ms, self._benchmark_model, cache_path,
+                                 config=f"threads={self.num_threads or 0}|xnnpack={self.use_xnnpack}")
+        selected = selector.select(candidates)
+        self.model_selection = selector.last_selection
+        if selector.benchmarks_run:
+            logger.info(f"⏱️ Benchmarked {selector.benchmarks_run} model(s); results cached in {cache_path}")
+        return [selected] if selected else []
+    
+    def _benchmark_model(self, model_path: Path) -> Optional[dict]:
+        """Load a candidate and time it on a blank frame
+        
+        Returns:
+            Dict with latency_ms (warm median) and format, or None if it failed to load or run
+        """
+        if model_path.suffix == '.h5':
+            loaded = self._build_keras_model(model_path)
+        else:
+            loaded = self._build_tflite_model(model_path)
+        if loaded is None:
+            return None
+        
+        try:
+            stats = loaded.warm_up(self.selection_runs + 1)
+            model_format = loaded.model_type
+            if loaded.pool:
+                with loaded.pool.interpreter() as interpreter:
+                    if any(detail['dtype'] in (np.int8, np.uint8) for detail in interpreter.get_tensor_details()):
+                        model_format = 'tflite_quantized'
+        except Exception as e:
+            logger.warning(f"⚠️ Skipping {model_path.name}: benchmark failed ({e})")
+            return None
+        return {'latency_ms': stats['warm_latency_ms'] or stats['cold_start_ms'], 'format': model_format}
+    
+    def _load_accurate_model(self, accurate_model_path: Optional[str] = None):
+        """Load the second (accurate) cascade stage"""
+        if accurate_model_path:
+            path = Path(accurate_model_path)
+        else:
+            keras_models = [p for p in self._search_model_paths() if p.suffix == '.h5']
+            path = keras_models[0] if keras_models else None
+        
+        if path is None or (self.model_path and path.resolve() == Path(self.model_path).resolve()):
+            logger.warning("⚠️ Cascade: no separate accurate model found, using the single model")
+            return
+        
+        accurate = ModelManager(str(path), num_threads=self.num_threads, use_xnnpack=self.use_xnnpack,
+                                warmup_runs=self.warmup_runs)
+        if not accurate.is_loaded:
+            logger.warning(f"⚠️ Cascade: accurate model failed to load ({path}), using the single model")
+            return
+        
+        self.accurate_model = accurate
+        self.cascade = True
+        logger.info(f"🪜 Cascade enabled: {self.model_type} fast model -> {accurate.model_type} accurate model "
+                    f"(escalate below {self.cascade_threshold:.2f} confidence or {self.cascade_margin:.2f} margin)")
+    
     def _load_keras_model(self, model_path: Path):
-        """Load a Keras model"""
+        """Load a Keras model and make it the active model"""
+        loaded = self._build_keras_model(model_path)
+        if loaded is not None:
+            self._activate(loaded)
+        else:
+            self.is_loaded = self._active is not None
+    
+    def _load_tflite_model(self, model_path: Path):
+        """Load a TensorFlow Lite model and make it the active model"""
+        loaded = self._build_tflite_model(model_path)
+        if loaded is not None:
+            self._activate(loaded)
+        else:
+            self.is_loaded = self._active is not None
+    
+    def _build_keras_model(self, model_path: Path) -> Optional['LoadedModel']:
+        """Load a Keras model without touching the active one"""
         try:
             logger.info(f"Loading Keras model from {model_path}")
-            with self.load_lock:
-                self.model = keras.models.load_model(str(model_path))
-                self.model_type = 'keras'
-                self.is_loaded = True
-                
-                # Get input shape from model
-                if hasattr(self.model, 'input_shape'):
-                    shape = self.model.input_shape
-                    if len(shape) >= 4:
-                        self.input_shape = shape[1:4]  # Remove batch dimension
-                
-                logger.info(f"✅ Keras model loaded successfully!")
-                logger.info(f"   Input shape: {self.input_shape}")
-                logger.info(f"   Classes: {len(self.class_names)}")
-                
+            model = keras.models.load_model(str(model_path))
+            
+            # Get input shape from model
+            input_shape = self.input_shape
+            if hasattr(model, 'input_shape'):
+                shape = model.input_shape
+                if len(shape) >= 4:
+                    input_shape = tuple(shape[1:4])  # Remove batch dimension
+            
+            logger.info(f"✅ Keras model loaded successfully!")
+            logger.info(f"   Input shape: {input_shape}")
+            logger.info(f"   Classes: {len(self.class_names)}")
+            return LoadedModel(str(model_path), 'keras', input_shape, model=model)
+        
         except Exception as e:
             logger.error(f"Error loading Keras model: {e}")
-            self.is_loaded = False
+            return None
     
-    def _load_tflite_model(self, model_path: Path):
-        """Load a TensorFlow Lite model"""
+    def _build_tflite_model(self, model_path: Path) -> Optional['LoadedModel']:
+        """Load a TensorFlow Lite model without touching the active one"""
         try:
             logger.info(f"Loading TFLite model from {model_path}")
-            with self.load_lock:
-                self.interpreter = tf.lite.Interpreter(model_path=str(model_path))
-                self.interpreter.allocate_tensors()
-                
-                # Get input and output details
-                self.input_details = self.interpreter.get_input_details()
-                self.output_details = self.interpreter.get_output_details()
-                
-                # Get input shape
-                input_shape = self.input_details[0]['shape']
-                if len(input_shape) >= 4:
-                    self.input_shape = tuple(input_shape[1:4])  # Remove batch dimension
-                
-                self.model_type = 'tflite'
-                self.is_loaded = True
-                
-                logger.info(f"✅ TFLite model loaded successfully!")
-                logger.info(f"   Input shape: {self.input_shape}")
-                logger.info(f"   Classes: {len(self.class_names)}")
-                
+            if self.auto_tune_threads:
+                self.num_threads, self.thread_timings = auto_tune_num_threads(
+                    str(model_path), use_xnnpack=self.use_xnnpack)
+            
+            # Every interpreter is built over the process-wide mapping of the model file
+            pool = InterpreterPool(str(model_path), num_threads=self.num_threads, use_xnnpack=self.use_xnnpack)
+            
+            # Get input and output details
+            with pool.interpreter() as interpreter:
+                input_details = interpreter.get_input_details()
+                output_details = interpreter.get_output_details()
+            
+            # Get input shape
+            input_shape = self.input_shape
+            if len(input_details[0]['shape']) >= 4:
+                input_shape = tuple(int(d) for d in input_details[0]['shape'][1:4])  # Remove batch dimension
+            
+            logger.info(f"✅ TFLite model loaded successfully!")
+            logger.info(f"   Input shape: {input_shape}")
+            logger.info(f"   Classes: {len(self.class_names)}")
+            return LoadedModel(str(model_path), 'tflite', input_shape, pool=pool,
+                               input_details=input_details, output_details=output_details)
+        
         except Exception as e:
             logger.error(f"Error loading TFLite model: {e}")
-            self.is_loaded = False
+            return None
+    
+    @property
+    def interpreter(self):
+        """The active model's interpreter for direct use (see LoadedModel.interpreter)"""
+        return self._active.interpreter if self._active else None
+    
+    def _activate(self, loaded: 'LoadedModel'):
+        """Make a fully loaded model the active one (a single reference swap)"""
+        with self.load_lock:
+            self._active = loaded
+            
+            # Mirrors for callers that read the model attributes directly
+            self.model = loaded.model
+            self.input_details = loaded.input_details
+            self.output_details = loaded.output_details
+            self.model_path = loaded.path
+            self.model_type = loaded.model_type
+            self.input_shape = loaded.input_shape
+            self.is_loaded = True
+            self._model_mtime = self._get_mtime(loaded.path)
+    
+    def swap_model(self, model_path: str, warmup_runs: int = 1) -> bool:
+        """Load, warm up and switch to a new model; predictions keep running meanwhile
+        
+        The new model is built and warmed up without any lock predict() takes,
+        then published with one reference swap. Predictions already running
+        finish on the old model, which is freed once they are done.
+        
+        Args:
+            model_path: .h5 or .tflite model to switch to
+            warmup_runs: Inferences on a blank frame before the swap (first-run allocations)
+        
+        Returns:
+            True if the new model is active, False if it failed to load (the old one stays)
+        """
+        if not self._swap_lock.acquire(blocking=False):
+            logger.warning(f"⚠️ Model swap already in progress, ignoring {model_path}")
+            return False
+        
+        try:
+            self.swap_in_progress = True
+            start = time.perf_counter()
+            mtime = self._get_mtime(model_path)  # Before loading: a rewrite during the load is seen next time
+            path = Path(model_path)
+            loaded = self._build_keras_model(path) if path.suffix == '.h5' else self._build_tflite_model(path)
+            if loaded is None:
+                self.last_swap_error = f"failed to load {model_path}"
+                return False
+            
+            # One warm interpreter per caller the old model was serving
+            previous = self._active
+            if loaded.pool and previous and previous.pool:
+                loaded.pool.prefill(previous.pool.created)
+            
+            warmup_stats = loaded.warm_up(warmup_runs)
+            
+            self._activate(loaded)
+            self._model_mtime = mtime
+            self.warmup_stats = warmup_stats
+            self.swap_count += 1
+            self.last_swap_error = None
+            logger.info(f"🔄 Model swapped: {previous.path if previous else None} -> {loaded.path} "
+                        f"({(time.perf_counter() - start) * 1000:.0f}ms to load and warm up)")
+            return True
+        
+        except Exception as e:
+            self.last_swap_error = str(e)
+            logger.error(f"Error swapping model: {e}")
+            return False
+        finally:
+            self.swap_in_progress = False
+            self._swap_lock.release()
+    
+    def hot_swap(self, model_path: str, warmup_runs: int = 1,
+                 callback: Optional[Callable[[bool], None]] = None) -> threading.Thread:
+        """Run swap_model() on a background thread
+        
+        Args:
+            model_path: .h5 or .tflite model to switch to
+            warmup_runs: Inferences on a blank frame before the swap
+            callback: Called with swap_model()'s result on the loader thread
+        
+        Returns:
+            The loader thread (join() it to wait for the swap)
+        """
+        def load():
+            swapped = self.swap_model(model_path, warmup_runs)
+            if callback:
+                callback(swapped)
+        
+        thread = threading.Thread(target=load, name="ModelHotSwap", daemon=True)
+        thread.start()
+        return thread
+    
+    def _start_warmup(self, background: bool):
+        """Warm up the freshly loaded model(s), then mark the manager ready"""
+        def warm_up():
+            try:
+                self.warmup_stats = self._active.warm_up(self.warmup_runs)
+                stats = self.warmup_stats
+                if stats.get('warmup_runs'):
+                    logger.info(f"🔥 Warm-up: cold start {stats['cold_start_ms']:.1f}ms, "
+                                f"warm {stats['warm_latency_ms'] or 0.0:.1f}ms ({stats['warmup_runs']} runs)")
+            except Exception as e:
+                logger.warning(f"⚠️ Model warm-up failed: {e}")
+            finally:
+                self.ready.set()
+        
+        if background:
+            threading.Thread(target=warm_up, name="ModelWarmup", daemon=True).start()
+        else:
+            warm_up()
     
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the model is loaded and warmed up
+        
+        Args:
+            timeout: Seconds to wait (None waits forever)
+            
+        Returns:
+            True if the model is ready
+        """
+        return self.is_loaded and self.ready.wait(timeout)
+    
+    def reload_if_changed(self) -> Optional[threading.Thread]:
+        """Hot-swap the active model file if it was rewritten since it was loaded
+        
+        Call this periodically in long-running sessions to pick up updated models.
+        Replace model files atomically (write elsewhere, then os.replace): they
+        are memory-mapped, so rewriting one in place corrupts running interpreters.
+        
+        The recorded mtime only changes once a swap succeeded, so a file that
+        failed to load is tried again on the next call.
+        
+        Returns:
+            The loader thread, or None if the file is unchanged
+        """
+        loaded = self._active
+        if loaded is None or self.swap_in_progress:
+            return None
+        
+        mtime = self._get_mtime(loaded.path)
+        if mtime is None or mtime == self._model_mtime:
+            return None
+        
+        return self.hot_swap(loaded.path)
+    
+    @staticmethod
+    def _get_mtime(path: str) -> Optional[float]:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
     def predict(self, image: np.ndarray) -> Tuple[Optional[int], float]:
         """Make a prediction on an image
         
@@ -149,39 +569,105 @@ class ModelManager:
             return None, 0.0
         
         try:
-            with self.load_lock:
-                if self.model_type == 'keras':
-                    predictions = self.model.predict(image, verbose=0)
-                elif self.model_type == 'tflite':
-                    # Set input tensor
-                    self.interpreter.set_tensor(self.input_details[0]['index'], image.astype(np.float32))
-                    
-                    # Run inference
-                    self.interpreter.invoke()
-                    
-                    # Get output
-                    predictions = self.interpreter.get_tensor(self.output_details[0]['index'])
-                else:
-                    return None, 0.0
-                
-                # Get the predicted class and confidence
-                if len(predictions.shape) > 1:
-                    predictions = predictions[0]  # Remove batch dimension
-                
-                class_idx = np.argmax(predictions)
-                confidence = float(predictions[class_idx])
+            start = time.perf_counter()
+            predictions = self._predict_probabilities(image)
+            if predictions is None:
+                return None, 0.0
+            
+            if self.cascade:
+                predictions = self._escalate_if_unsure(image, predictions, start)
+            
+            # Get the predicted class and confidence
+            class_idx = np.argmax(predictions)
+            confidence = float(predictions[class_idx])
+            
+            # Ensure class index is within bounds
+            if 0 <= class_idx < len(self.class_names):
+                return int(class_idx), confidence
+            else:
+                logger.warning(f"Predicted class index {class_idx} out of bounds")
+                return None, 0.0
                 
-                # Ensure class index is within bounds
-                if 0 <= class_idx < len(self.class_names):
-                    return int(class_idx), confidence
-                else:
-                    logger.warning(f"Predicted class index {class_idx} out of bounds")
-                    return None, 0.0
-                    
         except Exception as e:
             logger.error(f"Error during prediction: {e}")
             return None, 0.0
     
+    def _predict_probabilities(self, image: np.ndarray) -> Optional[np.ndarray]:
+        """Run this manager's model and return the probability vector (no batch dimension)"""
+        loaded = self._active  # One read: a concurrent swap cannot change the model mid-call
+        if loaded is None:
+            return None
+        return loaded.predict(image)
+
+    def _escalate_if_unsure(self, image: np.ndarray, predictions: np.ndarray, start: float) -> np.ndarray:
+        """Cascade: rerun on the accurate model when the fast model is unsure
+        
+        Args:
+            image: Preprocessed image the fast model saw
+            predictions: Fast model probabilities
+            start: perf_counter() when the fast model started
+            
+        Returns:
+            Probabilities to use (the accurate model's when escalated)
+        """
+        fast_time = time.perf_counter() - start
+        
+        second, first = np.partition(predictions, len(predictions) - 2)[-2:]
+        escalate = first < self.cascade_threshold or (first - second) < self.cascade_margin
+        
+        if escalate:
+            # Resized to the accurate model's input by LoadedModel.predict if needed
+            accurate_predictions = self.accurate_model._predict_probabilities(image)
+            if accurate_predictions is not None:
+                predictions = accurate_predictions
+        
+        self._record_cascade_frame(escalate, fast_time, time.perf_counter() - start)
+        return predictions
+    
+    def _record_cascade_frame(self, escalated: bool, fast_time: float, total_time: float):
+        """Update cascade counters and log them every cascade_log_interval frames"""
+        with self._cascade_lock:
+            stats = self.cascade_stats
+            stats['frames'] += 1
+            stats['fast_time'] += fast_time
+            stats['total_time'] += total_time
+            if escalated:
+                stats['escalated'] += 1
+                stats['accurate_time'] += total_time - fast_time
+            frames = stats['frames']
+        
+        if self.cascade_log_interval and frames % self.cascade_log_interval == 0:
+            summary = self.get_cascade_stats()
+            logger.info(f"🪜 Cascade: {summary['escalation_rate']:.0%} of {summary['frames']} frames escalated, "
+                        f"mean latency {summary['mean_latency_ms']:.1f}ms "
+                        f"(fast {summary['fast_latency_ms']:.1f}ms, accurate {summary['accurate_latency_ms']:.1f}ms)")
+    
+    def get_cascade_stats(self) -> dict:
+        """Get cascade statistics
+        
+        Returns:
+            Dict with frame counts, escalation rate and mean latencies in ms
+        """
+        with self._cascade_lock:
+            stats = dict(self.cascade_stats)
+        frames = stats['frames']
+        escalated = stats['escalated']
+        return {
+            'enabled': self.cascade,
+            'frames': frames,
+            'escalated': escalated,
+            'escalation_rate': escalated / frames if frames else 0.0,
+            'mean_latency_ms': stats['total_time'] / frames * 1000 if frames else 0.0,
+            'fast_latency_ms': stats['fast_time'] / frames * 1000 if frames else 0.0,
+            'accurate_latency_ms': stats['accurate_time'] / escalated * 1000 if escalated else 0.0
+        }
+    
+    def reset_cascade_stats(self):
+        """Reset cascade counters"""
+        with self._cascade_lock:
+            self.cascade_stats = {'frames': 0, 'escalated': 0, 'fast_time': 0.0, 'accurate_time': 0.0,
+                                  'total_time': 0.0}
+    
     def get_class_name(self, class_idx: int) -> str:
         """Get class name from index"""
         if 0 <= class_idx < len(self.class_names):
@@ -204,8 +690,8 @@ class ModelManager:
         return None, 0.0
     
     def is_model_loaded(self) -> bool:
-        """Check if model is loaded"""
-        return self.is_loaded
+        """Check if model is loaded (and warmed up)"""
+        return self.is_loaded and self.ready.is_set()
     
     def get_model_info(self) -> dict:
         """Get model information"""
@@ -215,6 +701,22 @@ class ModelManager:
             'input_shape': self.input_shape,
             'num_classes': len(self.class_names),
             'classes': self.class_names,
+            'num_threads': self.num_threads,
+            'use_xnnpack': self.use_xnnpack,
+            'thread_timings': self.thread_timings,
+            'cascade': self.get_cascade_stats() if self.cascade else None,
+            'path': self.model_path,
+            'ready': self.ready.is_set(),
+            'cold_start_ms': self.warmup_stats.get('cold_start_ms'),
+            'warm_latency_ms': self.warmup_stats.get('warm_latency_ms'),
+            'warmup_runs': self.warmup_stats.get('warmup_runs', 0),
+            'model_store': model_store.get_stats(),
+            'latency_budget_ms': self.latency_budget_ms,
+            'model_selection': self.model_selection,
+            'interpreters': self._active.pool.created if self._active and self._active.pool else 0,
+            'swap_count': self.swap_count,
+            'swap_in_progress': self.swap_in_progress,
+            'last_swap_error': self.last_swap_error,
             'tensorflow_available': TENSORFLOW_AVAILABLE
         }
     
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Model Selector - Picks the most accurate model that fits a per-frame latency budget
+Every candidate is micro-benchmarked once per machine; the measurements are
+cached by model hash and CPU signature, so later startups only hash files
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Accuracy prior by format when a model has no measured accuracy
+FORMAT_RANK = {'keras': 2, 'tflite': 1, 'tflite_quantized': 0}
+
+
+def get_cpu_signature() -> str:
+    """
+    Identify the CPU the measurements were taken on
+
+    Returns:
+        String like "x86_64|Intel(R) Xeon(R) ...|8"
+    """
+    model_name = platform.processor()
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.lower().startswith(('model name', 'hardware', 'cpu model')):
+                    model_name = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    return f"{platform.machine()}|{model_name}|{os.cpu_count()}"
+
+
+def hash_model_file(path: Path) -> str:
+    """SHA-256 of a model file (read in 1MB chunks)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_model_accuracy(path: Path) -> Optional[float]:
+    """
+    Validation accuracy from an optional sidecar file
+
+    Args:
+        path: Model file; its sidecar is <path>.json, e.g. {"accuracy": 0.97}
+
+    Returns:
+        Accuracy or None
+    """
+    sidecar = Path(str(path) + '.json')
+    try:
+        with open(sidecar, 'r', encoding='utf-8') as f:
+            return float(json.load(f)['accuracy'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+class ModelSelector:
+    """Choose among candidate models by measured latency and expected accuracy"""
+
+    def __init__(self, latency_budget_ms: float, benchmark: Callable[[Path], Optional[Dict[str, Any]]],
+                 cache_path: Optional[Path] = None, config: str = ""):
+        """
+        Initialize the selector
+
+        Args:
+            latency_budget_ms: Per-frame inference budget
+            benchmark: Loads and times a model: path -> {'latency_ms', 'format'} or None
+            cache_path: JSON file for measurements (None disables caching)
+            config: Runtime options that change latency (threads, delegate), part of the cache key
+        """
+        self.latency_budget_ms = float(latency_budget_ms)
+        self.benchmark = benchmark
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cpu_signature = get_cpu_signature()
+        self.config = config
+
+        self.cache = self._load_cache()
+        self.benchmarks_run = 0
+        self.last_selection = []  # Candidate table of the last select()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        empty = {'version': CACHE_VERSION, 'hashes': {}, 'measurements': {}}
+        if not self.cache_path or not self.cache_path.exists():
+            return empty
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if cache.get('version') == CACHE_VERSION else empty
+        except (OSError, ValueError):
+            return empty
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self.cache, f, indent=2)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save model selection cache: {e}")
+
+    def get_model_hash(self, path: Path) -> str:
+        """File hash, re-read only when the file's size or mtime changed"""
+        stat = path.stat()
+        key = str(path.resolve())
+        entry = self.cache['hashes'].get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+
+        sha256 = hash_model_file(path)
+        self.cache['hashes'][key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+        return sha256
+
+    def measure(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Latency and format of a model on this machine (cached)
+
+        Args:
+            path: Model file
+
+        Returns:
+            Dict with latency_ms and format, or None if the model failed to load
+        """
+        key = f"{self.get_model_hash(path)}|{self.cpu_signature}|{self.config}"
+        measurement = self.cache['measurements'].get(key)
+        if measurement is not None:
+            return measurement
+
+        self.benchmarks_run += 1
+        try:
+            measurement = self.benchmark(path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not benchmark {path.name}: {e}")
+            return None
+        if measurement is None:
+            return None
+
+        measurement = dict(measurement, measured_at=time.strftime('%Y-%m-%dT%H:%M:%S'))
+        self.cache['measurements'][key] = measurement
+        return measurement
+
+    def select(self, candidates: List[Path]) -> Optional[Path]:
+        """
+        Most accurate candidate within the latency budget (the fastest if none fits)
+
+        Accuracy comes from a <model>.json sidecar when present, then from
+        the format (Keras > float TFLite > quantized TFLite).
+
+        Args:
+            candidates: Model files
+
+        Returns:
+            Chosen model path, or None if no candidate could be measured
+        """
+        table = []
+        for path in candidates:
+            measurement = self.measure(Path(path))
+            if measurement is None:
+                continue
+            table.append({
+                'path': str(path),
+                'format': measurement['format'],
+                'latency_ms': measurement['latency_ms'],
+                'accuracy': read_model_accuracy(Path(path)),
+                'fits_budget': measurement['latency_ms'] <= self.latency_budget_ms
+            })
+        self._save_cache()
+
+        self.last_selection = table
+        if not table:
+            return None
+
+        fitting = [row for row in table if row['fits_budget']]
+        if fitting:
+            best = max(fitting, key=lambda row: (row['accuracy'] or 0.0, FORMAT_RANK.get(row['format'], 0),
+                                                 -row['latency_ms']))
+        else:
+            best = min(table, key=lambda row: row['latency_ms'])
+            logger.warning(f"⚠️ No model fits the {self.latency_budget_ms:.1f}ms budget, using the fastest")
+
+        summary = ", ".join(f"{Path(row['path']).name} {row['latency_ms']:.1f}ms" for row in table)
+        logger.info(f"🎯 Model selection (budget {self.latency_budget_ms:.1f}ms): {summary} -> "
+                    f"{Path(best['path']).name}")
+        return Path(best['path'])
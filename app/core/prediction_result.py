@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Prediction Result - One inference, every view of it
+Carries the full probability vector alongside the (label, confidence) pair
+so top-k and per-class scores never need another forward pass
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class PredictionResult(tuple):
+    """
+    (class_name, confidence) tuple that also carries the probabilities
+
+    Unpacks like the plain tuples the engines used to return, so existing
+    `letter, confidence = engine.predict(image)` callers keep working.
+    """
+
+    def __new__(cls, class_name: Optional[str], confidence: float,
+                probabilities: Optional[np.ndarray] = None,
+                class_names: Optional[Sequence[str]] = None,
+                class_index: Optional[int] = None,
+                embedding: Optional[np.ndarray] = None):
+        """
+        Create a prediction result
+
+        Args:
+            class_name: Predicted class label
+            confidence: Probability of the predicted class
+            probabilities: Full probability vector (owned by the result, not a shared buffer)
+            class_names: Labels for the probability vector
+            class_index: Index of the predicted class
+            embedding: Per-frame feature vector for temporal models (owned by the result)
+        """
+        result = super().__new__(cls, (class_name, confidence))
+        result.probabilities = probabilities
+        result.class_names = class_names
+        result.class_index = class_index
+        result.embedding = embedding
+        result._top_k = None  # Largest top-k computed so far
+        return result
+
+    @property
+    def class_name(self) -> Optional[str]:
+        return self[0]
+
+    @property
+    def confidence(self) -> float:
+        return self[1]
+
+    def top_k(self, k: int = 3) -> List[Tuple[str, float]]:
+        """
+        Best k classes, most confident first (computed on first use)
+
+        Args:
+            k: Number of classes to return
+
+        Returns:
+            List of (class_name, confidence) tuples
+        """
+        if self.probabilities is None or self.class_names is None:
+            return [(self[0], self[1])] if self[0] is not None else []
+
+        if self._top_k is None or len(self._top_k) < k:
+            probabilities = self.probabilities
+            num_classes = min(len(probabilities), len(self.class_names))
+            k_needed = min(k, num_classes)
+
+            # argpartition finds the k best in O(num_classes), then sort only those k
+            indices = np.argpartition(probabilities[:num_classes], num_classes - k_needed)[-k_needed:]
+            indices = indices[np.argsort(-probabilities[indices])]
+            self._top_k = [(self.class_names[i], float(probabilities[i])) for i in indices.tolist()]
+
+        return self._top_k[:k]
+
+    def as_dict(self) -> Dict[str, float]:
+        """Probabilities keyed by class name"""
+        if self.probabilities is None or self.class_names is None:
+            return {self[0]: self[1]} if self[0] is not None else {}
+
+        return {name: float(p) for name, p in zip(self.class_names, self.probabilities.tolist())}
+
+    def __reduce__(self):
+        return (PredictionResult, (self[0], self[1], self.probabilities, self.class_names, self.class_index,
+                                   self.embedding))
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Prediction Smoother - Temporal smoothing in probability space
+Keeps recent softmax vectors in a preallocated ring buffer and commits a
+letter with hysteresis, instead of voting over argmax labels.
+SequentialLetterTest commits as soon as the accumulated evidence for the
+top letter over the runner-up crosses a bound (a sequential probability
+ratio test), and re-arms on a NOTHING gap instead of a cooldown.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+
+SMOOTHING_MODES = ('ema', 'window')
+
+
+class ProbabilitySmoother:
+    """Smooths per-frame class probabilities and decides when a letter is stable"""
+
+    def __init__(self, num_classes: int, mode: str = 'ema', window: int = 5, alpha: float = 0.5,
+                 enter_threshold: float = 0.6, exit_threshold: float = 0.3, min_frames: int = 2):
+        """
+        Initialize the smoother
+
+        Args:
+            num_classes: Length of the probability vectors
+            mode: 'ema' (exponential moving average) or 'window' (mean of the last `window` frames)
+            window: Ring buffer length (frames)
+            alpha: EMA weight of the newest frame
+            enter_threshold: Smoothed probability needed to commit a letter
+            exit_threshold: Smoothed probability below which the held letter is released
+            min_frames: Frames needed after a reset before anything can be committed
+        """
+        if mode not in SMOOTHING_MODES:
+            raise ValueError(f"Unknown smoothing mode: {mode}")
+        if exit_threshold > enter_threshold:
+            raise ValueError("exit_threshold must not exceed enter_threshold")
+
+        self.num_classes = num_classes
+        self.mode = mode
+        self.window = max(1, int(window))
+        self.alpha = float(alpha)
+        self.enter_threshold = float(enter_threshold)
+        self.exit_threshold = float(exit_threshold)
+        self.min_frames = max(1, int(min_frames))
+
+        # Preallocated state; update() writes into these in place
+        self.history = np.zeros((self.window, num_classes), dtype=np.float32)
+        self.smoothed = np.zeros(num_classes, dtype=np.float32)
+        self._window_sum = np.zeros(num_classes, dtype=np.float64)
+        self._index = 0
+        self.frame_count = 0
+
+        # Hysteresis state: the letter currently held (None when released)
+        self.active_index = None
+
+    def reset(self):
+        """Forget all history and release the held letter"""
+        self.history.fill(0)
+        self.smoothed.fill(0)
+        self._window_sum.fill(0)
+        self._index = 0
+        self.frame_count = 0
+        self.active_index = None
+
+    def update(self, probabilities: np.ndarray) -> Optional[int]:
+        """
+        Add one frame's probabilities
+
+        Args:
+            probabilities: Softmax vector of length num_classes
+
+        Returns:
+            Class index when a letter is newly committed, otherwise None
+        """
+        slot = self.history[self._index]
+
+        if self.mode == 'window':
+            # Running sum: add the new frame, drop the one it overwrites
+            self._window_sum -= slot
+            np.copyto(slot, probabilities, casting='unsafe')
+            self._window_sum += slot
+            filled = min(self.frame_count + 1, self.window)
+            np.divide(self._window_sum, filled, out=self.smoothed, casting='unsafe')
+        else:
+            np.copyto(slot, probabilities, casting='unsafe')
+            # smoothed = (1 - alpha) * smoothed + alpha * p, without temporaries
+            self.smoothed -= slot
+            self.smoothed *= 1.0 - self.alpha
+            self.smoothed += slot
+
+        self._index = (self._index + 1) % self.window
+        self.frame_count += 1
+
+        # Release the held letter once its support drops below the exit threshold
+        if self.active_index is not None and self.smoothed[self.active_index] < self.exit_threshold:
+            self.active_index = None
+
+        if self.frame_count < self.min_frames:
+            return None
+
+        top_index = int(self.smoothed.argmax())
+        if top_index != self.active_index and self.smoothed[top_index] >= self.enter_threshold:
+            self.active_index = top_index
+            return top_index
+
+        return None
+
+    def get_confidence(self, index: Optional[int] = None) -> float:
+        """Smoothed probability of a class (the top class by default)"""
+        if index is None:
+            index = int(self.smoothed.argmax())
+        return float(self.smoothed[index])
+
+
+class SequentialLetterTest:
+    """Commits a letter once its log-likelihood ratio over the runner-up crosses a bound"""
+
+    def __init__(self, num_classes: int, nothing_index: Optional[int] = None, error_rate: float = 0.02,
+                 decay: float = 0.8, min_frames: int = 2, floor: float = 1e-3, alpha: float = 0.5):
+        """
+        Initialize the test
+
+        Args:
+            num_classes: Length of the probability vectors
+            nothing_index: Class that means "no sign"; crossing the bound on it re-arms the held letter
+            error_rate: Target error rate; the bound is log((1 - error_rate) / error_rate)
+            decay: Per-frame forgetting factor for accumulated evidence (1.0 = classic SPRT)
+            min_frames: Frames of evidence needed after a decision before the next one
+            floor: Probability floor, so no single frame contributes more than log(1 / floor)
+            alpha: EMA weight for `smoothed` (display and word decoding only)
+        """
+        if not 0 < error_rate < 0.5:
+            raise ValueError("error_rate must be between 0 and 0.5")
+
+        self.num_classes = num_classes
+        self.nothing_index = nothing_index
+        self.bound = math.log((1.0 - error_rate) / error_rate)
+        self.decay = float(decay)
+        self.min_frames = max(1, int(min_frames))
+        self.floor = float(floor)
+        self.alpha = float(alpha)
+
+        # Preallocated state; update() writes into these in place
+        self.evidence = np.zeros(num_classes, dtype=np.float64)  # Decayed sum of log-probabilities
+        self.smoothed = np.zeros(num_classes, dtype=np.float32)
+        self._log_probabilities = np.empty(num_classes, dtype=np.float64)
+        self.frame_count = 0
+        self.llr = 0.0  # Top vs runner-up log-likelihood ratio after the last frame
+
+        # Letter committed and not yet re-armed by a NOTHING gap (None when re-armed)
+        self.active_index = None
+
+    def reset(self):
+        """Forget all evidence and re-arm"""
+        self.evidence.fill(0)
+        self.smoothed.fill(0)
+        self.frame_count = 0
+        self.llr = 0.0
+        self.active_index = None
+
+    def update(self, probabilities: np.ndarray) -> Optional[int]:
+        """
+        Add one frame's probabilities
+
+        Args:
+            probabilities: Softmax vector of length num_classes
+
+        Returns:
+            Class index when a letter is newly committed, otherwise None
+        """
+        log_probabilities = self._log_probabilities
+        np.maximum(probabilities, self.floor, out=log_probabilities)
+        np.log(log_probabilities, out=log_probabilities)
+        self.evidence *= self.decay
+        self.evidence += log_probabilities
+
+        self.smoothed -= probabilities
+        self.smoothed *= 1.0 - self.alpha
+        self.smoothed += probabilities
+
+        self.frame_count += 1
+        if self.frame_count < self.min_frames:
+            return None
+
+        top_index = int(self.evidence.argmax())
+        runner_up = np.partition(self.evidence, self.num_classes - 2)[self.num_classes - 2]
+        self.llr = float(self.evidence[top_index] - runner_up)
+        if self.llr < self.bound:
+            return None
+
+        # Decision made: start collecting evidence for the next one
+        self.evidence.fill(0)
+        self.frame_count = 0
+
+        if top_index == self.nothing_index:
+            self.active_index = None  # Hand down / gap: the same letter may commit again
+            return None
+        if top_index == self.active_index:
+            return None  # Still holding the committed letter
+
+        self.active_index = top_index
+        return top_index
+
+    def get_confidence(self, index: Optional[int] = None) -> float:
+        """Smoothed probability of a class (the top class by default)"""
+        if index is None:
+            index = int(self.smoothed.argmax())
+        return float(self.smoothed[index])
@@ -4,13 +4,22 @@ Author: [Your Name] - MSc Thesis
 """
 
 import os
+import time
 import numpy as np
 import tensorflow as tf
 import cv2
 from typing import Optional, Tuple, List, Dict, Any
 
-from src.config import Config
-from src.utils.logger import get_logger
+try:
+    from src.config import Config
+    from src.utils.logger import get_logger
+except ImportError:
+    # Inside the mobile app the training config lives in app/utils/model_config.py
+    from logging import getLogger as get_logger
+    from ..utils.model_config import Config
+
+from .tflite_utils import model_store, auto_tune_num_threads
+from .prediction_result import PredictionResult
 
 
 class ASLPredictor:
@@ -66,12 +75,16 @@ class ASLPredictor:
             self.model_loaded = False
             return False
 
-    def load_tflite_model(self, tflite_path: str) -> bool:
+    def load_tflite_model(self, tflite_path: str, num_threads: Optional[int] = None,
+                          use_xnnpack: bool = True, auto_tune_threads: bool = False) -> bool:
         """
         Load TensorFlow Lite model for edge deployment
 
         Args:
             tflite_path: Path to TFLite model file
+            num_threads: CPU threads for the interpreter (None or 0 lets TFLite decide)
+            use_xnnpack: Use the XNNPACK CPU delegate
+            auto_tune_threads: Benchmark thread counts first and keep the fastest
 
         Returns:
             True if model loaded successfully, False otherwise
@@ -83,18 +96,28 @@ class ASLPredictor:
 
             self.logger.info(f"📱 Loading TFLite model from: {tflite_path}")
 
-            # Initialize TFLite interpreter
-            self.interpreter = tf.lite.Interpreter(model_path=tflite_path)
+            if auto_tune_threads:
+                num_threads, timings = auto_tune_num_threads(tflite_path, use_xnnpack=use_xnnpack)
+                self.logger.info(f"⏱️ Thread timings (ms): {timings}")
+
+            # Initialize TFLite interpreter (over the process-wide model mapping)
+            self.interpreter = model_store.create_interpreter(tflite_path, num_threads=num_threads,
+                                                              use_xnnpack=use_xnnpack)
             self.interpreter.allocate_tensors()
+            self.num_threads = num_threads
 
             # Get input and output details
             self.input_details = self.interpreter.get_input_details()
             self.output_details = self.interpreter.get_output_details()
 
+            # Batch size the interpreter tensors are currently allocated for
+            self.tflite_batch_size = int(self.input_details[0]['shape'][0])
+
             self.model_loaded = True
             self.is_tflite = True
 
             self.logger.info("✅ TFLite model loaded successfully!")
+            self.logger.info(f"🧵 Threads: {num_threads or 'default'}, XNNPACK: {use_xnnpack}")
             self.logger.info(f"📊 Input shape: {self.input_details[0]['shape']}")
             self.logger.info(f"📊 Output shape: {self.output_details[0]['shape']}")
 
@@ -105,7 +128,7 @@ class ASLPredictor:
             self.model_loaded = False
             return False
 
-    def predict(self, input_data: np.ndarray) -> Tuple[Optional[str], float]:
+    def predict(self, input_data: np.ndarray) -> PredictionResult:
         """
         Make prediction on input data
 
@@ -113,14 +136,14 @@ class ASLPredictor:
             input_data: Preprocessed input data
 
         Returns:
-            Tuple of (predicted_class, confidence)
+            PredictionResult (unpacks as (predicted_class, confidence)) carrying the
+            probability vector; top_k() and as_dict() reuse this single inference
         """
         try:
             if not self.model_loaded:
                 self.logger.warning("⚠️ No model loaded")
-                return None, 0.0
+                return PredictionResult(None, 0.0)
 
-            import time
             start_time = time.time()
 
             # Make prediction based on model type
@@ -136,19 +159,20 @@ class ASLPredictor:
 
             if predictions is not None:
                 # Get predicted class and confidence
-                predicted_class_idx = np.argmax(predictions)
-                confidence = np.max(predictions)
+                predicted_class_idx = int(np.argmax(predictions))
+                confidence = float(predictions[predicted_class_idx])
 
                 # Map to class label
                 if predicted_class_idx < len(self.config.class_labels):
                     predicted_class = self.config.class_labels[predicted_class_idx]
-                    return predicted_class, float(confidence)
+                    return PredictionResult(predicted_class, confidence, predictions,
+                                            self.config.class_labels, predicted_class_idx)
 
-            return None, 0.0
+            return PredictionResult(None, 0.0)
 
         except Exception as e:
             self.logger.error(f"❌ Prediction failed: {e}")
-            return None, 0.0
+            return PredictionResult(None, 0.0)
 
     def _predict_keras(self, input_data: np.ndarray) -> Optional[np.ndarray]:
         """
@@ -178,22 +202,80 @@ class ASLPredictor:
         Returns:
             Prediction probabilities or None if failed
         """
+        predictions = self._predict_tflite_batch(input_data)
+        if predictions is None:
+            return None
+        return predictions[0]  # Remove batch dimension
+
+    def _resize_tflite_batch(self, batch_size: int):
+        """
+        Resize the TFLite input tensor for a batch size
+
+        Re-allocation only happens when the batch size actually changes.
+
+        Args:
+            batch_size: Number of samples in the next invoke()
+        """
+        if batch_size == self.tflite_batch_size:
+            return
+
+        input_shape = list(self.input_details[0]['shape'])
+        input_shape[0] = batch_size
+        self.interpreter.resize_tensor_input(self.input_details[0]['index'], input_shape)
+        self.interpreter.allocate_tensors()
+
+        # Tensor details change after re-allocation
+        self.input_details = self.interpreter.get_input_details()
+        self.output_details = self.interpreter.get_output_details()
+        self.tflite_batch_size = batch_size
+
+    def _quantize_input(self, batch_data: np.ndarray) -> np.ndarray:
+        """Convert a normalized float batch to the input tensor's dtype (full-integer models)"""
+        input_detail = self.input_details[0]
+        dtype = input_detail['dtype']
+        if dtype not in (np.uint8, np.int8):
+            return batch_data.astype(dtype, copy=False)
+
+        scale, zero_point = input_detail['quantization']
+        info = np.iinfo(dtype)
+        return np.clip(np.round(batch_data / scale + zero_point), info.min, info.max).astype(dtype)
+
+    def _dequantize_output(self, output: np.ndarray) -> np.ndarray:
+        """Convert a quantized output tensor back to probabilities"""
+        output_detail = self.output_details[0]
+        if output_detail['dtype'] not in (np.uint8, np.int8):
+            return output
+
+        scale, zero_point = output_detail['quantization']
+        return (output.astype(np.float32) - zero_point) * scale
+
+    def _predict_tflite_batch(self, batch_data: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Make batched predictions using TensorFlow Lite model
+
+        Args:
+            batch_data: Input array of shape (N, H, W, C)
+
+        Returns:
+            Prediction probabilities of shape (N, num_classes) or None if failed
+        """
         try:
+            self._resize_tflite_batch(batch_data.shape[0])
+
             # Set input tensor
-            self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
+            self.interpreter.set_tensor(self.input_details[0]['index'], self._quantize_input(batch_data))
 
             # Run inference
             self.interpreter.invoke()
 
             # Get output
-            predictions = self.interpreter.get_tensor(self.output_details[0]['index'])
-            return predictions[0]  # Remove batch dimension
+            return self._dequantize_output(self.interpreter.get_tensor(self.output_details[0]['index']))
 
         except Exception as e:
             self.logger.error(f"❌ TFLite prediction failed: {e}")
             return None
 
-    def predict_from_image(self, image_path: str) -> Tuple[Optional[str], float]:
+    def predict_from_image(self, image_path: str) -> PredictionResult:
         """
         Make prediction from image file
 
@@ -201,37 +283,38 @@ class ASLPredictor:
             image_path: Path to image file
 
         Returns:
-            Tuple of (predicted_class, confidence)
+            PredictionResult (unpacks as (predicted_class, confidence)); empty on failure
         """
         try:
             if not os.path.exists(image_path):
                 self.logger.error(f"❌ Image file not found: {image_path}")
-                return None, 0.0
+                return PredictionResult(None, 0.0)
 
             # Load and preprocess image
             preprocessed = self._preprocess_image(image_path)
 
             if preprocessed is not None:
-                # Make prediction
-                prediction, confidence = self.predict(preprocessed)
+                # Make prediction (one forward pass; top-k reads the same probabilities)
+                result = self.predict(preprocessed)
+                prediction, confidence = result
 
                 if prediction:
                     self.logger.info(f"🎯 Prediction: {prediction} (confidence: {confidence:.4f})")
 
                     # Get top predictions for additional info
-                    top_predictions = self.get_top_predictions(preprocessed, k=3)
+                    top_predictions = result.top_k(3)
                     if top_predictions:
                         self.logger.info("📊 Top 3 predictions:")
                         for i, (pred, conf) in enumerate(top_predictions):
                             self.logger.info(f"   {i + 1}. {pred}: {conf:.4f}")
 
-                return prediction, confidence
+                return result
 
-            return None, 0.0
+            return PredictionResult(None, 0.0)
 
         except Exception as e:
             self.logger.error(f"❌ Image prediction failed: {e}")
-            return None, 0.0
+            return PredictionResult(None, 0.0)
 
     def _preprocess_image(self, image_path: str) -> Optional[np.ndarray]:
         """
@@ -283,27 +366,8 @@ class ASLPredictor:
             if not self.model_loaded:
                 return []
 
-            # Get predictions
-            if hasattr(self, 'is_tflite') and self.is_tflite:
-                predictions = self._predict_tflite(input_data)
-            else:
-                predictions = self._predict_keras(input_data)
-
-            if predictions is None:
-                return []
-
-            # Get top k indices
-            top_k_indices = np.argsort(predictions)[-k:][::-1]
-
-            # Create results
-            results = []
-            for idx in top_k_indices:
-                if idx < len(self.config.class_labels):
-                    class_name = self.config.class_labels[idx]
-                    confidence = float(predictions[idx])
-                    results.append((class_name, confidence))
-
-            return results
+            # Callers that already hold a PredictionResult should use result.top_k(k)
+            return self.predict(input_data).top_k(k)
 
         except Exception as e:
             self.logger.error(f"❌ Top predictions failed: {e}")
@@ -323,20 +387,86 @@ class ASLPredictor:
             if not self.model_loaded:
                 return []
 
-            results = []
+            batch_size = batch_data.shape[0]
+            if batch_size == 0:
+                return []
+
+            predictions = self.predict_batch_probabilities(batch_data)
+            if predictions is None:
+                return [(None, 0.0)] * batch_size
 
-            # Process each item in batch
-            for i in range(batch_data.shape[0]):
-                single_input = np.expand_dims(batch_data[i], axis=0)
-                prediction, confidence = self.predict(single_input)
-                results.append((prediction, confidence))
+            # Vectorized argmax/confidence over the (N, num_classes) matrix
+            class_indices = np.argmax(predictions, axis=1)
+            confidences = predictions[np.arange(batch_size), class_indices]
 
-            return results
+            labels = self.config.class_labels
+            return [
+                (labels[idx], float(conf)) if idx < len(labels) else (None, 0.0)
+                for idx, conf in zip(class_indices.tolist(), confidences.tolist())
+            ]
 
         except Exception as e:
             self.logger.error(f"❌ Batch prediction failed: {e}")
             return []
 
+    def predict_batch_probabilities(self, batch_data: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Run one forward pass over a batch and return the raw probabilities
+
+        Args:
+            batch_data: Batch of preprocessed input data (N, H, W, C)
+
+        Returns:
+            Probability matrix of shape (N, num_classes) or None if failed
+        """
+        try:
+            if not self.model_loaded:
+                return None
+
+            start_time = time.time()
+
+            # One forward pass for the whole batch
+            if hasattr(self, 'is_tflite') and self.is_tflite:
+                predictions = self._predict_tflite_batch(batch_data)
+            else:
+                predictions = self.model.predict(batch_data, verbose=0)
+
+            self.total_inference_time += time.time() - start_time
+            self.prediction_count += batch_data.shape[0]
+
+            return predictions
+
+        except Exception as e:
+            self.logger.error(f"❌ Batch prediction failed: {e}")
+            return None
+
+    def top_k_from_probabilities(self, probabilities: np.ndarray, k: int = 3) -> List[List[Tuple[str, float]]]:
+        """
+        Vectorized top-k over a probability matrix
+
+        Args:
+            probabilities: Array of shape (N, num_classes)
+            k: Number of top predictions per row
+
+        Returns:
+            For each row, a list of (class_name, confidence) sorted by confidence
+        """
+        num_classes = probabilities.shape[1]
+        k = min(k, num_classes)
+
+        # argpartition finds the k best per row in O(num_classes), then sort only those k
+        top_indices = np.argpartition(probabilities, num_classes - k, axis=1)[:, -k:]
+        top_scores = np.take_along_axis(probabilities, top_indices, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top_indices = np.take_along_axis(top_indices, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        labels = self.config.class_labels
+        return [
+            [(labels[idx], float(score)) for idx, score in zip(row_indices, row_scores) if idx < len(labels)]
+            for row_indices, row_scores in zip(top_indices.tolist(), top_scores.tolist())
+        ]
+
     def _print_model_info(self):
         """Print information about loaded model"""
         if self.model is None:
@@ -405,36 +535,30 @@ class ASLPredictor:
             if not self.model_loaded:
                 return None
 
-            # Get predictions
-            if hasattr(self, 'is_tflite') and self.is_tflite:
-                predictions = self._predict_tflite(input_data)
-            else:
-                predictions = self._predict_keras(input_data)
-
-            if predictions is None:
+            # Callers that already hold a PredictionResult should use result.as_dict()
+            result = self.predict(input_data)
+            if result.probabilities is None:
                 return None
 
-            # Create probability dictionary
-            probabilities = {}
-            for i, prob in enumerate(predictions):
-                if i < len(self.config.class_labels):
-                    class_name = self.config.class_labels[i]
-                    probabilities[class_name] = float(prob)
-
-            return probabilities
+            return result.as_dict()
 
         except Exception as e:
             self.logger.error(f"❌ Failed to get class probabilities: {e}")
             return None
 
-    def predict_with_uncertainty(self, input_data: np.ndarray, num_samples: int = 10) -> Tuple[
-        Optional[str], float, float]:
+    def predict_with_uncertainty(self, input_data: np.ndarray, num_samples: int = 10,
+                                 reuse_features: bool = True) -> Tuple[Optional[str], float, float]:
         """
         Make prediction with uncertainty estimation using Monte Carlo dropout
 
+        All samples run as one batch with dropout active. With reuse_features the
+        backbone runs once in inference mode and only the dropout head is
+        resampled, which is what makes this cheap enough for live use.
+
         Args:
-            input_data: Preprocessed input data
-            num_samples: Number of forward passes for uncertainty estimation
+            input_data: Preprocessed input data (the first sample is used)
+            num_samples: Number of dropout samples for uncertainty estimation
+            reuse_features: Run the backbone once and resample only the dropout head
 
         Returns:
             Tuple of (predicted_class, mean_confidence, uncertainty)
@@ -445,20 +569,14 @@ class ASLPredictor:
                 pred, conf = self.predict(input_data)
                 return pred, conf, 0.0
 
-            # Collect predictions from multiple forward passes
-            predictions = []
-            for _ in range(num_samples):
-                pred_probs = self.model(input_data, training=True)  # Enable dropout
-                predictions.append(pred_probs.numpy()[0])
-
-            predictions = np.array(predictions)
+            predictions = self._mc_dropout_probabilities(input_data, num_samples, reuse_features)
 
             # Calculate mean and uncertainty
-            mean_predictions = np.mean(predictions, axis=0)
-            uncertainty = np.std(predictions, axis=0)
+            mean_predictions = predictions.mean(axis=0)
+            uncertainty = predictions.std(axis=0)
 
             # Get predicted class
-            predicted_class_idx = np.argmax(mean_predictions)
+            predicted_class_idx = int(np.argmax(mean_predictions))
             predicted_class = self.config.class_labels[predicted_class_idx]
             mean_confidence = float(mean_predictions[predicted_class_idx])
             prediction_uncertainty = float(uncertainty[predicted_class_idx])
@@ -469,6 +587,69 @@ class ASLPredictor:
             self.logger.error(f"❌ Uncertainty prediction failed: {e}")
             return None, 0.0, 0.0
 
+    def _mc_dropout_probabilities(self, input_data: np.ndarray, num_samples: int,
+                                  reuse_features: bool = True) -> np.ndarray:
+        """
+        Sample the model with dropout active, all samples in one batch
+
+        Args:
+            input_data: Preprocessed input data (the first sample is used)
+            num_samples: Number of dropout samples
+            reuse_features: Run the backbone once and tile its features instead of the image
+
+        Returns:
+            Probability matrix of shape (num_samples, num_classes)
+        """
+        sample = input_data[:1]
+
+        split = self._get_dropout_split() if reuse_features else None
+        if split is None:
+            # Whole model with dropout on: tile the image into one batch
+            batch = np.repeat(sample, num_samples, axis=0)
+            return self.model(batch, training=True).numpy()
+
+        backbone, head_layers = split
+        features = backbone(sample, training=False)
+        x = tf.repeat(features, num_samples, axis=0)
+        for layer in head_layers:
+            # Only dropout is stochastic; everything else stays in inference mode
+            x = layer(x, training=isinstance(layer, tf.keras.layers.Dropout))
+        return x.numpy()
+
+    def _get_dropout_split(self) -> Optional[Tuple[Any, List[Any]]]:
+        """
+        Split the model into a deterministic backbone and the head from the first Dropout on
+
+        Only top-level models whose layers from the first Dropout form a single
+        chain ending at the model output are split (e.g. backbone -> pooling ->
+        Dense/Dropout stack); anything else returns None and uses the full model.
+
+        Returns:
+            (backbone model, head layers) or None
+        """
+        if getattr(self, '_dropout_split_model', None) is self.model:
+            return self._dropout_split
+
+        split = None
+        try:
+            layers = self.model.layers
+            first = next((i for i, layer in enumerate(layers)
+                          if isinstance(layer, tf.keras.layers.Dropout)), None)
+            if first is not None:
+                head_layers = layers[first:]
+                chained = all(layer.input is previous.output
+                              for previous, layer in zip(head_layers, head_layers[1:]))
+                if chained and head_layers[-1].output is self.model.outputs[0]:
+                    inputs = self.model.inputs
+                    backbone = tf.keras.Model(inputs[0] if len(inputs) == 1 else inputs, head_layers[0].input)
+                    split = (backbone, head_layers)
+        except (AttributeError, ValueError) as e:
+            self.logger.warning(f"⚠️ Dropout head split unavailable, sampling the full model: {e}")
+
+        self._dropout_split_model = self.model
+        self._dropout_split = split
+        return split
+
 
 if __name__ == "__main__":
     # Test predictor functionality
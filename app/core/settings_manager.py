@@ -38,12 +38,35 @@ class SettingsManager:
             'recognition_confidence_threshold': 0.7,
             'auto_speak_words': True,
             'auto_speak_interval': 9,  # Speak every N letters
+            'recognition_min_fps': 2,  # Lowest sampling rate when the scene is idle
+            'smoothing_mode': 'sprt',  # sprt (sequential test, no cooldown), ema, window
+            'sprt_error_rate': 0.02,  # Sequential test bound: log((1 - e) / e)
+            'sprt_decay': 0.8,  # Per-frame forgetting of accumulated evidence
+            'smoothing_alpha': 0.5,  # EMA weight of the newest frame
+            'smoothing_enter_threshold': 0.6,  # Smoothed probability needed to commit a letter
+            'smoothing_exit_threshold': 0.3,  # Release a held letter below this
+            'auto_word_completion': True,  # Suggest dictionary words for the signed letters (tap to use one)
+            'motion_letters_enabled': True,  # Temporal head over cached frame embeddings for J/Z
+            'motion_window': 8,  # Frames in the temporal window
 
             # Camera settings
             'camera_resolution': 'medium',  # low, medium, high
-            'camera_fps': 30,
+            'camera_fps': 30,  # Upper bound for the adaptive recognition rate
             'show_camera_preview': True,
 
+            # Frame gate (skip inference on static/empty frames)
+            'gate_enabled': True,
+            'gate_motion_threshold': 3.0,  # Mean grey-level change that counts as motion
+            'gate_empty_threshold': 4.0,  # Max difference from the learned empty background
+            'gate_max_reuse': 30,  # Force an inference after this many skipped frames
+
+            # Hand tracking (crop around the hand instead of the frame centre)
+            'hand_tracking_enabled': True,
+            'hand_detect_every': 10,  # MediaPipe: re-detect every N frames, track in between
+            'hand_padding': 0.25,  # Margin around the hand box, as a fraction of its size
+            'mediapipe_min_detection_confidence': 0.5,  # MediaPipe Hands (same keys as Config.mediapipe)
+            'mediapipe_min_tracking_confidence': 0.5,
+
             # UI settings
             'theme': 'light',  # light, dark
             'font_size': 'medium',  # small, medium, large
@@ -62,7 +85,13 @@ class SettingsManager:
             # Advanced settings
             'debug_mode': False,
             'log_predictions': False,
-            'model_path': 'assets/models/best_model.tflite'  # ✅ Updated to use best_model.tflite
+            'model_path': 'assets/models/best_model.tflite',  # ✅ Updated to use best_model.tflite
+
+            # TFLite runtime settings
+            'tflite_num_threads': 0,  # 0 = let TFLite decide
+            'tflite_use_xnnpack': True,
+            'tflite_auto_tune': False,  # Benchmark thread counts on next startup
+            'model_warmup_runs': 3  # Blank-frame inferences at load time (cold start off the first sign)
         }
 
         # Current settings (loaded from file or defaults)
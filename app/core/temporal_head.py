@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Temporal Head - Motion letters (J, Z) from a window of cached frame embeddings
+The per-frame classifier only sees stills, so letters that are defined by a
+movement get confused with their static hand shapes (J with I, Z with D).
+Every frame's embedding is kept in a small ring buffer together with the hand
+position, and a tiny linear head over the window average plus the amount of
+motion re-scores the motion letters. Overlapping windows share the cached
+frames, so each new frame costs one push and one small matrix-vector product.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .prediction_result import PredictionResult
+
+MOTION_LETTERS = ('J', 'Z')
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+
+class EmbeddingCache:
+    """Ring buffer of recent frame embeddings and hand positions with running sums"""
+
+    def __init__(self, dim: int, window: int = 8):
+        """
+        Initialize the cache
+
+        Args:
+            dim: Embedding size
+            window: Frames kept
+        """
+        self.dim = int(dim)
+        self.window = max(2, int(window))
+
+        self.embeddings = np.zeros((self.window, self.dim), dtype=np.float32)
+        self.positions = np.full((self.window, 2), np.nan, dtype=np.float32)  # Box centre / box side
+        self.steps = np.zeros(self.window, dtype=np.float32)  # Movement into each frame
+        self.embedding_sum = np.zeros(self.dim, dtype=np.float64)
+        self.step_sum = 0.0
+        self.index = 0
+        self.count = 0
+
+    def reset(self):
+        """Forget all frames"""
+        self.embedding_sum.fill(0.0)
+        self.positions.fill(np.nan)
+        self.steps.fill(0.0)
+        self.step_sum = 0.0
+        self.index = 0
+        self.count = 0
+
+    def push(self, embedding: np.ndarray, box: Optional[Box] = None):
+        """
+        Add a frame, evicting the oldest one when full
+
+        Args:
+            embedding: Frame embedding (copied)
+            box: Hand box in the frame, if tracked
+        """
+        slot = self.index
+        previous = (slot - 1) % self.window
+
+        if self.count == self.window:
+            self.embedding_sum -= self.embeddings[slot]
+            self.step_sum -= float(self.steps[slot])
+
+        self.embeddings[slot] = embedding
+        self.embedding_sum += self.embeddings[slot]
+
+        # Hand displacement relative to its size; embedding change when there is no box
+        if box is not None:
+            x1, y1, x2, y2 = box
+            side = max(x2 - x1, y2 - y1, 1)
+            self.positions[slot] = ((x1 + x2) / (2.0 * side), (y1 + y2) / (2.0 * side))
+        else:
+            self.positions[slot] = np.nan
+
+        step = 0.0
+        if self.count:
+            if box is not None and not np.isnan(self.positions[previous, 0]):
+                step = float(np.hypot(*(self.positions[slot] - self.positions[previous])))
+            else:
+                change = self.embeddings[slot] - self.embeddings[previous]
+                step = float(np.sqrt(np.dot(change, change) / self.dim))
+        self.steps[slot] = step
+        self.step_sum += step
+
+        self.index = (slot + 1) % self.window
+        self.count = min(self.count + 1, self.window)
+
+    def mean(self) -> np.ndarray:
+        """Average embedding over the window"""
+        return (self.embedding_sum / max(self.count, 1)).astype(np.float32)
+
+    def motion(self) -> float:
+        """Path length over the window (hand sizes, or embedding RMS change without a box)"""
+        # The oldest frame's step points outside the window
+        if self.count < self.window:
+            return self.step_sum
+        return self.step_sum - float(self.steps[self.index])
+
+
+class TemporalHead:
+    """Tiny linear classifier over [window-mean embedding, motion] for the motion letters"""
+
+    def __init__(self, class_names: Sequence[str], dim: Optional[int] = None, window: int = 8,
+                 motion_gain: float = 4.0, motion_threshold: float = 0.5,
+                 weights_path: Optional[Path] = None):
+        """
+        Initialize the temporal head
+
+        Without trained weights the head starts from the identity on the
+        embedding (which the engine defaults to the frame logits) and adds
+        motion_gain * (motion - motion_threshold) to the motion letters.
+
+        Args:
+            class_names: Labels of the per-frame classifier
+            dim: Embedding size (default: one per class)
+            window: Frames in the temporal window
+            motion_gain: Logit boost per unit of motion for the motion letters
+            motion_threshold: Motion (in hand sizes over the window) at which the boost is zero
+            weights_path: Optional .npz with W (classes x dim+1) and b (classes)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.class_names = list(class_names)
+        self.num_classes = len(self.class_names)
+        self.dim = int(dim or self.num_classes)
+        self.motion_indices = np.array([i for i, name in enumerate(self.class_names)
+                                        if name in MOTION_LETTERS], dtype=np.intp)
+
+        self.cache = EmbeddingCache(self.dim, window)
+        self.features = np.zeros(self.dim + 1, dtype=np.float32)  # Reused [mean, motion]
+
+        self.weights, self.bias = self._default_weights(motion_gain, motion_threshold)
+        if weights_path and Path(weights_path).exists():
+            self.load_weights(weights_path)
+
+        # Counters
+        self.frames = 0
+        self.overrides = 0
+
+    def _default_weights(self, motion_gain: float, motion_threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        weights = np.zeros((self.num_classes, self.dim + 1), dtype=np.float32)
+        bias = np.zeros(self.num_classes, dtype=np.float32)
+        if self.dim == self.num_classes:
+            weights[:, :self.dim] = np.eye(self.num_classes, dtype=np.float32)
+        weights[self.motion_indices, self.dim] = motion_gain
+        bias[self.motion_indices] = -motion_gain * motion_threshold
+        return weights, bias
+
+    def load_weights(self, path: Path):
+        """
+        Load trained head weights
+
+        Args:
+            path: .npz with W (classes x dim+1) and b (classes)
+        """
+        data = np.load(path)
+        weights = np.asarray(data['W'], dtype=np.float32)
+        bias = np.asarray(data['b'], dtype=np.float32)
+        if weights.shape != (self.num_classes, self.dim + 1) or bias.shape != (self.num_classes,):
+            raise ValueError(f"Temporal head weights have shape {weights.shape}, "
+                             f"expected {(self.num_classes, self.dim + 1)}")
+        self.weights, self.bias = weights, bias
+        self.logger.info(f"✅ Temporal head weights loaded: {path}")
+
+    def reset(self):
+        """Forget the window (e.g. when recognition restarts)"""
+        self.cache.reset()
+
+    def logits(self) -> np.ndarray:
+        """Head scores for the current window"""
+        features = self.features
+        features[:self.dim] = self.cache.mean()
+        features[self.dim] = self.cache.motion()
+        return self.weights @ features + self.bias
+
+    def apply(self, result: PredictionResult, box: Optional[Box] = None) -> PredictionResult:
+        """
+        Add a frame and re-score it over the window
+
+        The frame result is kept unless the window decides on a motion letter,
+        so static letters are never delayed or smoothed twice.
+
+        Args:
+            result: Per-frame PredictionResult carrying an embedding
+            box: Hand box of the frame, if tracked
+
+        Returns:
+            The original result, or a motion-letter PredictionResult
+        """
+        embedding = getattr(result, 'embedding', None)
+        if embedding is None or len(embedding) != self.dim or not len(self.motion_indices):
+            return result
+
+        self.cache.push(embedding, box)
+        self.frames += 1
+        if self.cache.count < 2:
+            return result
+
+        logits = self.logits()
+        class_index = int(np.argmax(logits))
+        if class_index not in self.motion_indices:
+            return result
+
+        probabilities = np.exp(logits - logits[class_index]).astype(np.float32)
+        probabilities /= probabilities.sum()
+        self.overrides += 1
+        return PredictionResult(self.class_names[class_index], float(probabilities[class_index]),
+                                probabilities, self.class_names, class_index, embedding)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get temporal head statistics
+
+        Returns:
+            Dict with frame and override counts
+        """
+        return {
+            'frames': self.frames,
+            'overrides': self.overrides,
+            'window': self.cache.window,
+            'motion': self.cache.motion()
+        }
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+TFLite Utilities - Interpreter construction, shared model store, interpreter pools and thread auto-tuning
+Shared by ASLEngine, ModelManager and ASLPredictor
+"""
+
+import itertools
+import mmap
+import os
+import threading
+import time
+import weakref
+import logging
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Try TensorFlow Lite from full TensorFlow first, then the standalone runtime
+TFLITE_AVAILABLE = False
+try:
+    import tensorflow.lite as tflite
+
+    TFLITE_AVAILABLE = True
+except ImportError:
+    try:
+        import tflite_runtime.interpreter as tflite
+
+        TFLITE_AVAILABLE = True
+    except ImportError:
+        tflite = None
+
+
+def _resolver_without_default_delegates():
+    """Get the op resolver type that skips XNNPACK (None if unsupported)"""
+    if tflite is None:
+        return None
+
+    # tf.lite exposes it under .experimental, tflite_runtime at module level
+    resolver_types = getattr(getattr(tflite, 'experimental', tflite), 'OpResolverType', None)
+    if resolver_types is None:
+        return None
+    return resolver_types.BUILTIN_WITHOUT_DEFAULT_DELEGATES
+
+
+def create_interpreter(model_path: Optional[str] = None, model_content: Optional[bytes] = None,
+                       num_threads: Optional[int] = None, use_xnnpack: bool = True):
+    """
+    Build a TFLite interpreter with the configured threading and delegate
+
+    Args:
+        model_path: Path to the .tflite file
+        model_content: Model bytes (used instead of model_path when given)
+        num_threads: Number of CPU threads (None or 0 lets TFLite decide)
+        use_xnnpack: Use the default XNNPACK CPU delegate
+
+    Returns:
+        Un-allocated tflite Interpreter
+    """
+    if tflite is None:
+        raise ImportError("TensorFlow Lite not available")
+
+    kwargs = {}
+    if model_content is not None:
+        kwargs['model_content'] = model_content
+    else:
+        kwargs['model_path'] = str(model_path)
+
+    if num_threads:
+        kwargs['num_threads'] = int(num_threads)
+
+    if not use_xnnpack:
+        resolver = _resolver_without_default_delegates()
+        if resolver is not None:
+            kwargs['experimental_op_resolver_type'] = resolver
+        else:
+            logger.warning("This TFLite build cannot disable XNNPACK, using defaults")
+
+    return tflite.Interpreter(**kwargs)
+
+
+class ModelStore:
+    """Read-only .tflite files mapped once per process and shared by every interpreter built from them"""
+
+    def __init__(self):
+        self._mappings = {}  # Real path -> (mtime_ns, size, mmap)
+        self._retired = []   # Mappings of replaced files, closed once no interpreter holds them
+        self._users = {}     # id(mmap) -> interpreters built over it
+        self._lock = threading.RLock()  # Map a new file / user counts (re-entered by GC finalizers)
+        self.buffer_content = None  # Whether the runtime accepts a buffer as model_content (probed once)
+
+    def get(self, model_path: str) -> mmap.mmap:
+        """
+        The file's read-only mapping (remapped if the file changed)
+
+        Args:
+            model_path: Path to the .tflite file
+
+        Returns:
+            mmap over the whole file; pages come from the page cache, so other
+            processes mapping the same file share them
+        """
+        path = os.path.realpath(model_path)
+        stat = os.stat(path)
+        entry = self._mappings.get(path)
+        if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return entry[2]
+
+        with self._lock:
+            entry = self._mappings.get(path)
+            if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                return entry[2]
+            if entry:
+                self._retire(entry[2])
+
+            with open(path, 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mappings[path] = (stat.st_mtime_ns, stat.st_size, mapping)
+            return mapping
+
+    def _retire(self, mapping: mmap.mmap):
+        """Close a replaced mapping now, or once its last interpreter is gone (lock held)"""
+        if self._users.get(id(mapping), 0) == 0:
+            self._close(mapping)
+        else:
+            self._retired.append(mapping)
+
+    def _close(self, mapping: mmap.mmap):
+        self._users.pop(id(mapping), None)
+        try:
+            mapping.close()
+        except BufferError:
+            self._retired.append(mapping)  # Still exported somewhere; retried on the next release
+
+    def _release(self, mapping: mmap.mmap):
+        """An interpreter built over mapping was garbage-collected"""
+        with self._lock:
+            if id(mapping) in self._users:
+                self._users[id(mapping)] -= 1
+            for retired in list(self._retired):
+                if self._users.get(id(retired), 0) == 0:
+                    self._retired.remove(retired)
+                    self._close(retired)
+
+    def create_interpreter(self, model_path: str, num_threads: Optional[int] = None, use_xnnpack: bool = True):
+        """
+        Build an interpreter over the shared mapping
+
+        Runtimes whose model_content only takes bytes (they raise TypeError
+        for a buffer) get the file path instead: TFLite then maps the file
+        itself, which shares the same page-cache pages, whereas bytes would be
+        a private copy per process. The store then maps nothing.
+
+        Args:
+            model_path: Path to the .tflite file
+            num_threads: Number of CPU threads (None or 0 lets TFLite decide)
+            use_xnnpack: Use the default XNNPACK CPU delegate
+
+        Returns:
+            Un-allocated tflite Interpreter
+        """
+        if self.buffer_content is not False:
+            mapping = self.get(model_path)
+            try:
+                interpreter = create_interpreter(model_content=mapping, num_threads=num_threads,
+                                                 use_xnnpack=use_xnnpack)
+            except TypeError:
+                if self.buffer_content:
+                    raise
+                self.buffer_content = False
+                self._drop_mappings()
+                logger.info("TFLite model_content needs bytes here; interpreters map the model file themselves")
+            else:
+                self.buffer_content = True
+                with self._lock:
+                    self._users[id(mapping)] = self._users.get(id(mapping), 0) + 1
+                weakref.finalize(interpreter, self._release, mapping)
+                return interpreter
+
+        return create_interpreter(os.path.realpath(model_path), num_threads=num_threads, use_xnnpack=use_xnnpack)
+
+    def _drop_mappings(self):
+        """Unmap everything once interpreters are known to take the path"""
+        with self._lock:
+            for _, _, mapping in self._mappings.values():
+                self._close(mapping)
+            self._mappings.clear()
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Get store statistics
+
+        Returns:
+            Dict with mapped files, mapped bytes, replaced mappings still in use
+            and whether buffers are passed directly
+        """
+        return {
+            'files': len(self._mappings),
+            'mapped_bytes': sum(size for _, size, _ in self._mappings.values()),
+            'retired': len(self._retired),
+            'buffer_content': self.buffer_content
+        }
+
+
+# Process-wide store used by ASLEngine, ModelManager and ASLPredictor
+model_store = ModelStore()
+
+
+def get_rss_breakdown() -> Dict[str, int]:
+    """
+    Resident memory of this process split into anonymous and file-backed kB
+
+    File-backed pages (like a mapped model) are shared with other processes
+    through the page cache; anonymous pages are private. Linux only.
+
+    Returns:
+        Dict like {'RssAnon': kB, 'RssFile': kB}, empty where /proc is unavailable
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            return {key: int(value.split()[0]) for key, value in
+                    (line.split(':', 1) for line in f if line.startswith(('RssAnon', 'RssFile')))}
+    except OSError:
+        return {}
+
+
+class InterpreterPool:
+    """TFLite interpreters checked out per call, all built from the same model bytes"""
+
+    def __init__(self, model_path: Optional[str] = None, model_content: Optional[bytes] = None,
+                 num_threads: Optional[int] = None, use_xnnpack: bool = True):
+        """
+        Initialize the pool
+
+        Interpreters are not thread-safe, so sharing one serializes every
+        caller. Each concurrent caller instead checks out its own; the pool
+        grows to the peak concurrency and the model flatbuffer is shared, so
+        only the tensor arenas are per interpreter. Checkout and return are
+        single deque operations (atomic in CPython), with no lock.
+
+        Args:
+            model_path: Path to the .tflite file (mapped once by model_store)
+            model_content: Model bytes (used instead of model_path when given)
+            num_threads: CPU threads per interpreter (None or 0 lets TFLite decide)
+            use_xnnpack: Use the default XNNPACK CPU delegate
+        """
+        self.model_path = model_path
+        self.model_content = model_content  # None: interpreters come from the shared model_store
+        self.num_threads = num_threads
+        self.use_xnnpack = use_xnnpack
+
+        self._idle = deque()
+        self._created = itertools.count(1)  # next() is atomic under the GIL
+        self.created = 0
+
+    def _create(self):
+        if self.model_content is None:
+            interpreter = model_store.create_interpreter(self.model_path, num_threads=self.num_threads,
+                                                         use_xnnpack=self.use_xnnpack)
+        else:
+            interpreter = create_interpreter(model_content=self.model_content, num_threads=self.num_threads,
+                                             use_xnnpack=self.use_xnnpack)
+        interpreter.allocate_tensors()
+        self.created = next(self._created)
+        return interpreter
+
+    def acquire(self):
+        """
+        Check out an allocated interpreter (a new one if all are busy)
+
+        Returns:
+            tflite Interpreter; hand it back with release()
+        """
+        try:
+            return self._idle.pop()  # Most recently used first: its arena is still in cache
+        except IndexError:
+            return self._create()
+
+    def release(self, interpreter):
+        """Return an interpreter from acquire()"""
+        self._idle.append(interpreter)
+
+    @contextmanager
+    def interpreter(self):
+        """with pool.interpreter() as interpreter: ... (acquire/release)"""
+        interpreter = self.acquire()
+        try:
+            yield interpreter
+        finally:
+            self.release(interpreter)
+
+    def detached(self):
+        """
+        An allocated interpreter of the same model that is not part of the pool
+
+        Returns:
+            tflite Interpreter owned by the caller
+        """
+        return self._create()
+
+    def prefill(self, count: int):
+        """Create interpreters up front so the first concurrent calls don't pay for it"""
+        for _ in range(count - len(self._idle)):
+            self._idle.append(self._create())
+
+    @property
+    def idle(self) -> int:
+        """Interpreters not checked out right now"""
+        return len(self._idle)
+
+
+def get_thread_candidates(max_threads: Optional[int] = None) -> List[int]:
+    """
+    Get thread counts worth benchmarking on this machine
+
+    Args:
+        max_threads: Upper bound (default: CPU count)
+
+    Returns:
+        List like [1, 2, 4, ..., cpu_count]
+    """
+    cpu_count = max_threads or os.cpu_count() or 1
+
+    candidates = []
+    threads = 1
+    while threads < cpu_count:
+        candidates.append(threads)
+        threads *= 2
+    candidates.append(cpu_count)
+
+    return candidates
+
+
+def benchmark_interpreter(interpreter, runs: int = 10, warmup: int = 2) -> float:
+    """
+    Time invoke() on synthetic input
+
+    Args:
+        interpreter: Allocated tflite Interpreter
+        runs: Number of timed invocations
+        warmup: Number of untimed invocations first
+
+    Returns:
+        Median latency in milliseconds
+    """
+    input_details = interpreter.get_input_details()[0]
+    dummy = np.zeros(input_details['shape'], dtype=input_details['dtype'])
+    interpreter.set_tensor(input_details['index'], dummy)
+
+    for _ in range(warmup):
+        interpreter.invoke()
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        interpreter.invoke()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return float(np.median(timings))
+
+
+def auto_tune_num_threads(model_path: Optional[str] = None, model_content: Optional[bytes] = None,
+                          candidates: Optional[List[int]] = None, use_xnnpack: bool = True,
+                          runs: int = 10) -> Tuple[int, Dict[int, float]]:
+    """
+    Benchmark a few thread counts on a model and pick the fastest
+
+    Args:
+        model_path: Path to the .tflite file
+        model_content: Model bytes (used instead of model_path when given)
+        candidates: Thread counts to try (default: get_thread_candidates())
+        use_xnnpack: Use the default XNNPACK CPU delegate
+        runs: Timed invocations per candidate
+
+    Returns:
+        Tuple of (best_num_threads, {num_threads: median_ms})
+    """
+    if candidates is None:
+        candidates = get_thread_candidates()
+
+    timings = {}
+    for num_threads in candidates:
+        try:
+            interpreter = create_interpreter(model_path, model_content,
+                                             num_threads=num_threads, use_xnnpack=use_xnnpack)
+            interpreter.allocate_tensors()
+            timings[num_threads] = benchmark_interpreter(interpreter, runs=runs)
+            del interpreter
+        except Exception as e:
+            logger.warning(f"Auto-tune failed for {num_threads} threads: {e}")
+
+    if not timings:
+        return candidates[0], timings
+
+    best = min(timings, key=timings.get)
+    summary = ", ".join(f"{t}: {ms:.1f}ms" for t, ms in timings.items())
+    logger.info(f"⏱️ TFLite thread auto-tune: {summary} -> {best} threads")
+
+    return best, timings
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Word Decoder - Dictionary-constrained beam search over the letter stream
+Keeps the few most likely dictionary prefixes for the letters signed so far
+(letter probabilities x word-frequency prior) and proposes completions, so
+a word can be selected before every letter is signed
+"""
+
+import math
+import os
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_WORD_LIST = Path("assets/dictionary/words.txt")
+
+# One record per trie node. Nodes are stored breadth-first, so the children of
+# a node are contiguous (sorted by letter) and always come after their parent.
+NODE_DTYPE = np.dtype([
+    ('char', 'u1'),         # Letter on the edge into this node (0 for the root)
+    ('child_count', 'u1'),
+    ('parent', '<i4'),
+    ('child_start', '<i4'),
+    ('word_logp', '<f4'),   # log P(word) if a word ends here, else -inf
+    ('best_logp', '<f4'),   # Best word_logp in this subtree (prefix prior)
+    ('best_leaf', '<i4'),   # Node of that best word
+])
+
+
+def read_word_list(path: Path) -> List[Tuple[str, float]]:
+    """
+    Read a word list
+
+    Lines are "word" or "word<TAB>count"; '#' starts a comment. Words without
+    a count get a Zipf weight of 1/rank.
+
+    Returns:
+        List of (WORD, count) with letters-only upper-case words
+    """
+    counts = {}
+    rank = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+
+            parts = line.split('\t')
+            word = parts[0].strip().upper()
+            if not word.isalpha() or not word.isascii():
+                continue
+
+            rank += 1
+            count = float(parts[1]) if len(parts) > 1 else 1.0 / rank
+            counts[word] = max(count, counts.get(word, 0.0))
+
+    return list(counts.items())
+
+
+class WordTrie:
+    """Array-backed prefix trie with word-frequency priors"""
+
+    def __init__(self, nodes: np.ndarray):
+        """
+        Wrap a node array (see NODE_DTYPE); use build() or load() to create one
+
+        Args:
+            nodes: Structured node array, possibly a read-only memmap
+        """
+        self.nodes = nodes
+        # Field views (no copies, also for memmaps)
+        self.char = nodes['char']
+        self.child_count = nodes['child_count']
+        self.child_start = nodes['child_start']
+        self.parent = nodes['parent']
+        self.word_logp = nodes['word_logp']
+        self.best_logp = nodes['best_logp']
+        self.best_leaf = nodes['best_leaf']
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @classmethod
+    def build(cls, words: Iterable[Tuple[str, float]]) -> 'WordTrie':
+        """
+        Build a trie from (word, count) pairs
+
+        Args:
+            words: Upper-case words and their counts
+
+        Returns:
+            WordTrie
+        """
+        words = [(word, count) for word, count in words if word and count > 0]
+        total = sum(count for _, count in words) or 1.0
+
+        # Nested dicts first, then flatten breadth-first
+        root = {}
+        ends = {}
+        for word, count in words:
+            node = root
+            for letter in word:
+                node = node.setdefault(letter, {})
+            ends[id(node)] = math.log(count / total)
+
+        order = [(root, 0, -1)]
+        queue = deque([0])
+        nodes_by_index = [root]
+        while queue:
+            index = queue.popleft()
+            for letter in sorted(nodes_by_index[index]):
+                child = nodes_by_index[index][letter]
+                order.append((child, ord(letter), index))
+                nodes_by_index.append(child)
+                queue.append(len(nodes_by_index) - 1)
+
+        position = {id(node): i for i, (node, _, _) in enumerate(order)}
+        parents = [parent for _, _, parent in order]
+        word_logp = [ends.get(id(node), -np.inf) for node, _, _ in order]
+
+        # Children come after parents, so one reverse pass fills the subtree maxima
+        best_logp = list(word_logp)
+        best_leaf = [i if math.isfinite(logp) else -1 for i, logp in enumerate(word_logp)]
+        for i in range(len(order) - 1, 0, -1):
+            parent = parents[i]
+            if best_logp[i] > best_logp[parent]:
+                best_logp[parent] = best_logp[i]
+                best_leaf[parent] = best_leaf[i]
+
+        nodes = np.zeros(len(order), dtype=NODE_DTYPE)
+        nodes['char'] = [char for _, char, _ in order]
+        nodes['parent'] = parents
+        nodes['child_count'] = [len(node) for node, _, _ in order]
+        nodes['child_start'] = [position[id(node[min(node)])] if node else 0 for node, _, _ in order]
+        nodes['word_logp'] = word_logp
+        nodes['best_logp'] = best_logp
+        nodes['best_leaf'] = best_leaf
+
+        return cls(nodes)
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, cache_path: Optional[Path] = None) -> 'WordTrie':
+        """
+        Load the trie for a word list, memory-mapping a compiled copy when possible
+
+        The first load builds the trie and saves it as .npy next to the list;
+        later loads mmap that file, so only the pages touched are ever read.
+
+        Args:
+            path: Word list (default: assets/dictionary/words.txt)
+            cache_path: Compiled trie (default: <path>.trie.npy)
+
+        Returns:
+            WordTrie
+        """
+        path = Path(path or DEFAULT_WORD_LIST)
+        cache_path = Path(cache_path or str(path) + '.trie.npy')
+
+        if cache_path.exists() and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            try:
+                nodes = np.load(cache_path, mmap_mode='r')
+                if nodes.dtype == NODE_DTYPE:
+                    return cls(nodes)
+            except (OSError, ValueError):
+                pass
+
+        trie = cls.build(read_word_list(path))
+        try:
+            np.save(cache_path, trie.nodes)
+        except OSError:
+            pass  # Read-only assets: keep the in-memory trie
+        return trie
+
+    def child(self, node: int, letter: str) -> int:
+        """Child of node along letter, or -1"""
+        start = int(self.child_start[node])
+        code = ord(letter)
+        for i in range(start, start + int(self.child_count[node])):
+            if self.char[i] == code:
+                return i
+        return -1
+
+    def find(self, prefix: str) -> int:
+        """Node for a prefix, or -1"""
+        node = 0
+        for letter in prefix.upper():
+            node = self.child(node, letter)
+            if node < 0:
+                return -1
+        return node
+
+    def word(self, node: int) -> str:
+        """Spell the path from the root to node"""
+        letters = []
+        while node > 0:
+            letters.append(chr(self.char[node]))
+            node = int(self.parent[node])
+        return ''.join(reversed(letters))
+
+    def is_word(self, node: int) -> bool:
+        return bool(np.isfinite(self.word_logp[node]))
+
+
+class BeamDecoder:
+    """Incremental beam search over committed letter distributions, constrained by a WordTrie"""
+
+    def __init__(self, trie: WordTrie, class_names: Sequence[str], beam_width: int = 8,
+                 lm_weight: float = 0.5, min_probability: float = 1e-3, match_probability: float = 0.2):
+        """
+        Initialize the decoder
+
+        Args:
+            trie: Dictionary trie
+            class_names: Labels of the probability vectors (non-letters are ignored)
+            beam_width: Prefixes kept after each letter
+            lm_weight: Weight of the word-frequency prior against the letter evidence
+            min_probability: Letters below this probability are not expanded
+            match_probability: A prefix is only suggested if every signed letter it
+                reads had at least this probability (smoothing leaves small
+                probabilities on every letter; those must not turn "ANN" into "AND")
+        """
+        self.trie = trie
+        self.beam_width = int(beam_width)
+        self.lm_weight = float(lm_weight)
+        self.min_probability = float(min_probability)
+        self.match_probability = float(match_probability)
+
+        # Letter classes only (SPACE/DELETE/NOTHING are control signs)
+        self.letter_indices = np.array([i for i, name in enumerate(class_names)
+                                        if len(name) == 1 and name.isalpha()], dtype=np.intp)
+        self.letters = [class_names[i].upper() for i in self.letter_indices]
+
+        self.beams = []    # [(node, letter log-probability, weakest letter probability)], best first
+        self._history = []  # Beams before each step, for pop()
+        self.reset()
+
+    def reset(self):
+        """Start a new word"""
+        self.beams = [(0, 0.0, 1.0)]
+        self._history = []
+
+    def score(self, node: int, letter_logp: float) -> float:
+        """Letter evidence plus the prefix prior (its best completion's frequency)"""
+        return letter_logp + self.lm_weight * float(self.trie.best_logp[node])
+
+    def step(self, probabilities: np.ndarray):
+        """
+        Extend the beams with one committed letter
+
+        Args:
+            probabilities: Class probability vector for the letter (e.g. smoothed)
+        """
+        letter_probabilities = np.asarray(probabilities, dtype=np.float64)[self.letter_indices]
+        total = letter_probabilities.sum()
+        if total > 0:
+            letter_probabilities = letter_probabilities / total
+        log_probabilities = dict(zip(self.letters, np.log(np.maximum(letter_probabilities, 1e-12)).tolist()))
+        candidates = {letter: float(p) for letter, p in zip(self.letters, letter_probabilities)
+                      if p >= self.min_probability}
+
+        trie = self.trie
+        extended = []
+        for node, letter_logp, weakest in self.beams:
+            start = int(trie.child_start[node])
+            for child in range(start, start + int(trie.child_count[node])):
+                letter = chr(trie.char[child])
+                if letter in candidates:
+                    extended.append((child, letter_logp + log_probabilities[letter],
+                                     min(weakest, candidates[letter])))
+
+        extended.sort(key=lambda beam: self.score(*beam[:2]), reverse=True)
+        self._history.append(self.beams)
+        self.beams = extended[:self.beam_width]
+
+    def pop(self):
+        """Undo the last step (the user deleted a letter)"""
+        if self._history:
+            self.beams = self._history.pop()
+
+    @property
+    def depth(self) -> int:
+        """Letters decoded in the current word"""
+        return len(self._history)
+
+    def suggestions(self, n: int = 3) -> List[Tuple[str, float]]:
+        """
+        Most likely dictionary words for the letters so far
+
+        Each beam whose letters all reached match_probability proposes the
+        word at its prefix (if any) and the most frequent completion under
+        each of its children.
+
+        Args:
+            n: Number of words
+
+        Returns:
+            List of (WORD, score), best first; empty before the first letter or
+            when no dictionary prefix matches the signed letters
+        """
+        if not self._history:
+            return []
+
+        trie = self.trie
+        best: Dict[str, float] = {}
+        for node, letter_logp, weakest in self.beams:
+            if weakest < self.match_probability:
+                continue
+            start = int(trie.child_start[node])
+            candidates = [(node, float(trie.word_logp[node]))] if trie.is_word(node) else []
+            candidates += [(int(trie.best_leaf[child]), float(trie.best_logp[child]))
+                           for child in range(start, start + int(trie.child_count[node]))]
+
+            for leaf, word_logp in candidates:
+                word = trie.word(leaf)
+                score = letter_logp + self.lm_weight * word_logp
+                if score > best.get(word, -np.inf):
+                    best[word] = score
+
+        return sorted(best.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def choose_word(self, letters: str, selection: Optional[str] = None) -> str:
+        """
+        The word to commit when the signer ends a word
+
+        The signed letters are kept unless the user explicitly picked one of
+        the current suggestions, so short words ("A", "I") and names outside
+        the dictionary are never rewritten.
+
+        Args:
+            letters: Letters signed so far
+            selection: Suggestion the user selected, if any
+
+        Returns:
+            Word to commit
+        """
+        if selection and selection.upper() in {word for word, _ in self.suggestions(self.beam_width)}:
+            return selection.upper()
+        return letters
@@ -1655,7 +1655,17 @@ from kivy.app import App
 import cv2
 import numpy as np
 import time
-from collections import Counter
+
+from ..core.inference_worker import InferenceWorker
+from ..core.image_processor import FramePreprocessor
+from ..core.latency_tracker import LatencyTracker
+from ..core.prediction_smoother import ProbabilitySmoother, SequentialLetterTest
+from ..core.prediction_result import PredictionResult
+from ..core.frame_gate import FrameGate, GATE_STATIC, GATE_EMPTY
+from ..core.frame_scheduler import AdaptiveFrameScheduler, STATE_ACTIVE, STATE_STABLE, STATE_IDLE
+from ..core.hand_tracker import HandTracker, MEDIAPIPE_AVAILABLE
+from ..core.word_decoder import WordTrie, BeamDecoder
+from ..core.temporal_head import TemporalHead
 
 
 class CameraScreen(Screen):
@@ -1679,11 +1689,16 @@ class CameraScreen(Screen):
         self.current_top3 = []
         self.stable_letter = None
 
-        # Stable prediction tracking
-        self.prediction_history = []
-        self.stable_threshold = 5  # ✅ Increased from 3 to 5 for more stability
+        # Stable prediction tracking (probability-space smoothing with hysteresis)
+        self.smoother = None
+        self.class_names = []
+        self.stable_threshold = 5  # ✅ Smoothing window in frames
         self.last_stable_time = 0
-        self.stable_cooldown = 3.0  # ✅ Increased from 2.0 to 3.0 seconds
+        self.stable_cooldown = 3.0  # ✅ Increased from 2.0 to 3.0 seconds (not used by the sequential test)
+
+        # ✅ Dictionary beam decoder: word completions for the letters signed so far
+        self.word_trie = None  # Loaded (mmapped) once, on the first recognition start
+        self.word_decoder = None
 
         # ✅ Speech control
         self.last_speech_time = 0
@@ -1695,12 +1710,36 @@ class CameraScreen(Screen):
         self.max_errors = 10
         self.last_error_time = 0
 
+        # ✅ Background inference (latest frame wins, results come back via Clock)
+        self.inference_worker = None
+        self.capture_interval = 1 / 15  # UI-side frame grab rate; stale frames are dropped
+        self.frame_preprocessor = None
+        self.frame_scheduler = None  # Adapts capture_interval between the fps bounds
+
+        # ✅ Motion/presence gate: skip the model on static or empty frames
+        self.frame_gate = None
+        self.empty_result = None
+
+        # ✅ Hand tracker: crop around the hand, centre crop when none is found
+        self.hand_tracker = None
+        self.last_roi_box = None
+
+        # ✅ Temporal head: motion letters (J/Z) from a window of cached frame embeddings
+        self.temporal_head = None
+
+        # ✅ Per-stage latency (shared with the engine) and optional FPS overlay
+        self.latency = None
+        self.show_fps = False
+        self.fps_event = None
+
         # UI elements
         self.prediction_label = None
         self.confidence_bar = None
         self.word_label = None
+        self.suggestion_bar = None
         self.sentence_label = None
         self.status_label = None
+        self.fps_label = None
 
         # Build UI
         self.build_ui()
@@ -1738,6 +1777,9 @@ class CameraScreen(Screen):
         status_bar = self.create_status_bar()
         main_layout.add_widget(status_bar)
 
+        # FPS / latency overlay (hidden unless show_fps is on)
+        main_layout.add_widget(self.create_fps_overlay())
+
         self.add_widget(main_layout)
 
     def create_prediction_overlay(self):
@@ -1814,16 +1856,24 @@ class CameraScreen(Screen):
             text="Word: ",
             font_size=dp(20),
             bold=True,
-            size_hint=(1, 0.5),
+            size_hint=(1, 0.4),
             color=(0, 0.7, 1, 1)  # Blue
         )
         text_layout.add_widget(self.word_label)
 
+        # Dictionary suggestions (tap one to use it instead of the signed letters)
+        self.suggestion_bar = BoxLayout(
+            orientation='horizontal',
+            size_hint=(1, 0.3),
+            spacing=dp(5)
+        )
+        text_layout.add_widget(self.suggestion_bar)
+
         # Current sentence
         self.sentence_label = Label(
             text="Sentence: ",
             font_size=dp(16),
-            size_hint=(1, 0.5),
+            size_hint=(1, 0.3),
             color=(0.2, 0.8, 0.2, 1)  # Green
         )
         text_layout.add_widget(self.sentence_label)
@@ -1906,6 +1956,28 @@ class CameraScreen(Screen):
         )
         return self.status_label
 
+    def create_fps_overlay(self):
+        """Create FPS and per-stage latency overlay"""
+        self.fps_label = Label(
+            text="",
+            font_size=dp(11),
+            halign='left',
+            valign='top',
+            pos_hint={'x': 0.06, 'top': 0.68},
+            size_hint=(0.4, 0.2),
+            color=(0, 1, 0, 1),
+            opacity=0
+        )
+        self.fps_label.bind(size=self.fps_label.setter('text_size'))
+        return self.fps_label
+
+    def get_setting(self, key, default=None):
+        """Read a setting from the app's settings manager"""
+        settings_manager = getattr(self.app, 'settings_manager', None)
+        if settings_manager:
+            return settings_manager.get_setting(key, default)
+        return default
+
     def update_overlay_rect(self, instance, value):
         """Update overlay rectangle size/position"""
         self.overlay_rect.size = instance.size
@@ -1921,6 +1993,17 @@ class CameraScreen(Screen):
         else:
             self.status_label.text = "Loading ASL model..."
 
+            # Model loads in the background; get told when it is ready
+            if hasattr(self.app, 'subscribe_model_ready'):
+                self.app.subscribe_model_ready(self.on_model_loaded)
+
+    def on_model_loaded(self, asl_engine):
+        """App callback once background model loading has finished"""
+        if asl_engine and asl_engine.model_loaded:
+            self.on_model_ready()
+        else:
+            self.status_label.text = "ASL model failed to load"
+
     def on_model_ready(self):
         """Called when ASL model is ready"""
         self.status_label.text = "Model ready. Press 'Start Recognition' to begin."
@@ -1929,7 +2012,7 @@ class CameraScreen(Screen):
 
     def toggle_recognition(self, instance):
         """Toggle ASL recognition on/off"""
-        if not self.app or not hasattr(self.app, 'asl_engine') or not self.app.asl_engine.model_loaded:
+        if not self.app or not getattr(self.app, 'asl_engine', None) or not self.app.asl_engine.model_loaded:
             self.status_label.text = "Model not loaded yet..."
             return
 
@@ -1962,12 +2045,45 @@ class CameraScreen(Screen):
         self.status_label.text = "Recognizing ASL signs..."
 
         # Reset tracking
-        self.prediction_history.clear()
+        self.smoother = self.create_smoother()
         self.last_stable_time = 0
         self.error_count = 0
 
-        # Start prediction loop (reduced frequency)
-        self.prediction_event = Clock.schedule_interval(self.predict_frame, 1 / 8)  # ✅ Reduced from 10 FPS to 8 FPS
+        # Fused crop/resize/colour stage sized for the model input
+        input_shape = getattr(self.app.asl_engine, 'input_shape', (224, 224, 3))
+        self.frame_preprocessor = FramePreprocessor(tuple(input_shape[:2]))
+        if self.hand_tracker:
+            self.hand_tracker.close()
+        self.hand_tracker = self.create_hand_tracker()
+        self.last_roi_box = None
+        self.word_decoder = self.create_word_decoder()
+        self.temporal_head = self.create_temporal_head()
+
+        # Stage timings go into the engine's tracker so get_model_info sees them
+        self.latency = getattr(self.app.asl_engine, 'latency', None) or LatencyTracker()
+        self.latency.reset()
+        self.start_fps_overlay()
+
+        # Gate in front of the model (None when disabled in settings)
+        self.frame_gate = self.create_frame_gate()
+        self.empty_result = self.create_empty_result()
+
+        # Start inference worker (model runs off the UI thread)
+        self.inference_worker = InferenceWorker(
+            self.process_frame,
+            on_result=self.on_inference_result,
+            on_error=self.on_inference_error,
+            name="CameraInferenceWorker"
+        )
+        self.inference_worker.start()
+
+        # Start frame capture loop (rate adapts between the configured bounds)
+        self.frame_scheduler = AdaptiveFrameScheduler(
+            min_fps=self.get_setting('recognition_min_fps', 2),
+            max_fps=self.get_setting('camera_fps', 30)
+        )
+        self.capture_interval = self.frame_scheduler.interval
+        self.prediction_event = Clock.schedule_interval(self.predict_frame, self.capture_interval)
 
         Logger.info("CameraScreen: Recognition started")
 
@@ -1985,6 +2101,36 @@ class CameraScreen(Screen):
         if hasattr(self, 'prediction_event'):
             self.prediction_event.cancel()
 
+        self.stop_fps_overlay()
+
+        # Stop inference worker
+        if self.inference_worker:
+            stats = self.inference_worker.get_stats()
+            self.inference_worker.stop()
+            self.inference_worker = None
+            Logger.info(f"CameraScreen: Frames processed: {stats['frames_processed']}, "
+                        f"dropped: {stats['frames_dropped']}")
+
+        if self.hand_tracker:
+            tracker_stats = self.hand_tracker.get_stats()
+            Logger.info(f"CameraScreen: Hand detections: {tracker_stats['detections']}, "
+                        f"tracked: {tracker_stats['tracked_frames']}, lost: {tracker_stats['lost_frames']}")
+            self.hand_tracker.close()
+            self.hand_tracker = None
+
+        if self.temporal_head:
+            head_stats = self.temporal_head.get_stats()
+            Logger.info(f"CameraScreen: Motion letters from {head_stats['overrides']} "
+                        f"of {head_stats['frames']} frames")
+            self.app.asl_engine.enable_embeddings(False)
+            self.temporal_head = None
+
+        if self.frame_gate:
+            gate_stats = self.frame_gate.get_stats()
+            Logger.info(f"CameraScreen: Gate skipped {gate_stats['hit_rate']:.0%} of frames "
+                        f"(static: {gate_stats['static_hits']}, empty: {gate_stats['empty_hits']}, "
+                        f"model runs: {gate_stats['frames_run']})")
+
         # Reset display
         self.prediction_label.text = "Recognition stopped"
         self.confidence_bar.value = 0
@@ -1993,109 +2139,362 @@ class CameraScreen(Screen):
         Logger.info("CameraScreen: Recognition stopped")
 
     def predict_frame(self, dt):
-        """Predict ASL from current camera frame"""
-        if not self.prediction_enabled or not self.camera:
+        """Grab the current camera frame and hand it to the inference worker"""
+        if not self.prediction_enabled or not self.camera or not self.inference_worker:
             return
 
         try:
-            # Get camera texture
+            # Get camera texture (must be read on the UI thread)
             texture = self.camera.texture
             if not texture:
                 return
 
-            # Convert texture to numpy array
-            image_data = self.texture_to_array(texture)
-            if image_data is None:
+            start = time.perf_counter()
+            data = texture.pixels
+            if not data:
                 return
+            self.latency.record('texture_read', time.perf_counter() - start)
+
+            # Newest frame replaces any frame the worker has not started yet
+            self.inference_worker.submit((data, texture.width, texture.height, texture.colorfmt))
+
+        except Exception as e:
+            self.on_prediction_error(e)
+
+    def process_frame(self, frame):
+        """Convert, crop and classify a frame (runs on the inference worker thread)"""
+        data, width, height, colorfmt = frame
+
+        # Crop around the hand (or the centre) straight from the raw texture
+        # buffer and resize/convert it to upright RGB at model size in one stage
+        start = time.perf_counter()
+        box = None
+        hand_tracker = self.hand_tracker  # Closed and cleared by stop_recognition on the UI thread
+        if hand_tracker:
+            thumbnail = self.frame_preprocessor.thumbnail(data, width, height, colorfmt)
+            if thumbnail is not None:
+                box = hand_tracker.update(thumbnail, (width, height))
+        self.last_roi_box = box
+        roi = self.frame_preprocessor.process_pixels(data, width, height, colorfmt, roi=box)
+        self.latency.record('roi', time.perf_counter() - start)
+        if roi is None:
+            return None
+
+        # Predict using ASL engine
+        asl_engine = getattr(self.app, 'asl_engine', None)
+        if not asl_engine:
+            return None
 
-            # Extract ROI (center square)
-            roi = self.extract_roi(image_data)
+        # Skip the model when nothing changed or the ROI is empty
+        gate = self.frame_gate
+        if gate:
+            decision = gate.check(roi)
+            if decision == GATE_STATIC:
+                return gate.last_result
+            if decision == GATE_EMPTY:
+                return self.empty_result
 
-            # Predict using ASL engine
-            if hasattr(self.app, 'asl_engine') and self.app.asl_engine:
-                prediction_result = self.app.asl_engine.predict(roi)
+        # PredictionResult owns its probability vector, so it can cross threads
+        result = asl_engine.predict(roi)
 
-                if prediction_result is not None:
-                    # Handle tuple format: (letter, confidence)
-                    if isinstance(prediction_result, tuple) and len(prediction_result) >= 2:
-                        letter, confidence = prediction_result[:2]
-                    else:
-                        Logger.warning("CameraScreen: Unexpected prediction format")
-                        return
+        # Re-score over the recent frames; only motion letters change the result
+        if self.temporal_head and result is not None:
+            result = self.temporal_head.apply(result, box)
 
-                    # Create synthetic top 3
-                    top_3 = self.create_synthetic_top3(letter, confidence)
+        if gate and result is not None:
+            gate.record_result(result, result[0], result[1])
 
-                    # Update stable prediction
-                    stable_letter = self.update_stable_prediction(letter, confidence)
+        return result
 
-                    # Update UI
-                    self.update_prediction_display(letter, confidence, top_3, stable_letter)
+    def on_inference_result(self, prediction_result):
+        """Worker callback: hand the result back to the UI thread"""
+        Clock.schedule_once(lambda dt: self.handle_prediction_result(prediction_result))
 
-                    # Process stable letter (with reduced frequency)
-                    if stable_letter and stable_letter != 'NOTHING':
-                        self.process_stable_letter(stable_letter, confidence)
+    def on_inference_error(self, error):
+        """Worker callback: report the error on the UI thread"""
+        Clock.schedule_once(lambda dt: self.on_prediction_error(error))
 
-                    # Reset error count on success
-                    self.error_count = 0
-                    self.frame_count += 1
+    def handle_prediction_result(self, prediction_result):
+        """Apply a prediction result to the UI (runs on the UI thread)"""
+        if not self.prediction_enabled or prediction_result is None:
+            return
+
+        try:
+            # Handle tuple format: (letter, confidence), usually a PredictionResult
+            if isinstance(prediction_result, tuple) and len(prediction_result) >= 2:
+                letter, confidence = prediction_result[:2]
+            else:
+                Logger.warning("CameraScreen: Unexpected prediction format")
+                return
+
+            # Real top 3 and probabilities from the same inference
+            if isinstance(prediction_result, PredictionResult):
+                probabilities = prediction_result.probabilities
+                top_3 = prediction_result.top_k(3)
+            else:
+                probabilities = None
+                top_3 = [(letter, confidence)]
+
+            # Update stable prediction
+            start = time.perf_counter()
+            stable_letter = self.update_stable_prediction(letter, confidence, probabilities)
+            ui_start = time.perf_counter()
+            self.latency.record('smoothing', ui_start - start)
+
+            # Update UI
+            self.update_prediction_display(letter, confidence, top_3, stable_letter)
+            self.latency.record('ui_update', time.perf_counter() - ui_start)
+            self.latency.mark_frame()
+
+            # Process stable letter (with reduced frequency)
+            if stable_letter and stable_letter != 'NOTHING':
+                self.process_stable_letter(stable_letter, confidence, self.smoother.smoothed)
+
+            # Reset error count on success
+            self.error_count = 0
+            self.frame_count += 1
+
+            self.update_capture_rate(letter, stable_letter)
 
         except Exception as e:
-            self.error_count += 1
-            current_time = time.time()
+            self.on_prediction_error(e)
 
-            # Log error (but not too frequently)
-            if current_time - self.last_error_time > 5.0:
-                Logger.error(f"CameraScreen: Prediction error: {e}")
-                self.last_error_time = current_time
+    def update_capture_rate(self, letter, stable_letter):
+        """Feed the frame scheduler and reschedule the capture loop if the rate changed"""
+        if not self.frame_scheduler:
+            return
 
-            # Stop recognition if too many errors
-            if self.error_count > self.max_errors:
-                Logger.error("CameraScreen: Too many errors, stopping recognition")
-                self.stop_recognition()
-                self.status_label.text = "Recognition stopped due to errors"
+        if self.inference_worker:
+            self.frame_scheduler.record_inference(self.inference_worker.last_process_time)
 
-    def create_synthetic_top3(self, predicted_letter, confidence):
-        """Create synthetic top 3 predictions for display"""
-        alphabet = list('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-        other_letters = [l for l in alphabet if l != predicted_letter]
+        if letter == 'NOTHING':
+            state = STATE_IDLE
+        elif stable_letter or (self.smoother and self.smoother.active_index is not None):
+            state = STATE_STABLE
+        else:
+            state = STATE_ACTIVE
 
-        top_3 = [(predicted_letter, confidence)]
+        interval = self.frame_scheduler.update(state)
+        if interval is None or not self.prediction_enabled:
+            return
 
-        if len(other_letters) >= 2:
-            import random
-            random.shuffle(other_letters)
-            top_3.append((other_letters[0], max(0.1, confidence - 0.2)))
-            top_3.append((other_letters[1], max(0.05, confidence - 0.4)))
+        self.capture_interval = interval
+        if hasattr(self, 'prediction_event'):
+            self.prediction_event.cancel()
+        self.prediction_event = Clock.schedule_interval(self.predict_frame, interval)
 
-        return top_3
+    def on_prediction_error(self, error):
+        """Count prediction errors and stop recognition if there are too many"""
+        if not self.prediction_enabled:
+            return
 
-    def update_stable_prediction(self, letter, confidence):
-        """Update stable prediction based on history"""
+        self.error_count += 1
         current_time = time.time()
 
-        # Add to history
-        self.prediction_history.append(letter)
+        # Log error (but not too frequently)
+        if current_time - self.last_error_time > 5.0:
+            Logger.error(f"CameraScreen: Prediction error: {error}")
+            self.last_error_time = current_time
 
-        # Keep only recent history
-        if len(self.prediction_history) > 15:
-            self.prediction_history = self.prediction_history[-10:]
+        # Stop recognition if too many errors
+        if self.error_count > self.max_errors:
+            Logger.error("CameraScreen: Too many errors, stopping recognition")
+            self.stop_recognition()
+            self.status_label.text = "Recognition stopped due to errors"
 
-        # Check for stable prediction
-        if len(self.prediction_history) >= self.stable_threshold:
-            # Get most common recent prediction
-            recent = self.prediction_history[-self.stable_threshold:]
-            letter_counts = Counter(recent)
-            most_common = letter_counts.most_common(1)[0]
+    def start_fps_overlay(self):
+        """Show the FPS overlay if enabled in settings"""
+        self.show_fps = bool(self.get_setting('show_fps', False))
+        if not self.show_fps or not self.fps_label:
+            return
+
+        self.fps_label.opacity = 1
+        self.fps_label.text = "FPS: --"
+        if self.fps_event is None:
+            self.fps_event = Clock.schedule_interval(self.update_fps_overlay, 0.5)
+
+    def stop_fps_overlay(self):
+        """Hide the FPS overlay"""
+        if self.fps_event is not None:
+            self.fps_event.cancel()
+            self.fps_event = None
+
+        if self.fps_label:
+            self.fps_label.opacity = 0
+
+    def update_fps_overlay(self, dt):
+        """Refresh the FPS and per-stage p50/p95 overlay"""
+        if self.latency and self.fps_label:
+            text = self.latency.format_overlay()
+            if self.frame_gate:
+                text += f"\ngate skipped: {self.frame_gate.get_stats()['hit_rate']:.0%}"
+            if self.frame_scheduler:
+                text += f"\nsampling: {self.frame_scheduler.current_fps:.0f} fps ({self.frame_scheduler.state})"
+            self.fps_label.text = text
+
+    def create_frame_gate(self):
+        """Create the motion/presence gate from settings"""
+        if not self.get_setting('gate_enabled', True):
+            return None
+
+        return FrameGate(
+            motion_threshold=self.get_setting('gate_motion_threshold', 3.0),
+            empty_threshold=self.get_setting('gate_empty_threshold', 4.0),
+            max_reuse=self.get_setting('gate_max_reuse', 30)
+        )
+
+    def create_hand_tracker(self):
+        """Create the hand tracker from settings (None when disabled)"""
+        if not self.get_setting('hand_tracking_enabled', True):
+            return None
 
-            # Check if it's stable and enough time has passed
-            if (most_common[1] >= self.stable_threshold and
-                    current_time - self.last_stable_time > self.stable_cooldown):
-                stable_letter = most_common[0]
-                self.last_stable_time = current_time
-                return stable_letter
+        # The skin-colour fallback detects faster than template matching tracks,
+        # so tracking between detections only pays off with MediaPipe
+        detect_every = self.get_setting('hand_detect_every', 10) if MEDIAPIPE_AVAILABLE else 1
 
-        return None
+        try:
+            return HandTracker(
+                detect_every=detect_every,
+                padding=self.get_setting('hand_padding', 0.25),
+                mediapipe_config=self.get_mediapipe_config()
+            )
+        except Exception as e:
+            Logger.warning(f"CameraScreen: Hand tracking unavailable, using centre crop: {e}")
+            return None
+
+    def get_mediapipe_config(self):
+        """MediaPipe Hands options from settings, keyed like the Config.mediapipe section"""
+        return {
+            'min_detection_confidence': self.get_setting('mediapipe_min_detection_confidence', 0.5),
+            'min_tracking_confidence': self.get_setting('mediapipe_min_tracking_confidence', 0.5)
+        }
+
+    def create_temporal_head(self):
+        """Create the motion-letter head and turn on engine embeddings (None when disabled)"""
+        asl_engine = getattr(self.app, 'asl_engine', None)
+        if not self.get_setting('motion_letters_enabled', True) or not hasattr(asl_engine, 'enable_embeddings'):
+            return None
+
+        asl_engine.enable_embeddings(True)
+        if not asl_engine.embeddings_enabled:
+            return None
+
+        return TemporalHead(
+            self.class_names,
+            dim=asl_engine.embedding_size,
+            window=self.get_setting('motion_window', 8)
+        )
+
+    def create_word_decoder(self):
+        """Create the dictionary beam decoder (None when word completion is off)"""
+        if not self.get_setting('auto_word_completion', True):
+            return None
+
+        try:
+            if self.word_trie is None:
+                self.word_trie = WordTrie.load()
+            decoder = BeamDecoder(self.word_trie, self.class_names)
+        except Exception as e:
+            Logger.warning(f"CameraScreen: Word completion unavailable: {e}")
+            return None
+
+        # Recognition may restart mid-word
+        self.sync_word_decoder(decoder)
+        return decoder
+
+    def sync_word_decoder(self, decoder=None):
+        """Keep the decoder on the same letters as the current word (after deletes/edits)"""
+        decoder = decoder or self.word_decoder
+        if decoder is None:
+            return
+
+        current_word = getattr(self.app, 'current_word', "") or ""
+        if decoder.depth == len(current_word):
+            return
+        if decoder.depth == len(current_word) + 1:
+            decoder.pop()
+            return
+
+        # Replay the word with certain letters (its original distributions are gone)
+        decoder.reset()
+        for letter in current_word.upper():
+            if letter in self.class_names:
+                probabilities = np.zeros(len(self.class_names), dtype=np.float32)
+                probabilities[self.class_names.index(letter)] = 1.0
+                decoder.step(probabilities)
+
+    def get_word_suggestions(self, n=3):
+        """Dictionary completions for the current word"""
+        if self.word_decoder is None:
+            return []
+        return [word for word, _ in self.word_decoder.suggestions(n)]
+
+    def create_empty_result(self):
+        """The NOTHING result returned for frames the gate judged empty"""
+        class_names = self.class_names
+        if 'NOTHING' not in class_names:
+            return PredictionResult('NOTHING', 1.0)
+
+        index = class_names.index('NOTHING')
+        probabilities = np.zeros(len(class_names), dtype=np.float32)
+        probabilities[index] = 1.0
+        return PredictionResult('NOTHING', 1.0, probabilities, class_names, index)
+
+    def create_smoother(self):
+        """Create the probability smoother from settings and the engine's classes"""
+        asl_engine = getattr(self.app, 'asl_engine', None)
+        self.class_names = list(getattr(asl_engine, 'class_names', None) or
+                                list('ABCDEFGHIJKLMNOPQRSTUVWXYZ') + ['SPACE', 'DELETE', 'NOTHING'])
+
+        mode = self.get_setting('smoothing_mode', 'sprt')
+        if mode == 'sprt':
+            # Commits on accumulated evidence; a NOTHING gap re-arms instead of a cooldown
+            return SequentialLetterTest(
+                len(self.class_names),
+                nothing_index=self.class_names.index('NOTHING') if 'NOTHING' in self.class_names else None,
+                error_rate=self.get_setting('sprt_error_rate', 0.02),
+                decay=self.get_setting('sprt_decay', 0.8),
+                alpha=self.get_setting('smoothing_alpha', 0.5)
+            )
+
+        enter_threshold = self.get_setting('smoothing_enter_threshold', 0.6)
+        exit_threshold = min(self.get_setting('smoothing_exit_threshold', 0.3), enter_threshold)
+
+        return ProbabilitySmoother(
+            len(self.class_names),
+            mode=mode,
+            window=self.stable_threshold,
+            alpha=self.get_setting('smoothing_alpha', 0.5),
+            enter_threshold=enter_threshold,
+            exit_threshold=exit_threshold
+        )
+
+    def update_stable_prediction(self, letter, confidence, probabilities=None):
+        """Update stable prediction from smoothed class probabilities"""
+        if self.smoother is None:
+            self.smoother = self.create_smoother()
+
+        if probabilities is None:
+            # Demo mode / label-only results: put the confidence on the predicted class
+            probabilities = np.zeros(len(self.class_names), dtype=np.float32)
+            if letter in self.class_names:
+                probabilities[self.class_names.index(letter)] = confidence
+
+        committed_index = self.smoother.update(probabilities)
+        if committed_index is None:
+            return None
+
+        if isinstance(self.smoother, SequentialLetterTest):
+            return self.class_names[committed_index]
+
+        # Respect the cooldown; release the letter so it can commit once it ends
+        current_time = time.time()
+        if current_time - self.last_stable_time <= self.stable_cooldown:
+            self.smoother.active_index = None
+            return None
+
+        self.last_stable_time = current_time
+        return self.class_names[committed_index]
 
     def texture_to_array(self, texture):
         """Convert Kivy texture to numpy array"""
@@ -2104,13 +2503,21 @@ class CameraScreen(Screen):
             if not data:
                 return None
 
+            return self.pixels_to_array(data, texture.width, texture.height, texture.colorfmt)
+
+        except Exception as e:
+            Logger.error(f"CameraScreen: Texture conversion failed: {e}")
+            return None
+
+    def pixels_to_array(self, data, w, h, colorfmt):
+        """Convert raw texture pixels to a BGR numpy array"""
+        try:
             arr = np.frombuffer(data, dtype=np.uint8)
-            w, h = texture.width, texture.height
 
-            if texture.colorfmt == 'rgba':
+            if colorfmt == 'rgba':
                 arr = arr.reshape((h, w, 4))
                 arr = cv2.cvtColor(arr, cv2.COLOR_RGBA2BGR)
-            elif texture.colorfmt == 'rgb':
+            elif colorfmt == 'rgb':
                 arr = arr.reshape((h, w, 3))
                 arr = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
             else:
@@ -2121,7 +2528,7 @@ class CameraScreen(Screen):
             return arr
 
         except Exception as e:
-            Logger.error(f"CameraScreen: Texture conversion failed: {e}")
+            Logger.error(f"CameraScreen: Pixel conversion failed: {e}")
             return None
 
     def extract_roi(self, image):
@@ -2166,13 +2573,15 @@ class CameraScreen(Screen):
             top3_text = " | ".join([f"{l}: {c:.2f}" for l, c in top_3[:3]])
             self.top3_label.text = f"Top 3: {top3_text}"
 
-    def process_stable_letter(self, letter, confidence):
-        """Process a stable letter detection"""
+    def process_stable_letter(self, letter, confidence, probabilities=None):
+        """Process a stable letter detection (probabilities feed the word decoder)"""
         if letter == 'SPACE':
             self.complete_word()
         elif letter == 'DELETE':
             self.delete_letter()
         elif letter.isalpha():
+            word_length = len(getattr(self.app, 'current_word', "") or "")
+
             # Add letter to current word
             if hasattr(self.app, 'add_letter'):
                 self.app.add_letter(letter, confidence)
@@ -2182,6 +2591,14 @@ class CameraScreen(Screen):
                     self.app.current_word = ""
                 self.app.current_word += letter
 
+            # The app drops repeated letters; only step the decoder if one was added
+            if self.word_decoder and len(getattr(self.app, 'current_word', "")) > word_length:
+                if probabilities is None:
+                    probabilities = np.zeros(len(self.class_names), dtype=np.float32)
+                    if letter in self.class_names:
+                        probabilities[self.class_names.index(letter)] = 1.0
+                self.word_decoder.step(probabilities)
+
             self.update_text_display()
 
             # ✅ Speak letter with rate limiting
@@ -2202,10 +2619,32 @@ class CameraScreen(Screen):
         current_sentence = getattr(self.app, 'current_sentence', "")
 
         self.word_label.text = f"Word: {current_word}"
+        self.update_suggestion_bar(self.get_word_suggestions() if current_word else [])
         self.sentence_label.text = f"Sentence: {current_sentence}"
 
-    def complete_word(self, instance=None):
-        """Complete current word"""
+    def update_suggestion_bar(self, suggestions):
+        """Show one button per dictionary suggestion"""
+        if self.suggestion_bar is None:
+            return
+
+        self.suggestion_bar.clear_widgets()
+        for word in suggestions:
+            button = Button(
+                text=word,
+                font_size=dp(14),
+                background_color=(0, 0.5, 1, 1)  # Blue
+            )
+            button.bind(on_press=lambda instance, word=word: self.complete_word(selection=word))
+            self.suggestion_bar.add_widget(button)
+
+    def complete_word(self, instance=None, selection=None):
+        """Complete current word (SPACE keeps the signed letters; a tapped suggestion replaces them)"""
+        current_word = getattr(self.app, 'current_word', "")
+        if self.word_decoder:
+            if current_word:
+                self.app.current_word = self.word_decoder.choose_word(current_word, selection)
+            self.word_decoder.reset()
+
         if hasattr(self.app, 'complete_word'):
             completed_word = self.app.complete_word()
         else:
@@ -2246,6 +2685,7 @@ class CameraScreen(Screen):
             if hasattr(self.app, 'current_word') and self.app.current_word:
                 self.app.current_word = self.app.current_word[:-1]
 
+        self.sync_word_decoder()
         self.update_text_display()
 
     def speak_sentence(self, instance=None):
@@ -2303,4 +2743,6 @@ class CameraScreen(Screen):
             self.app.current_word = ""
         if hasattr(self.app, 'current_sentence'):
             self.app.current_sentence = ""
+        if self.word_decoder:
+            self.word_decoder.reset()
         self.update_text_display()
\ No newline at end of file
@@ -124,12 +124,28 @@ class HomeScreen(Screen):
         """Called when entering this screen"""
         self.app = App.get_running_app()
 
-        # Schedule model status check
-        Clock.schedule_once(self.check_model_status, 0.5)
-        Clock.schedule_interval(self.update_model_status, 2.0)
+        # Model loads in the background; update once it is ready
+        if hasattr(self.app, 'subscribe_model_ready'):
+            if not getattr(self.app, 'model_ready', False):
+                self.show_loading_status()
+            self.app.subscribe_model_ready(self.on_model_ready)
+        else:
+            Clock.schedule_once(self.check_model_status, 0.5)
 
         print("🏠 Home screen opened")
 
+    def show_loading_status(self):
+        """Show that the model is still loading"""
+        self.status_label.text = "⏳ Loading ASL Model..."
+        self.status_label.color = (1, 1, 0, 1)  # Yellow
+
+        self.start_button.disabled = True
+        self.start_button.text = "⏳ Please wait..."
+
+    def on_model_ready(self, asl_engine):
+        """Called by the app once background model loading has finished"""
+        self.check_model_status(0)
+
     def check_model_status(self, dt):
         """Check initial model status"""
         if not self.app:
@@ -187,7 +203,7 @@ class HomeScreen(Screen):
 
     def start_camera(self, instance):
         """Start the camera screen"""
-        if self.app and self.app.is_model_loaded:
+        if self.app and getattr(self.app, 'is_model_loaded', False):
             print("🎥 Starting camera screen...")
             self.app.switch_screen('camera')
         else:
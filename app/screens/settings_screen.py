@@ -22,6 +22,7 @@ class SettingsScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(name='settings', **kwargs)
         self.settings_manager = None
+        self.show_fps_switch = None
         self.build_ui()
 
     def build_ui(self):
@@ -233,10 +234,12 @@ class SettingsScreen(Screen):
         layout.add_widget(show_conf_layout)
 
         # Show FPS
+        self.show_fps_switch = Switch(active=False)
+        self.show_fps_switch.bind(active=self.on_show_fps_changed)
         fps_layout = self.create_setting_row(
             "Show FPS",
-            "Display frames per second counter",
-            Switch(active=False)
+            "Display frames per second and per-stage latency",
+            self.show_fps_switch
         )
         layout.add_widget(fps_layout)
 
@@ -516,6 +519,11 @@ class SettingsScreen(Screen):
                 # TODO: Show success popup with file location
                 print(f"📤 Settings exported to: {export_file}")
 
+    def on_show_fps_changed(self, instance, value):
+        """Store the FPS overlay toggle"""
+        if self.settings_manager:
+            self.settings_manager.set_setting('show_fps', value)
+
     def browse_model(self, instance):
         """Browse for model file"""
         # TODO: Implement file browser for model selection
@@ -535,4 +543,6 @@ class SettingsScreen(Screen):
         """Called before entering the screen"""
         app = App.get_running_app()
         self.settings_manager = getattr(app, 'settings_manager', None)
-        # TODO: Load current settings into UI controls
\ No newline at end of file
+        # TODO: Load current settings into UI controls
+        if self.settings_manager and self.show_fps_switch:
+            self.show_fps_switch.active = bool(self.settings_manager.get_setting('show_fps', False))
\ No newline at end of file
@@ -110,8 +110,8 @@ except ImportError as e:
 # Import your core classes
 try:
     from app.core.settings_manager import SettingsManager
-    from app.core.asl_engine import ASLEngine
     from app.core.speech_engine import SpeechEngine
+    from app.core.model_loader import ModelLoader
 
     logger.info("✅ Core classes imported successfully")
 except ImportError as e:
@@ -149,6 +149,11 @@ class ASLMobileApp(App):
         self.speech_engine = None
         self.screen_manager = None
 
+        # ✅ Background model loading (TensorFlow import + model load)
+        self.model_loader = None
+        self.model_ready = False
+        self.model_ready_callbacks = []
+
         # App state
         self.is_initialized = False
 
@@ -176,11 +181,8 @@ class ASLMobileApp(App):
 
             logger.info("🎯 ASL Mobile App started successfully")
 
-            # Try to log status, but don't crash if it fails
-            try:
-                self.log_status()
-            except Exception as e:
-                logger.warning(f"⚠️ Could not log status: {e}")
+            # Load the model once the window is up
+            self.start_model_loading()
 
             return sm
 
@@ -197,26 +199,6 @@ class ASLMobileApp(App):
             self.settings_manager = SettingsManager()
             logger.info("⚙️ Settings manager initialized")
 
-            # Initialize ASL engine
-            self.asl_engine = ASLEngine()
-
-            # Try to load lite model if it exists
-            model_path = self.settings_manager.get_setting('model_path', 'assets/models/best_model.tflite')
-            if os.path.exists(model_path):
-                logger.info(f"🔄 Loading TensorFlow Lite model from {model_path}")
-                success = self.asl_engine.load_model(model_path)
-                if success:
-                    logger.info("✅ TensorFlow Lite model loaded successfully")
-                else:
-                    logger.warning("⚠️ TensorFlow Lite model failed to load")
-            else:
-                logger.info(f"📁 TensorFlow Lite model not found at {model_path}")
-                logger.info("💡 Place your .tflite model at: assets/models/best_model.tflite")
-
-            logger.info(f"🤖 ASL engine initialized (model_loaded: {self.asl_engine.model_loaded})")
-            logger.info(f"   Model type: {self.asl_engine.model_type}")
-            logger.info(f"   Demo mode: {self.asl_engine.demo_mode}")
-
             # Initialize speech engine (async)
             logger.info("🔊 Initializing Speech Engine (non-blocking)...")
             self.speech_engine = SpeechEngine()
@@ -228,6 +210,98 @@ class ASLMobileApp(App):
             logger.error(f"❌ Failed to initialize core components: {e}")
             return False
 
+    def start_model_loading(self):
+        """Import TensorFlow and load the ASL model in a background thread"""
+        if self.model_loader:
+            return
+
+        logger.info("🔄 Loading ASL model in the background...")
+        self.model_loader = ModelLoader(self.load_asl_engine)
+        self.model_loader.subscribe(lambda loader: Clock.schedule_once(self.on_model_loaded))
+        self.model_loader.start()
+
+    def load_asl_engine(self):
+        """Create the ASL engine and load the model (runs on the loader thread)"""
+        # Imported here: this is where TensorFlow gets loaded
+        from app.core.asl_engine import ASLEngine
+
+        asl_engine = ASLEngine(
+            num_threads=self.settings_manager.get_setting('tflite_num_threads', 0),
+            use_xnnpack=self.settings_manager.get_setting('tflite_use_xnnpack', True),
+            auto_tune_threads=self.settings_manager.get_setting('tflite_auto_tune', False),
+            warmup_runs=self.settings_manager.get_setting('model_warmup_runs', 3)
+        )
+
+        # Try to load lite model if it exists
+        model_path = self.settings_manager.get_setting('model_path', 'assets/models/best_model.tflite')
+        if os.path.exists(model_path):
+            logger.info(f"🔄 Loading TensorFlow Lite model from {model_path}")
+            success = asl_engine.load_model(model_path)
+            if success:
+                logger.info("✅ TensorFlow Lite model loaded successfully")
+                self.save_tuned_threads(asl_engine)
+            else:
+                logger.warning("⚠️ TensorFlow Lite model failed to load")
+        else:
+            logger.info(f"📁 TensorFlow Lite model not found at {model_path}")
+            logger.info("💡 Place your .tflite model at: assets/models/best_model.tflite")
+
+        logger.info(f"🤖 ASL engine initialized (model_loaded: {asl_engine.model_loaded})")
+        logger.info(f"   Model type: {asl_engine.model_type}")
+        logger.info(f"   Demo mode: {asl_engine.demo_mode}")
+
+        return asl_engine
+
+    def on_model_loaded(self, dt=None):
+        """Publish the loaded engine and notify subscribers (runs on the UI thread)"""
+        if self.model_loader.error:
+            logger.error(f"❌ Failed to load ASL engine: {self.model_loader.error}")
+        else:
+            self.asl_engine = self.model_loader.result
+            logger.info(f"⏱️ ASL engine ready after {self.model_loader.load_time:.2f}s")
+
+        self.model_ready = True
+        callbacks, self.model_ready_callbacks = self.model_ready_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self.asl_engine)
+            except Exception as e:
+                logger.error(f"❌ Model ready callback failed: {e}")
+
+        # Try to log status, but don't crash if it fails
+        try:
+            self.log_status()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not log status: {e}")
+
+    def subscribe_model_ready(self, callback):
+        """
+        Call back when the ASL engine has finished loading
+
+        Callbacks run on the UI thread with the engine (None if loading
+        failed). If loading already finished, the callback runs right away.
+
+        Args:
+            callback: Function taking the ASL engine
+        """
+        if self.model_ready:
+            callback(self.asl_engine)
+        else:
+            self.model_ready_callbacks.append(callback)
+
+    def save_tuned_threads(self, asl_engine):
+        """Persist the auto-tuned TFLite thread count so later startups skip the benchmark"""
+        if not self.settings_manager.get_setting('tflite_auto_tune', False):
+            return
+
+        if asl_engine.thread_timings:
+            logger.info(f"⏱️ Auto-tuned TFLite threads: {asl_engine.num_threads}")
+            self.settings_manager.update_settings({
+                'tflite_num_threads': asl_engine.num_threads,
+                'tflite_auto_tune': False
+            })
+            self.settings_manager.save_settings()
+
     def build_screen_manager(self):
         """Build the screen manager with all screens"""
         try:
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Batch Classifier - Offline ASL classification over image directories
+Decodes images in a process pool and feeds fixed-size batches to ASLPredictor
+
+Usage:
+    python scripts/batch_classify.py data/frames --output results.jsonl
+    python scripts/batch_classify.py data/frames --output results.csv --batch-size 64 --workers 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Allow running from the repository root or the scripts directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.constants import ASL_CLASSES, INPUT_SIZE
+from app.core.predictor import ASLPredictor
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp'}
+
+
+def find_images(root: str) -> List[str]:
+    """Walk a directory tree and return image paths in a stable order"""
+    image_paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if Path(filename).suffix.lower() in IMAGE_EXTENSIONS:
+                image_paths.append(os.path.join(dirpath, filename))
+    return image_paths
+
+
+def decode_chunk(paths: List[str], input_size: int) -> Tuple[List[str], Optional[np.ndarray], List[str]]:
+    """
+    Decode and resize a chunk of images (runs in a worker process)
+
+    Images are returned as uint8 so only a quarter of the float32 bytes
+    cross the process boundary; normalization happens in the parent.
+
+    Returns:
+        Tuple of (decoded paths, uint8 array (N, H, W, 3), failed paths)
+    """
+    decoded_paths = []
+    images = []
+    failed = []
+
+    for path in paths:
+        image = cv2.imread(path)
+        if image is None:
+            failed.append(path)
+            continue
+
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = cv2.resize(image, (input_size, input_size))
+        decoded_paths.append(path)
+        images.append(image)
+
+    if not images:
+        return decoded_paths, None, failed
+
+    return decoded_paths, np.stack(images), failed
+
+
+class ResultWriter:
+    """Streams prediction rows to JSONL or CSV"""
+
+    def __init__(self, output_path: Optional[str]):
+        self.output_path = output_path
+        self.format = 'csv' if output_path and output_path.lower().endswith('.csv') else 'jsonl'
+        self.file = open(output_path, 'w', newline='', encoding='utf-8') if output_path else sys.stdout
+        self.csv_writer = None
+
+        if self.format == 'csv':
+            self.csv_writer = csv.writer(self.file)
+            self.csv_writer.writerow(['path', 'label', 'confidence', 'top_k'])
+
+    def write_rows(self, paths: List[str], top_k: List[List[Tuple[str, float]]]):
+        """Write one row per image and flush so results stream as batches finish"""
+        for path, predictions in zip(paths, top_k):
+            label, confidence = predictions[0] if predictions else (None, 0.0)
+
+            if self.csv_writer:
+                top_k_text = ";".join(f"{name}:{score:.4f}" for name, score in predictions)
+                self.csv_writer.writerow([path, label, f"{confidence:.6f}", top_k_text])
+            else:
+                self.file.write(json.dumps({
+                    'path': path,
+                    'label': label,
+                    'confidence': confidence,
+                    'top_k': [[name, score] for name, score in predictions]
+                }) + "\n")
+
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+def format_histogram(values_ms: List[float], bins: int = 10, width: int = 40) -> str:
+    """Render a text histogram of latencies in milliseconds"""
+    if not values_ms:
+        return "  (no samples)"
+
+    counts, edges = np.histogram(values_ms, bins=bins)
+    peak = counts.max() or 1
+
+    lines = []
+    for count, low, high in zip(counts, edges[:-1], edges[1:]):
+        bar = "#" * int(round(width * count / peak))
+        lines.append(f"  {low:8.2f} - {high:8.2f} ms | {bar} {count}")
+    return "\n".join(lines)
+
+
+def load_predictor(model_path: str, num_threads: int, input_size: int) -> ASLPredictor:
+    """Create an ASLPredictor for the given model file"""
+    config = SimpleNamespace(class_labels=ASL_CLASSES, model=SimpleNamespace(input_size=input_size))
+    predictor = ASLPredictor(config)
+
+    if model_path.endswith('.tflite'):
+        loaded = predictor.load_tflite_model(model_path, num_threads=num_threads or None)
+    else:
+        loaded = predictor.load_model(model_path)
+
+    if not loaded:
+        raise SystemExit(f"❌ Could not load model: {model_path}")
+
+    return predictor
+
+
+def classify_directory(args) -> int:
+    """Run the batch classification pipeline"""
+    image_paths = find_images(args.input_dir)
+    if not image_paths:
+        print(f"❌ No images found in {args.input_dir}", file=sys.stderr)
+        return 1
+
+    print(f"📂 Found {len(image_paths)} images in {args.input_dir}", file=sys.stderr)
+
+    predictor = load_predictor(args.model, args.num_threads, args.input_size)
+    writer = ResultWriter(args.output)
+
+    chunks = [image_paths[i:i + args.batch_size] for i in range(0, len(image_paths), args.batch_size)]
+    max_in_flight = args.workers * 2  # Bound memory: decoded batches waiting for the model
+
+    batch_latencies = []
+    image_latencies = []
+    classified = 0
+    failed = 0
+    start_time = time.perf_counter()
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            pending = set()
+            next_chunk = 0
+
+            while next_chunk < len(chunks) or pending:
+                # Keep the decode pool busy while the model works on finished batches
+                while next_chunk < len(chunks) and len(pending) < max_in_flight:
+                    pending.add(pool.submit(decode_chunk, chunks[next_chunk], args.input_size))
+                    next_chunk += 1
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    paths, images, failed_paths = future.result()
+                    failed += len(failed_paths)
+                    for path in failed_paths:
+                        print(f"⚠️ Could not decode {path}", file=sys.stderr)
+
+                    if images is None:
+                        continue
+
+                    batch_start = time.perf_counter()
+                    batch = images.astype(np.float32)
+                    batch /= 255.0
+                    probabilities = predictor.predict_batch_probabilities(batch)
+                    batch_time = (time.perf_counter() - batch_start) * 1000
+
+                    if probabilities is None:
+                        failed += len(paths)
+                        continue
+
+                    writer.write_rows(paths, predictor.top_k_from_probabilities(probabilities, args.top_k))
+
+                    batch_latencies.append(batch_time)
+                    image_latencies.extend([batch_time / len(paths)] * len(paths))
+                    classified += len(paths)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start_time
+    images_per_sec = classified / elapsed if elapsed > 0 else 0.0
+
+    print("\n📊 Batch classification summary", file=sys.stderr)
+    print(f"   Classified: {classified}  Failed: {failed}", file=sys.stderr)
+    print(f"   Wall time: {elapsed:.2f}s  Throughput: {images_per_sec:.1f} images/sec", file=sys.stderr)
+    if batch_latencies:
+        p50, p95, p99 = np.percentile(image_latencies, [50, 95, 99])
+        print(f"   Per-image model latency: p50 {p50:.2f}ms  p95 {p95:.2f}ms  p99 {p99:.2f}ms", file=sys.stderr)
+        print("   Per-batch model latency histogram:", file=sys.stderr)
+        print(format_histogram(batch_latencies), file=sys.stderr)
+
+    return 0 if classified else 1
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Classify a directory tree of ASL images")
+    parser.add_argument('input_dir', help="Directory to walk for images")
+    parser.add_argument('--model', default='assets/models/best_model.tflite', help="Model file (.tflite or .h5)")
+    parser.add_argument('--output', default=None, help="Output file (.jsonl or .csv, default: JSONL to stdout)")
+    parser.add_argument('--batch-size', type=int, default=32, help="Images per model call")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Decode processes")
+    parser.add_argument('--top-k', type=int, default=3, help="Predictions to keep per image")
+    parser.add_argument('--input-size', type=int, default=INPUT_SIZE, help="Model input size in pixels")
+    parser.add_argument('--num-threads', type=int, default=0, help="TFLite threads (0 = default)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    return classify_directory(parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,849 @@
+#!/usr/bin/env python3
+"""
+Inference Benchmarks - Headless micro-benchmarks for the recognition hot paths
+Runs on synthetic frames, reports p50/p95/p99 latency and throughput, and
+compares against a saved JSON baseline to flag regressions
+
+Usage:
+    python scripts/benchmark_inference.py --output bench_baseline.json
+    python scripts/benchmark_inference.py --compare bench_baseline.json --tolerance 0.15
+    python scripts/benchmark_inference.py --only preprocess --iterations 500
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# Allow running from the repository root or the scripts directory
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+MODEL_PATH = ROOT / "assets" / "models" / "best_model.tflite"
+FRAME_HEIGHT, FRAME_WIDTH = 480, 640
+NUM_CLASSES = 29
+
+# name -> setup function returning the callable to time
+BENCHMARKS: Dict[str, Callable[[SimpleNamespace], Callable[[], Any]]] = {}
+
+
+class SkipBenchmark(Exception):
+    """Raised by a setup function when its dependencies are missing"""
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function"""
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def make_context(seed: int = 0) -> SimpleNamespace:
+    """Synthetic inputs shared by all benchmarks"""
+    rng = np.random.default_rng(seed)
+    rgba = rng.integers(0, 256, size=(FRAME_HEIGHT, FRAME_WIDTH, 4), dtype=np.uint8)
+    return SimpleNamespace(
+        rng=rng,
+        texture=SimpleNamespace(pixels=rgba.tobytes(), width=FRAME_WIDTH, height=FRAME_HEIGHT, colorfmt='rgba'),
+        roi=rng.integers(0, 256, size=(240, 240, 3), dtype=np.uint8),
+        letters=[chr(ord('A') + int(i)) for i in rng.integers(0, 3, size=1000)],
+        probabilities=rng.dirichlet(np.ones(NUM_CLASSES), size=1000).astype(np.float32),
+        cache={}
+    )
+
+
+def _tflite_engine(ctx):
+    """Load (once) an ASLEngine with the bundled TFLite model"""
+    if 'tflite_engine' not in ctx.cache:
+        from app.core import asl_engine
+        if asl_engine.MODEL_TYPE != 'tflite' or not MODEL_PATH.exists():
+            raise SkipBenchmark("TensorFlow Lite or bundled model not available")
+
+        engine = asl_engine.ASLEngine()
+        if not engine.load_model(str(MODEL_PATH)):
+            raise SkipBenchmark("bundled model failed to load")
+        ctx.cache['tflite_engine'] = engine
+    return ctx.cache['tflite_engine']
+
+
+def _camera_screen():
+    """An un-initialized CameraScreen so its frame helpers can run headless"""
+    try:
+        from app.screens.camera_screen import CameraScreen
+    except Exception as e:
+        raise SkipBenchmark(f"CameraScreen unavailable: {e}")
+
+    screen = CameraScreen.__new__(CameraScreen)
+    screen.app = None
+    screen.smoother = None
+    screen.stable_threshold = 5
+    screen.last_stable_time = 0
+    screen.stable_cooldown = 3.0
+    return screen
+
+
+class CounterVote:
+    """The original argmax-label vote (kept as the smoothing baseline)"""
+
+    def __init__(self, stable_threshold: int = 5):
+        self.prediction_history = []
+        self.stable_threshold = stable_threshold
+
+    def update(self, letter):
+        self.prediction_history.append(letter)
+        if len(self.prediction_history) > 15:
+            self.prediction_history = self.prediction_history[-10:]
+
+        if len(self.prediction_history) >= self.stable_threshold:
+            recent = self.prediction_history[-self.stable_threshold:]
+            most_common = Counter(recent).most_common(1)[0]
+            if most_common[1] >= self.stable_threshold:
+                return most_common[0]
+        return None
+
+
+@benchmark('engine.preprocess_image')
+def bench_preprocess_image(ctx):
+    from app.core.asl_engine import ASLEngine
+    engine = ASLEngine()
+    return lambda: engine.preprocess_image(ctx.roi)
+
+
+@benchmark('engine.predict.tflite')
+def bench_predict_tflite(ctx):
+    engine = _tflite_engine(ctx)
+    return lambda: engine.predict(ctx.roi)
+
+
+@benchmark('engine.predict.tflite+temporal_head')
+def bench_predict_temporal_head(ctx):
+    from app.core.temporal_head import TemporalHead
+    engine = _tflite_engine(ctx)
+    head = TemporalHead(engine.class_names, dim=engine.embedding_size)
+    box = (100, 100, 300, 300)
+
+    def run():
+        # The engine is shared with the other cases, which run without embeddings
+        engine.enable_embeddings(True)
+        try:
+            return head.apply(engine.predict(ctx.roi), box)
+        finally:
+            engine.enable_embeddings(False)
+    return run
+
+
+@benchmark('engine.predict.demo')
+def bench_predict_demo(ctx):
+    from app.core.asl_engine import ASLEngine
+    engine = ASLEngine()
+    engine.demo_mode = True
+    return lambda: engine.predict(ctx.roi)
+
+
+@benchmark('camera.texture_to_array+extract_roi')
+def bench_texture_to_roi(ctx):
+    screen = _camera_screen()
+    return lambda: screen.extract_roi(screen.texture_to_array(ctx.texture))
+
+
+@benchmark('camera.fused_preprocess')
+def bench_fused_preprocess(ctx):
+    from app.core.image_processor import FramePreprocessor
+    preprocessor = FramePreprocessor((224, 224))
+    texture = ctx.texture
+    return lambda: preprocessor.process_pixels(texture.pixels, texture.width, texture.height, texture.colorfmt)
+
+
+@benchmark('camera.hand_tracked_preprocess')
+def bench_hand_tracked_preprocess(ctx):
+    """Thumbnail + skin-colour hand localization + crop around the hand, on a moving hand"""
+    import cv2
+    from app.core.hand_tracker import HandTracker, SkinDetector
+    from app.core.image_processor import FramePreprocessor
+    preprocessor = FramePreprocessor((224, 224))
+    tracker = HandTracker(detect_every=1, detector=SkinDetector())  # As the camera runs it without MediaPipe
+
+    frames = []
+    for step in range(20):
+        upright = np.full((FRAME_HEIGHT, FRAME_WIDTH, 4), (60, 80, 120, 255), dtype=np.uint8)
+        centre = (FRAME_WIDTH // 3 + 6 * step, FRAME_HEIGHT // 2)
+        cv2.ellipse(upright, centre, (50, 80), 0, 0, 360, (200, 150, 120, 255), -1)
+        frames.append(np.ascontiguousarray(upright[::-1]).tobytes())
+    state = {'i': 0}
+
+    def run():
+        data = frames[state['i'] % len(frames)]
+        state['i'] += 1
+        thumbnail = preprocessor.thumbnail(data, FRAME_WIDTH, FRAME_HEIGHT, 'rgba')
+        box = tracker.update(thumbnail, (FRAME_WIDTH, FRAME_HEIGHT))
+        return preprocessor.process_pixels(data, FRAME_WIDTH, FRAME_HEIGHT, 'rgba', roi=box)
+    return run
+
+
+@benchmark('gate.check')
+def bench_gate_check(ctx):
+    from app.core.frame_gate import FrameGate
+    gate = FrameGate()
+    roi = ctx.roi
+    return lambda: gate.check(roi)
+
+
+@benchmark('engine.predict.tflite.gated_idle')
+def bench_gated_predict_idle(ctx):
+    """Static kiosk scene: the gate reuses the last result (max_reuse forces periodic refreshes)"""
+    from app.core.frame_gate import FrameGate, GATE_RUN
+    engine = _tflite_engine(ctx)
+    gate = FrameGate()
+    roi = ctx.roi
+
+    def run():
+        if gate.check(roi) == GATE_RUN:
+            result = engine.predict(roi)
+            gate.record_result(result, result[0], result[1])
+            return result
+        return gate.last_result
+    return run
+
+
+@benchmark('model_manager.predict')
+def bench_model_manager_predict(ctx):
+    from app.core.model_manager import ModelManager, TENSORFLOW_AVAILABLE
+    if not TENSORFLOW_AVAILABLE or not MODEL_PATH.exists():
+        raise SkipBenchmark("TensorFlow or bundled model not available")
+
+    manager = ModelManager(str(MODEL_PATH))
+    if not manager.is_loaded:
+        raise SkipBenchmark("bundled model failed to load")
+
+    image = (ctx.rng.random((1, *manager.input_shape)).astype(np.float32))
+    return lambda: manager.predict(image)
+
+
+@benchmark('smoothing.update_stable_prediction')
+def bench_update_stable_prediction(ctx):
+    screen = _camera_screen()
+    letters, probabilities = ctx.letters, ctx.probabilities
+    state = {'i': 0}
+
+    def run():
+        i = state['i'] = (state['i'] + 1) % len(letters)
+        return screen.update_stable_prediction(letters[i], 0.9, probabilities[i])
+    return run
+
+
+@benchmark('smoothing.counter_vote')
+def bench_counter_vote(ctx):
+    vote = CounterVote()
+    letters = ctx.letters
+    state = {'i': 0}
+
+    def run():
+        state['i'] = (state['i'] + 1) % len(letters)
+        return vote.update(letters[state['i']])
+    return run
+
+
+def _bench_probability_smoother(ctx, mode):
+    from app.core.prediction_smoother import ProbabilitySmoother
+    smoother = ProbabilitySmoother(NUM_CLASSES, mode=mode)
+    probabilities = ctx.probabilities
+    state = {'i': 0}
+
+    def run():
+        state['i'] = (state['i'] + 1) % len(probabilities)
+        return smoother.update(probabilities[state['i']])
+    return run
+
+
+@benchmark('smoothing.probability_smoother.ema')
+def bench_probability_smoother_ema(ctx):
+    return _bench_probability_smoother(ctx, 'ema')
+
+
+@benchmark('smoothing.probability_smoother.window')
+def bench_probability_smoother_window(ctx):
+    return _bench_probability_smoother(ctx, 'window')
+
+
+@benchmark('smoothing.helpers.smooth_predictions')
+def bench_helpers_smooth_predictions(ctx):
+    from app.utils.helpers import smooth_predictions
+    recent = ctx.letters[:15]
+    return lambda: smooth_predictions(recent)
+
+
+@benchmark('word_decoder.step+suggestions')
+def bench_word_decoder(ctx):
+    from app.core.word_decoder import BeamDecoder, WordTrie, read_word_list, DEFAULT_WORD_LIST
+    trie = WordTrie.build(read_word_list(ROOT / DEFAULT_WORD_LIST))
+    class_names = [chr(ord('A') + i) for i in range(26)] + ['SPACE', 'DELETE', 'NOTHING']
+    decoder = BeamDecoder(trie, class_names)
+    probabilities = ctx.probabilities
+
+    def run():
+        if decoder.depth >= 4:
+            decoder.reset()
+        decoder.step(probabilities[decoder.depth])
+        return decoder.suggestions(3)
+    return run
+
+
+def synthetic_sign_stream(rng, target: int, frames: int, flip_rate: float = 0.2) -> np.ndarray:
+    """
+    Noisy softmax outputs for a held sign
+
+    The target class gets 0.45-0.95 of the mass; on `flip_rate` of frames a
+    random distractor briefly wins, as happens with motion blur.
+    """
+    stream = rng.dirichlet(np.full(NUM_CLASSES, 0.3), size=frames)
+    for frame in stream:
+        share = rng.uniform(0.45, 0.95)
+        frame *= 1.0 - share
+        if rng.random() < flip_rate:
+            distractor = (target + 1 + rng.integers(NUM_CLASSES - 1)) % NUM_CLASSES
+            frame[distractor] += share * 0.6
+            frame[target] += share * 0.4
+        else:
+            frame[target] += share
+    return stream.astype(np.float32)
+
+
+def simulate_commit_latency(trials: int = 300, max_frames: int = 30, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Frames from sign onset to letter commit, old vote vs probability smoothing
+
+    Each trial holds one sign for a few frames, then switches to another and
+    counts frames until the new letter commits (cooldowns disabled).
+    """
+    from app.core.prediction_smoother import ProbabilitySmoother, SequentialLetterTest
+
+    rng = np.random.default_rng(seed)
+    methods = {
+        'counter_vote': lambda: CounterVote(),
+        'ema': lambda: ProbabilitySmoother(NUM_CLASSES, mode='ema'),
+        'window': lambda: ProbabilitySmoother(NUM_CLASSES, mode='window'),
+        'sprt': lambda: SequentialLetterTest(NUM_CLASSES, nothing_index=NUM_CLASSES - 1),
+    }
+    latencies = {name: [] for name in methods}
+    wrong = {name: 0 for name in methods}
+
+    for _ in range(trials):
+        previous, target = rng.choice(NUM_CLASSES, size=2, replace=False)
+        lead_in = synthetic_sign_stream(rng, previous, 10)
+        stream = synthetic_sign_stream(rng, target, max_frames)
+
+        for name, factory in methods.items():
+            smoother = factory()
+            feed = (lambda p: smoother.update(int(p.argmax()))) if name == 'counter_vote' else smoother.update
+            for frame in lead_in:
+                feed(frame)
+
+            for frame_number, frame in enumerate(stream, start=1):
+                committed = feed(frame)
+                if committed is None:
+                    continue
+                if committed == target:
+                    latencies[name].append(frame_number)
+                    break
+                wrong[name] += 1
+
+    summary = {}
+    for name, values in latencies.items():
+        summary[name] = {
+            'mean_frames': float(np.mean(values)) if values else float('nan'),
+            'p95_frames': float(np.percentile(values, 95)) if values else float('nan'),
+            'missed_rate': 1.0 - len(values) / trials,
+            'wrong_commits': wrong[name]
+        }
+    return summary
+
+
+def synthetic_session(rng, num_letters: int = 30, fps: float = 8.0):
+    """
+    Noisy softmax stream for a fingerspelled session
+
+    Letters are held 0.5-1.2 s with one or two blurred transition frames,
+    and words are separated by a 0.5 s hand-down (NOTHING) gap.
+
+    Returns:
+        (frames, target letter indices)
+    """
+    nothing = NUM_CLASSES - 1
+    targets = rng.integers(0, 26, size=num_letters)
+    frames = []
+    previous = nothing
+    word_left = rng.integers(3, 7)
+    for target in targets.tolist():
+        if target == previous:
+            frames.extend(synthetic_sign_stream(rng, nothing, int(0.3 * fps)))  # Repeats need a gap
+        for _ in range(rng.integers(1, 3)):
+            blend = synthetic_sign_stream(rng, previous, 1)[0] + synthetic_sign_stream(rng, target, 1)[0]
+            frames.append(blend / 2)
+        frames.extend(synthetic_sign_stream(rng, target, int(rng.uniform(0.5, 1.2) * fps)))
+        previous = target
+
+        word_left -= 1
+        if word_left == 0:
+            frames.extend(synthetic_sign_stream(rng, nothing, int(0.5 * fps)))
+            previous, word_left = nothing, rng.integers(3, 7)
+    return np.array(frames, dtype=np.float32), targets
+
+
+def edit_distance(a: List[int], b: List[int]) -> int:
+    row = list(range(len(b) + 1))
+    for i, x in enumerate(a, start=1):
+        previous, row[0] = row[0], i
+        for j, y in enumerate(b, start=1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (x != y))
+    return row[-1]
+
+
+def simulate_letters_per_minute(sessions: int = 40, fps: float = 8.0, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Correct letters per minute over synthetic sessions, per commit policy
+
+    Policies mirror the camera: the original 5-frame argmax vote with a 3 s
+    cooldown, probability smoothing with the same cooldown, and the
+    sequential test (no cooldown, re-armed by NOTHING gaps).
+    """
+    from app.core.prediction_smoother import ProbabilitySmoother, SequentialLetterTest
+
+    nothing = NUM_CLASSES - 1
+    cooldown = 3.0
+    policies = {
+        'counter_vote+cooldown': (lambda: CounterVote(), True),
+        'ema+cooldown': (lambda: ProbabilitySmoother(NUM_CLASSES, mode='ema'), True),
+        'sprt': (lambda: SequentialLetterTest(NUM_CLASSES, nothing_index=nothing), False),
+    }
+    rng = np.random.default_rng(seed)
+    results = {name: {'lpm': [], 'errors': []} for name in policies}
+
+    for _ in range(sessions):
+        frames, targets = synthetic_session(rng, fps=fps)
+        minutes = len(frames) / fps / 60
+        for name, (factory, uses_cooldown) in policies.items():
+            policy = factory()
+            committed, last_commit = [], -np.inf
+            for frame_number, frame in enumerate(frames):
+                index = policy.update(int(frame.argmax())) if name.startswith('counter') else policy.update(frame)
+                if index is None or index == nothing:
+                    continue
+                now = frame_number / fps
+                if uses_cooldown and now - last_commit <= cooldown:
+                    if hasattr(policy, 'active_index'):
+                        policy.active_index = None  # As CameraScreen.update_stable_prediction
+                    continue
+                last_commit = now
+                committed.append(index)
+
+            errors = edit_distance(committed, targets.tolist())
+            results[name]['lpm'].append(max(len(targets) - errors, 0) / minutes)
+            results[name]['errors'].append(errors / len(targets))
+
+    return {
+        name: {
+            'median_letters_per_minute': float(np.median(values['lpm'])),
+            'mean_error_rate': float(np.mean(values['errors']))
+        }
+        for name, values in results.items()
+    }
+
+
+def simulate_word_completion(trials: int = 300, seed: int = 0) -> Dict[str, float]:
+    """
+    Letters signed per word with and without dictionary completion
+
+    Words are drawn by frequency from the bundled list. Each committed letter
+    is one noisy synthetic distribution; a word is done once the decoder's top
+    suggestion is the target and the signer selects it (or all its letters are signed).
+    """
+    from app.core.word_decoder import BeamDecoder, WordTrie, read_word_list, DEFAULT_WORD_LIST
+
+    rng = np.random.default_rng(seed)
+    class_names = [chr(ord('A') + i) for i in range(26)] + ['SPACE', 'DELETE', 'NOTHING']
+    words = read_word_list(ROOT / DEFAULT_WORD_LIST)
+    weights = np.array([count for _, count in words])
+    trie = WordTrie.build(words)
+    decoder = BeamDecoder(trie, class_names)
+
+    signed, full = [], []
+    for index in rng.choice(len(words), size=trials, p=weights / weights.sum()):
+        word = words[index][0]
+        decoder.reset()
+        letters = len(word)
+        for position, letter in enumerate(word, start=1):
+            decoder.step(synthetic_sign_stream(rng, class_names.index(letter), 1)[0])
+            suggestions = decoder.suggestions(1)
+            if suggestions and suggestions[0][0] == word:
+                letters = position
+                break
+        signed.append(letters)
+        full.append(len(word))
+
+    return {
+        'letters_per_word': float(np.mean(full)),
+        'letters_per_word_completed': float(np.mean(signed)),
+        'letters_saved': 1.0 - float(np.sum(signed)) / float(np.sum(full))
+    }
+
+
+def measure_cold_start(warmup_runs: int = 5) -> Optional[Dict[str, float]]:
+    """Load time, first (cold) inference and warmed latency of a freshly loaded ASLEngine"""
+    from app.core import asl_engine
+    if asl_engine.MODEL_TYPE != 'tflite' or not MODEL_PATH.exists():
+        return None
+
+    engine = asl_engine.ASLEngine(warmup_runs=warmup_runs)
+    if not engine.load_model(str(MODEL_PATH)):
+        return None
+    info = engine.get_model_info()
+    engine.cleanup()
+    return {key: info[key] for key in ('load_time_ms', 'cold_start_ms', 'warm_latency_ms', 'warmup_runs')}
+
+
+def measure_model_store(interpreters: int = 4) -> Optional[Dict[str, Dict[str, float]]]:
+    """
+    Memory and load time of each extra interpreter of the bundled model
+
+    'private_bytes' reads the file into its own bytes per interpreter, as
+    independent engines loading from bytes do; 'model_store' builds every
+    interpreter over the process-wide mapping. RssAnon is private memory,
+    RssFile is page cache shared with other processes mapping the file.
+    """
+    import gc
+    from app.core import tflite_utils
+    if not tflite_utils.TFLITE_AVAILABLE or not MODEL_PATH.exists() or not tflite_utils.get_rss_breakdown():
+        return None
+
+    # The first interpreter initializes the runtime; keep that out of the numbers
+    tflite_utils.create_interpreter(str(MODEL_PATH)).allocate_tensors()
+    store = tflite_utils.ModelStore()
+    builders = {
+        'private_bytes': lambda: tflite_utils.create_interpreter(model_content=MODEL_PATH.read_bytes()),
+        'model_store': lambda: store.create_interpreter(str(MODEL_PATH))
+    }
+
+    # Everything stays alive until the end, so freed memory is not reused by the next case
+    results, kept = {}, []
+    for name, build in builders.items():
+        gc.collect()
+        before = tflite_utils.get_rss_breakdown()
+        start = time.perf_counter()
+        for _ in range(interpreters):
+            interpreter = build()
+            interpreter.allocate_tensors()
+            interpreter.invoke()
+            kept.append(interpreter)
+        elapsed = time.perf_counter() - start
+        after = tflite_utils.get_rss_breakdown()
+        results[name] = {
+            'load_ms': elapsed / interpreters * 1000,
+            'rss_anon_kb': (after['RssAnon'] - before['RssAnon']) / interpreters,
+            'rss_file_kb': (after['RssFile'] - before['RssFile']) / interpreters
+        }
+    del kept
+    results['model_store']['buffer_content'] = store.buffer_content
+    return results
+
+
+def measure_hot_swap_latency(swaps: int = 3, baseline_frames: int = 100) -> Optional[Dict[str, Any]]:
+    """
+    ModelManager.predict latency while models are hot-swapped underneath it
+
+    Predicts back to back on the main thread, first alone and then while a
+    background thread reloads the bundled model; every frame must still get
+    an answer.
+    """
+    from app.core.model_manager import ModelManager, TENSORFLOW_AVAILABLE
+    if not TENSORFLOW_AVAILABLE or not MODEL_PATH.exists():
+        return None
+
+    manager = ModelManager(str(MODEL_PATH))
+    if not manager.is_loaded:
+        return None
+    image = np.random.default_rng(0).random((1, *manager.input_shape)).astype(np.float32)
+
+    def timed_predict(latencies, failures):
+        start = time.perf_counter()
+        class_idx, _ = manager.predict(image)
+        latencies.append((time.perf_counter() - start) * 1000)
+        failures[0] += class_idx is None
+
+    baseline, during, failures = [], [], [0]
+    for _ in range(baseline_frames):
+        timed_predict(baseline, failures)
+
+    swap_times = []
+    for _ in range(swaps):
+        start = time.perf_counter()
+        loader = manager.hot_swap(str(MODEL_PATH))
+        while loader.is_alive():
+            timed_predict(during, failures)
+        loader.join()
+        swap_times.append((time.perf_counter() - start) * 1000)
+
+    def summary(latencies):
+        p50, p95 = np.percentile(latencies, [50, 95])
+        return {'frames': len(latencies), 'p50_ms': float(p50), 'p95_ms': float(p95),
+                'max_ms': float(np.max(latencies))}
+
+    return {
+        'baseline': summary(baseline),
+        'during_swap': summary(during),
+        'swaps': manager.swap_count,
+        'mean_swap_ms': float(np.mean(swap_times)),
+        'failed_frames': failures[0]
+    }
+
+
+def measure_thread_scaling(frames_per_thread: int = 40) -> Optional[Dict[str, Dict[str, float]]]:
+    """
+    ModelManager.predict throughput against the number of concurrent callers
+
+    'pooled' is the interpreter pool (one interpreter per concurrent caller);
+    'serialized' wraps predict in one lock, as a single shared interpreter
+    forces. Each interpreter uses one TFLite thread so callers map to cores.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from app.core.model_manager import ModelManager, TENSORFLOW_AVAILABLE
+    from app.core.tflite_utils import get_thread_candidates
+    if not TENSORFLOW_AVAILABLE or not MODEL_PATH.exists():
+        return None
+
+    manager = ModelManager(str(MODEL_PATH), num_threads=1)
+    if not manager.is_loaded:
+        return None
+    image = np.random.default_rng(0).random((1, *manager.input_shape)).astype(np.float32)
+    shared_lock = threading.Lock()
+
+    def serialized_predict():
+        with shared_lock:
+            return manager.predict(image)
+
+    def throughput(predict, callers):
+        def worker(_):
+            for _ in range(frames_per_thread):
+                predict()
+
+        with ThreadPoolExecutor(callers) as executor:
+            list(executor.map(worker, range(callers)))  # Warm-up: one interpreter per caller
+            start = time.perf_counter()
+            list(executor.map(worker, range(callers)))
+        return callers * frames_per_thread / (time.perf_counter() - start)
+
+    results = {}
+    for callers in sorted(set(get_thread_candidates(max(4, os.cpu_count() or 1)))):
+        pooled = throughput(lambda: manager.predict(image), callers)
+        serialized = throughput(serialized_predict, callers)
+        results[str(callers)] = {'pooled_per_sec': pooled, 'serialized_per_sec': serialized}
+    return results
+
+
+def measure(fn: Callable[[], Any], iterations: int, warmup: int) -> Dict[str, float]:
+    """Time a callable and summarize its latency distribution"""
+    for _ in range(warmup):
+        fn()
+
+    timings = np.empty(iterations, dtype=np.float64)
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings[i] = time.perf_counter() - start
+
+    timings_ms = timings * 1000
+    p50, p95, p99 = np.percentile(timings_ms, [50, 95, 99])
+    total = timings.sum()
+
+    return {
+        'iterations': iterations,
+        'mean_ms': float(timings_ms.mean()),
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99),
+        'throughput_per_sec': float(iterations / total) if total > 0 else 0.0
+    }
+
+
+def run_benchmarks(names: List[str], iterations: int, warmup: int) -> Dict[str, Any]:
+    """Run the selected benchmarks and collect results"""
+    ctx = make_context()
+    results = {}
+
+    for name in names:
+        try:
+            fn = BENCHMARKS[name](ctx)
+        except SkipBenchmark as e:
+            print(f"⏭️  {name}: skipped ({e})")
+            continue
+
+        stats = measure(fn, iterations, warmup)
+        results[name] = stats
+        print(f"⏱️  {name:42s} p50 {stats['p50_ms']:8.3f}ms  p95 {stats['p95_ms']:8.3f}ms  "
+              f"p99 {stats['p99_ms']:8.3f}ms  {stats['throughput_per_sec']:10.1f}/s")
+
+    commit_latency = simulate_commit_latency() if any(n.startswith('smoothing') for n in names) else None
+    if commit_latency:
+        print("\n🤟 Letter commit latency (frames from sign onset, noisy synthetic stream)")
+        for name, values in commit_latency.items():
+            print(f"   {name:14s} mean {values['mean_frames']:5.2f}  p95 {values['p95_frames']:5.1f}  "
+                  f"missed {values['missed_rate']:6.1%}  wrong commits {values['wrong_commits']}")
+
+    letters_per_minute = simulate_letters_per_minute() if any(n.startswith('smoothing') for n in names) else None
+    if letters_per_minute:
+        print("\n⏩ Letters per minute (synthetic 8 FPS sessions, letter-level edit distance)")
+        for name, values in letters_per_minute.items():
+            print(f"   {name:22s} median {values['median_letters_per_minute']:5.1f} LPM  "
+                  f"error rate {values['mean_error_rate']:6.1%}")
+
+    word_completion = simulate_word_completion() if any(n.startswith('word_decoder') for n in names) else None
+    if word_completion:
+        print("\n📝 Word completion (frequency-weighted words, noisy letters)")
+        print(f"   letters per word {word_completion['letters_per_word']:.2f} -> "
+              f"{word_completion['letters_per_word_completed']:.2f} "
+              f"({word_completion['letters_saved']:.0%} fewer signs)")
+
+    cold_start = measure_cold_start() if any(n.startswith('engine') for n in names) else None
+    if cold_start:
+        print(f"\n🔥 Model load {cold_start['load_time_ms']:.1f}ms, first inference "
+              f"{cold_start['cold_start_ms']:.1f}ms (cold), then {cold_start['warm_latency_ms']:.1f}ms (warm)")
+
+    model_store = measure_model_store() if any(n.startswith('model_manager') for n in names) else None
+    if model_store:
+        print("\n🗺️  Per extra interpreter of the bundled model (first invoke included)")
+        for name, values in model_store.items():
+            print(f"   {name:14s} load+first run {values['load_ms']:6.1f}ms  "
+                  f"private {values['rss_anon_kb'] / 1024:5.1f}MB  shared file pages {values['rss_file_kb'] / 1024:5.1f}MB")
+
+    thread_scaling = measure_thread_scaling() if any(n.startswith('model_manager') for n in names) else None
+    if thread_scaling:
+        print(f"\n🧵 Concurrent predict throughput ({os.cpu_count()} CPU cores, 1 TFLite thread per interpreter)")
+        single = thread_scaling['1']['pooled_per_sec']
+        for callers, values in thread_scaling.items():
+            print(f"   {callers:>3s} callers  pooled {values['pooled_per_sec']:7.1f}/s "
+                  f"({values['pooled_per_sec'] / single:4.2f}x)  serialized {values['serialized_per_sec']:7.1f}/s")
+
+    hot_swap = measure_hot_swap_latency() if any(n.startswith('model_manager') for n in names) else None
+    if hot_swap:
+        print(f"\n🔄 Model hot swap ({hot_swap['swaps']} swaps, {hot_swap['mean_swap_ms']:.0f}ms each, "
+              f"{hot_swap['failed_frames']} failed frames)")
+        for name in ('baseline', 'during_swap'):
+            values = hot_swap[name]
+            print(f"   {name:12s} p50 {values['p50_ms']:7.2f}ms  p95 {values['p95_ms']:7.2f}ms  "
+                  f"max {values['max_ms']:7.2f}ms  ({values['frames']} frames)")
+
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'python': platform.python_version(),
+            'cpu_count': os.cpu_count()
+        },
+        'iterations': iterations,
+        'results': results,
+        'commit_latency': commit_latency,
+        'letters_per_minute': letters_per_minute,
+        'word_completion': word_completion,
+        'cold_start': cold_start,
+        'model_store': model_store,
+        'hot_swap': hot_swap,
+        'thread_scaling': thread_scaling
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float,
+                    metric: str = 'p50_ms', min_delta_ms: float = 0.01) -> List[str]:
+    """
+    Compare two benchmark runs
+
+    Args:
+        current: Results from this run
+        baseline: Results loaded from a previous run
+        tolerance: Allowed relative slowdown (0.1 = 10%)
+        metric: Latency field to compare
+        min_delta_ms: Ignore slowdowns smaller than this (timer noise on tiny cases)
+
+    Returns:
+        Names of benchmarks that regressed beyond the tolerance
+    """
+    regressions = []
+    print(f"\n📊 Comparison on {metric} (tolerance {tolerance:.0%})")
+
+    for name, stats in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if not base or base.get(metric, 0) <= 0:
+            print(f"   {name:42s} (no baseline)")
+            continue
+
+        change = stats[metric] / base[metric] - 1.0
+        regressed = change > tolerance and stats[metric] - base[metric] > min_delta_ms
+        marker = "❌ REGRESSION" if regressed else "✅"
+        print(f"   {name:42s} {base[metric]:8.3f}ms -> {stats[metric]:8.3f}ms ({change:+.1%}) {marker}")
+
+        if regressed:
+            regressions.append(name)
+
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the ASL inference hot paths")
+    parser.add_argument('--iterations', type=int, default=200, help="Timed iterations per benchmark")
+    parser.add_argument('--warmup', type=int, default=20, help="Untimed iterations first")
+    parser.add_argument('--only', action='append', default=None,
+                        help="Run benchmarks whose name contains this text (repeatable)")
+    parser.add_argument('--output', default=None, help="Save results to this JSON file")
+    parser.add_argument('--compare', default=None, help="Baseline JSON file to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="Allowed relative slowdown")
+    parser.add_argument('--min-delta-ms', type=float, default=0.01,
+                        help="Ignore slowdowns below this absolute amount")
+    parser.add_argument('--metric', default='p50_ms', choices=['mean_ms', 'p50_ms', 'p95_ms', 'p99_ms'])
+    parser.add_argument('--list', action='store_true', help="List benchmark names and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    if args.list:
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    names = list(BENCHMARKS)
+    if args.only:
+        names = [n for n in names if any(part in n for part in args.only)]
+
+    current = run_benchmarks(names, args.iterations, args.warmup)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"💾 Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare_results(current, baseline, args.tolerance, args.metric, args.min_delta_ms)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        print("✅ No regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+INT8 Converter - Full-integer quantization of the trained ASL model
+Converts the Keras checkpoint from Config.get_model_path() into a uint8-in/uint8-out
+TFLite model, calibrated on images drawn from DataConfig.processed_path
+
+Usage:
+    python scripts/convert_int8.py --config config.yaml
+    python scripts/convert_int8.py --config config.yaml --num-samples 500 --output assets/models/best_model_int8.tflite
+"""
+
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import cv2
+import numpy as np
+import tensorflow as tf
+
+# Allow running from the repository root or the scripts directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp'}
+
+
+def load_representative_images(processed_path: str, input_size: int, num_samples: int = 300,
+                               seed: int = 42) -> List[np.ndarray]:
+    """
+    Sample calibration images from the processed dataset
+
+    Args:
+        processed_path: Root of the processed dataset (class sub-folders)
+        input_size: Model input size in pixels
+        num_samples: Number of images to sample
+        seed: Random seed so repeated conversions calibrate identically
+
+    Returns:
+        List of float32 RGB images in [0, 1], shape (input_size, input_size, 3)
+    """
+    image_paths = [
+        os.path.join(dirpath, filename)
+        for dirpath, _, filenames in os.walk(processed_path)
+        for filename in filenames
+        if Path(filename).suffix.lower() in IMAGE_EXTENSIONS
+    ]
+
+    if not image_paths:
+        raise FileNotFoundError(f"No calibration images found under {processed_path}")
+
+    # Sample across the whole tree so every class contributes to the ranges
+    random.Random(seed).shuffle(image_paths)
+
+    images = []
+    for path in image_paths:
+        image = cv2.imread(path)
+        if image is None:
+            continue
+
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = cv2.resize(image, (input_size, input_size))
+        images.append(image.astype(np.float32) / 255.0)
+
+        if len(images) >= num_samples:
+            break
+
+    return images
+
+
+def convert_keras_to_int8(model, calibration_images: List[np.ndarray]) -> bytes:
+    """
+    Convert a Keras model to a full-integer TFLite model
+
+    Input and output tensors are uint8. With calibration data in [0, 1] the
+    input scale comes out as 1/255, so ASLEngine can feed raw camera pixels.
+
+    Args:
+        model: Loaded Keras model
+        calibration_images: Float32 images in [0, 1] for range calibration
+
+    Returns:
+        Serialized TFLite model bytes
+    """
+    def representative_dataset():
+        for image in calibration_images:
+            yield [np.expand_dims(image, axis=0)]
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.uint8
+    converter.inference_output_type = tf.uint8
+
+    return converter.convert()
+
+
+def convert(config_path: str, num_samples: int, output_path: Optional[str]) -> int:
+    """Run the conversion using paths from the training configuration"""
+    from app.utils.model_config import Config
+
+    config = Config(config_path)
+    model_path = config.get_model_path()
+
+    if not os.path.exists(model_path):
+        print(f"❌ Keras model not found: {model_path}")
+        return 1
+
+    print(f"📥 Loading Keras model from {model_path}")
+    model = tf.keras.models.load_model(model_path)
+
+    print(f"📊 Sampling {num_samples} calibration images from {config.data.processed_path}")
+    images = load_representative_images(config.data.processed_path, config.model.input_size, num_samples)
+    print(f"   Using {len(images)} images")
+
+    print("🔢 Converting to full-integer TFLite...")
+    tflite_model = convert_keras_to_int8(model, images)
+
+    if output_path is None:
+        output_path = config.get_tflite_path(f"{config.model.name}_int8.tflite")
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(tflite_model)
+
+    keras_size = os.path.getsize(model_path) / (1024 * 1024)
+    int8_size = len(tflite_model) / (1024 * 1024)
+    print(f"✅ Saved INT8 model to {output_path}")
+    print(f"   Size: {int8_size:.1f}MB (Keras checkpoint: {keras_size:.1f}MB, "
+          f"{keras_size / max(int8_size, 1e-9):.1f}x smaller)")
+
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the trained ASL model to a full-integer TFLite model")
+    parser.add_argument('--config', default='config.yaml', help="Training configuration file")
+    parser.add_argument('--num-samples', type=int, default=300, help="Calibration images to sample")
+    parser.add_argument('--output', default=None, help="Output .tflite path (default: <tflite dir>/<model>_int8.tflite)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    return convert(args.config, args.num_samples, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,568 @@
+"""
+Tests for the ASL recognition engine
+"""
+
+import gc
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.core import asl_engine
+from app.core.asl_engine import ASLEngine
+from app.core.latency_tracker import LatencyTracker
+from app.core.prediction_result import PredictionResult
+from app.core.temporal_head import TemporalHead
+from app.core.tflite_utils import get_thread_candidates
+
+MODEL_PATH = Path(__file__).resolve().parent.parent / "assets" / "models" / "best_model.tflite"
+
+requires_tflite = pytest.mark.skipif(
+    asl_engine.MODEL_TYPE != 'tflite' or not MODEL_PATH.exists(),
+    reason="TensorFlow Lite or bundled model not available"
+)
+
+
+@pytest.fixture(scope="module")
+def tflite_engine():
+    engine = ASLEngine()
+    assert engine.load_model(str(MODEL_PATH))
+    yield engine
+    engine.cleanup()
+
+
+def synthetic_frame(size=240, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(size, size, 3), dtype=np.uint8)
+
+
+@requires_tflite
+def test_tflite_inplace_matches_reference(tflite_engine):
+    """Writing into the input tensor gives the same scores as set_tensor"""
+    frame = synthetic_frame()
+
+    reference = tflite_engine._predict_tflite(tflite_engine.preprocess_image(frame))
+    class_index, confidence = tflite_engine._predict_tflite_inplace(frame)
+
+    assert class_index == int(np.argmax(reference))
+    assert confidence == pytest.approx(float(reference[class_index]), abs=1e-6)
+
+
+@requires_tflite
+def test_tflite_predict_steady_state_allocates_no_arrays(tflite_engine, monkeypatch):
+    """Steady-state predict writes the frame straight into the interpreter's input buffer"""
+    frame = synthetic_frame()
+    for _ in range(3):
+        tflite_engine.predict(frame)
+
+    def no_copy(*args):
+        raise AssertionError("set_tensor copies the frame instead of writing it in place")
+
+    monkeypatch.setattr(tflite_engine.model, "set_tensor", no_copy)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for _ in range(10):
+            assert tflite_engine.predict(frame) is not None
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # Only small Python objects (history entries, views) may appear: no image-sized buffer at all
+    assert peak - baseline < 8 * 1024
+
+    # The input tensor holds the last frame, written without set_tensor
+    expected = tflite_engine.preprocess_image(frame)
+    np.testing.assert_allclose(tflite_engine.model.get_tensor(tflite_engine.input_index), expected, atol=1e-6)
+
+
+def test_thread_candidates_cover_powers_of_two():
+    assert get_thread_candidates(1) == [1]
+    assert get_thread_candidates(6) == [1, 2, 4, 6]
+    assert get_thread_candidates(8) == [1, 2, 4, 8]
+
+
+@requires_tflite
+def test_engine_respects_thread_and_xnnpack_settings():
+    engine = ASLEngine(num_threads=1, use_xnnpack=False, auto_tune_threads=True)
+    assert engine.load_model(str(MODEL_PATH))
+
+    info = engine.get_model_info()
+    assert info['use_xnnpack'] is False
+    assert info['num_threads'] in info['thread_timings']
+    assert engine.predict(synthetic_frame()) is not None
+    engine.cleanup()
+
+
+def test_quantized_input_pixel_mapping():
+    """Pixels map onto quantized inputs without float normalization"""
+    engine = ASLEngine()
+    float_out = {'dtype': np.float32, 'quantization': (0.0, 0)}
+
+    engine._configure_quantization({'dtype': np.uint8, 'quantization': (1 / 255, 0)}, float_out)
+    assert engine._input_mode == 'identity'
+
+    engine._configure_quantization({'dtype': np.int8, 'quantization': (1 / 255, -128)}, float_out)
+    assert engine._input_mode == 'int8_shift'
+
+    engine._configure_quantization({'dtype': np.uint8, 'quantization': (2 / 255, 10)}, float_out)
+    assert engine._input_mode == 'lut'
+    assert engine._input_lut[0] == 10
+    assert engine._input_lut[255] == 138
+
+
+@requires_tflite
+def test_full_integer_model_end_to_end(tmp_path):
+    """A uint8-in/uint8-out model from scripts/convert_int8.py agrees with its float twin"""
+    tf = pytest.importorskip("tensorflow")
+    from scripts.convert_int8 import convert_keras_to_int8
+    rng = np.random.default_rng(0)
+
+    model = tf.keras.Sequential([
+        tf.keras.Input((32, 32, 3)),
+        tf.keras.layers.Conv2D(4, 3, activation='relu'),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(29, activation='softmax')
+    ])
+
+    float_path = tmp_path / "float.tflite"
+    float_path.write_bytes(tf.lite.TFLiteConverter.from_keras_model(model).convert())
+
+    calibration_images = [rng.random((32, 32, 3), dtype=np.float32) for _ in range(20)]
+    int8_path = tmp_path / "int8.tflite"
+    int8_path.write_bytes(convert_keras_to_int8(model, calibration_images))
+
+    float_engine = ASLEngine()
+    int8_engine = ASLEngine()
+    assert float_engine.load_model(str(float_path))
+    assert int8_engine.load_model(str(int8_path))
+    assert int8_engine.get_model_info()['quantized']
+
+    frame = synthetic_frame(48)
+    reference = float_engine._predict_tflite(float_engine.preprocess_image(frame))
+    _, confidence = int8_engine.predict(frame)
+
+    scores = int8_engine._predict_tflite(int8_engine.preprocess_image(frame))
+    np.testing.assert_allclose(scores, reference, atol=0.02)
+    assert confidence == pytest.approx(float(reference.max()), abs=0.02)
+
+
+def test_latency_tracker_keeps_recent_window():
+    tracker = LatencyTracker(stages=('invoke',), window=4)
+    for ms in [100, 100, 1, 2, 3, 4]:
+        tracker.record('invoke', ms / 1000)
+
+    stats = tracker.get_stats()['invoke']
+    assert stats['count'] == 6
+    assert stats['last_ms'] == pytest.approx(4)
+    assert stats['mean_ms'] == pytest.approx(2.5)  # The 100ms samples rolled out
+
+    for i in range(11):
+        tracker.mark_frame(i * 0.1)
+    assert tracker.get_fps() == pytest.approx(10.0)
+
+
+@requires_tflite
+def test_model_info_reports_stage_latency(tflite_engine):
+    tflite_engine.latency.reset()
+    for _ in range(5):
+        tflite_engine.predict(synthetic_frame())
+
+    latency = tflite_engine.get_model_info()['latency']
+    for stage in ('preprocess', 'invoke', 'postprocess'):
+        assert latency[stage]['count'] == 5
+        assert 0 <= latency[stage]['p50_ms'] <= latency[stage]['p99_ms']
+
+
+def test_prediction_result_top_k_from_one_vector():
+    probabilities = np.array([0.1, 0.5, 0.05, 0.3, 0.05], dtype=np.float32)
+    result = PredictionResult('B', 0.5, probabilities, list('ABCDE'), 1)
+
+    letter, confidence = result  # Still unpacks like the old tuple
+    assert (letter, confidence) == ('B', 0.5)
+    assert [name for name, _ in result.top_k(3)] == ['B', 'D', 'A']
+    assert result.top_k(1) == [('B', pytest.approx(0.5))]
+    assert result.as_dict()['D'] == pytest.approx(0.3)
+
+    # Label-only results (demo mode) still give a top-1
+    assert PredictionResult('A', 0.9).top_k(3) == [('A', 0.9)]
+
+
+@requires_tflite
+def test_predict_result_owns_its_probabilities(tflite_engine):
+    first = tflite_engine.predict(synthetic_frame(seed=1))
+    snapshot = first.probabilities.copy()
+    tflite_engine.predict(synthetic_frame(seed=2))
+
+    np.testing.assert_array_equal(first.probabilities, snapshot)
+    assert first.top_k(1)[0] == (first.class_name, pytest.approx(first.confidence))
+
+
+@requires_tflite
+def test_embeddings_are_centred_logits_and_feed_the_temporal_head(tflite_engine):
+    assert tflite_engine.predict(synthetic_frame(seed=3)).embedding is None
+
+    tflite_engine.enable_embeddings(True)
+    try:
+        result = tflite_engine.predict(synthetic_frame(seed=3))
+    finally:
+        tflite_engine.enable_embeddings(False)
+
+    # Centred log-probabilities: softmax(embedding) gives the probabilities back
+    embedding = result.embedding
+    assert embedding.shape == (tflite_engine.num_classes,)
+    assert abs(float(embedding.mean())) < 1e-4
+    recovered = np.exp(embedding - embedding.max())
+    np.testing.assert_allclose(recovered / recovered.sum(), result.probabilities, atol=1e-4)
+
+    # A still hand never turns into a motion letter
+    head = TemporalHead(tflite_engine.class_names, dim=tflite_engine.embedding_size, window=4)
+    for _ in range(6):
+        assert head.apply(result, (100, 100, 200, 200)) is result
+
+
+def test_temporal_head_detects_motion_letters():
+    class_names = list('ABCDEFGHIJKLMNOPQRSTUVWXYZ') + ['SPACE', 'DELETE', 'NOTHING']
+    index_i = class_names.index('I')
+    head = TemporalHead(class_names, window=8)
+
+    # Frames look like I (J's hand shape) with J as the runner-up
+    probabilities = np.full(len(class_names), 0.01, dtype=np.float32)
+    probabilities[index_i] = 0.6
+    probabilities[class_names.index('J')] = 0.2
+    embedding = np.log(probabilities / probabilities.sum())
+    frame = PredictionResult('I', 0.6, probabilities, class_names, index_i, embedding - embedding.mean())
+
+    # Static hand: every frame stays I
+    for _ in range(8):
+        assert head.apply(frame, (100, 100, 200, 200)) is frame
+
+    # The hand sweeps down-left over the window: J wins
+    head.reset()
+    results = [head.apply(frame, (100 - 10 * t, 100 + 15 * t, 200 - 10 * t, 200 + 15 * t)) for t in range(8)]
+    assert results[0] is frame
+    assert results[-1].class_name == 'J'
+    assert results[-1].embedding is frame.embedding
+    assert head.get_stats()['overrides'] > 0
+
+
+@requires_tflite
+def test_predictor_image_prediction_runs_one_forward_pass(tmp_path, monkeypatch):
+    cv2 = pytest.importorskip("cv2")
+    from types import SimpleNamespace
+    from app.core.predictor import ASLPredictor
+    from app.utils.constants import ASL_CLASSES
+
+    predictor = ASLPredictor(SimpleNamespace(class_labels=ASL_CLASSES, model=SimpleNamespace(input_size=224)))
+    assert predictor.load_tflite_model(str(MODEL_PATH))
+
+    calls = []
+    forward = predictor._predict_tflite
+    monkeypatch.setattr(predictor, '_predict_tflite', lambda data: calls.append(1) or forward(data))
+
+    image_path = tmp_path / "frame.png"
+    cv2.imwrite(str(image_path), synthetic_frame(224))
+    result = predictor.predict_from_image(str(image_path))
+
+    assert len(calls) == 1
+    assert result.top_k(3)[0][0] == result.class_name
+
+
+def test_mc_dropout_batches_samples_and_reuses_backbone():
+    tf = pytest.importorskip("tensorflow")
+    from types import SimpleNamespace
+    from app.core.predictor import ASLPredictor
+    from app.utils.constants import ASL_CLASSES
+
+    model = tf.keras.Sequential([
+        tf.keras.Input((32, 32, 3)),
+        tf.keras.layers.Conv2D(4, 3, activation='relu'),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(16, activation='relu'),
+        tf.keras.layers.Dropout(0.5),
+        tf.keras.layers.Dense(29, activation='softmax')
+    ])
+    predictor = ASLPredictor(SimpleNamespace(class_labels=ASL_CLASSES))
+    predictor.model, predictor.model_loaded = model, True
+    image = np.random.default_rng(0).random((1, 32, 32, 3), dtype=np.float32)
+
+    backbone, head_layers = predictor._get_dropout_split()
+    assert isinstance(head_layers[0], tf.keras.layers.Dropout)
+
+    for reuse in (True, False):
+        samples = predictor._mc_dropout_probabilities(image, 16, reuse_features=reuse)
+        assert samples.shape == (16, 29)
+        np.testing.assert_allclose(samples.sum(axis=1), 1.0, rtol=1e-5)
+        assert samples.std(axis=0).max() > 0  # Dropout was active
+
+    # Without dropout noise the head reproduces the deterministic model
+    head_only = [layer for layer in head_layers if not isinstance(layer, tf.keras.layers.Dropout)]
+    x = backbone(image, training=False)
+    for layer in head_only:
+        x = layer(x, training=False)
+    np.testing.assert_allclose(x.numpy(), model(image, training=False).numpy(), rtol=1e-5)
+
+    label, confidence, uncertainty = predictor.predict_with_uncertainty(image, num_samples=8)
+    assert label in ASL_CLASSES and 0 < confidence <= 1 and uncertainty >= 0
+
+
+def tiny_tflite_model(path, scale):
+    """32x32 TFLite classifier whose confidence in the last class grows with scale"""
+    tf = pytest.importorskip("tensorflow")
+    model = tf.keras.Sequential([
+        tf.keras.Input((32, 32, 3)),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(29, activation='softmax')
+    ])
+    kernel, bias = model.layers[-1].get_weights()
+    # Bias only: a random kernel would make the last class's confidence vary between runs
+    model.layers[-1].set_weights([np.zeros_like(kernel), np.arange(29, dtype=np.float32) * scale])
+    path.write_bytes(tf.lite.TFLiteConverter.from_keras_model(model).convert())
+    return str(path)
+
+
+@requires_tflite
+def test_model_manager_cascade_escalates_unsure_frames(tmp_path):
+    from app.core.model_manager import ModelManager
+
+    fast_path = tiny_tflite_model(tmp_path / "fast.tflite", 0.0)  # Uniform output: always unsure
+    accurate_path = tiny_tflite_model(tmp_path / "accurate.tflite", 1.0)  # Confident in the last class
+    image = np.random.default_rng(0).random((1, 32, 32, 3), dtype=np.float32)
+
+    manager = ModelManager(fast_path, cascade=True, accurate_model_path=accurate_path)
+    assert manager.cascade
+    for _ in range(4):
+        class_idx, confidence = manager.predict(image)
+    assert class_idx == 28 and confidence > 0.5
+    stats = manager.get_model_info()['cascade']
+    assert stats['frames'] == 4 and stats['escalation_rate'] == 1.0
+
+    # Confident (or thresholds off): the fast model answers alone
+    manager.cascade_threshold = manager.cascade_margin = 0.0
+    manager.reset_cascade_stats()
+    class_idx, confidence = manager.predict(image)
+    assert confidence == pytest.approx(1 / 29, rel=1e-3)
+    assert manager.get_cascade_stats()['escalated'] == 0
+
+
+@requires_tflite
+def test_model_manager_hot_swap_keeps_serving_frames(tmp_path, monkeypatch):
+    from app.core import tflite_utils
+    from app.core.model_manager import ModelManager
+
+    old_path = tiny_tflite_model(tmp_path / "old.tflite", 0.0)
+    new_path = tiny_tflite_model(tmp_path / "new.tflite", 1.0)
+    image = np.random.default_rng(0).random((1, 32, 32, 3), dtype=np.float32)
+    manager = ModelManager(old_path)
+    assert manager.predict(image)[1] == pytest.approx(1 / 29, rel=1e-3)
+
+    # A slow load: if the swap blocked predict(), frames would stall for the whole load
+    create_interpreter = tflite_utils.create_interpreter
+
+    def slow_create_interpreter(*args, **kwargs):
+        time.sleep(0.5)
+        return create_interpreter(*args, **kwargs)
+
+    monkeypatch.setattr(tflite_utils, 'create_interpreter', slow_create_interpreter)
+
+    results, latencies = [], []
+    loader = manager.hot_swap(new_path)
+    while loader.is_alive():
+        start = time.perf_counter()
+        results.append(manager.predict(image))
+        latencies.append(time.perf_counter() - start)
+    loader.join()
+
+    assert len(results) > 10
+    assert all(class_idx is not None for class_idx, _ in results)  # No dropped frames
+    assert max(latencies) < 0.1
+    assert manager.swap_count == 1 and manager.model_path == new_path
+    assert manager.predict(image)[0] == 28
+
+    # An updated model file (replaced atomically: it is memory-mapped) is picked up without a restart
+    stat = os.stat(new_path)
+    updated_path = tmp_path / "update.tflite"
+    updated_path.write_bytes(Path(old_path).read_bytes())
+    os.utime(updated_path, (stat.st_atime, stat.st_mtime + 10))
+    os.replace(updated_path, new_path)
+    manager.reload_if_changed().join()
+    assert manager.swap_count == 2
+    assert manager.predict(image)[1] == pytest.approx(1 / 29, rel=1e-3)
+    assert manager.reload_if_changed() is None
+
+    # A file that fails to load keeps the old model and is retried on the next call
+    updated_path.write_bytes(b"half-written model")
+    os.utime(updated_path, (stat.st_atime, stat.st_mtime + 20))
+    os.replace(updated_path, new_path)
+    manager.reload_if_changed().join()
+    assert manager.swap_count == 2 and manager.last_swap_error
+    assert manager.predict(image)[1] == pytest.approx(1 / 29, rel=1e-3)
+    retry = manager.reload_if_changed()
+    assert retry is not None
+    retry.join()
+
+    tiny_tflite_model(updated_path, 1.0)
+    os.utime(updated_path, (stat.st_atime, stat.st_mtime + 30))
+    os.replace(updated_path, new_path)
+    manager.reload_if_changed().join()
+    assert manager.swap_count == 3 and manager.predict(image)[0] == 28
+
+
+@requires_tflite
+def test_model_manager_pools_interpreters_across_threads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+    from app.core.model_manager import ModelManager
+
+    manager = ModelManager(tiny_tflite_model(tmp_path / "model.tflite", 1.0), num_threads=1)
+    image = np.random.default_rng(0).random((1, 32, 32, 3), dtype=np.float32)
+    expected = manager.predict(image)
+    start = threading.Barrier(4)
+
+    def worker(_):
+        start.wait()
+        return [manager.predict(image) for _ in range(50)]
+
+    with ThreadPoolExecutor(4) as executor:
+        results = [result for batch in executor.map(worker, range(4)) for result in batch]
+
+    assert all(result == expected for result in results)
+    pool = manager._active.pool
+    assert 1 <= pool.created <= 4 and pool.idle == pool.created  # All returned
+    assert manager.get_model_info()['interpreters'] == pool.created
+
+    # Direct interpreter access gets one of its own, which pooled predict() never checks out
+    direct = manager.interpreter
+    assert direct is manager.interpreter
+    idle = [pool.acquire() for _ in range(pool.idle)]
+    assert all(interpreter is not direct for interpreter in idle)
+    for interpreter in idle:
+        pool.release(interpreter)
+
+
+@requires_tflite
+def test_load_model_warms_up_and_reports_cold_and_warm_latency():
+    engine = ASLEngine(warmup_runs=4)
+    assert engine.load_model(str(MODEL_PATH))
+
+    info = engine.get_model_info()
+    assert info['warmup_runs'] == 4
+    assert info['cold_start_ms'] > 0 and info['warm_latency_ms'] > 0
+    assert info['load_time_ms'] > 0
+    assert 'invoke' not in info['latency']  # Warm-up samples are not frame latencies
+    engine.cleanup()
+
+    cold_engine = ASLEngine(warmup_runs=0)
+    assert cold_engine.load_model(str(MODEL_PATH))
+    assert cold_engine.get_model_info()['cold_start_ms'] is None
+    cold_engine.cleanup()
+
+
+@requires_tflite
+def test_model_manager_background_warmup_reports_ready(tmp_path):
+    from app.core.model_manager import ModelManager
+
+    manager = ModelManager(tiny_tflite_model(tmp_path / "model.tflite", 1.0), warmup_runs=3,
+                           background_warmup=True)
+    assert manager.wait_until_ready(timeout=10)
+    assert manager.is_model_loaded()
+
+    info = manager.get_model_info()
+    assert info['ready'] and info['warmup_runs'] == 3
+    assert info['cold_start_ms'] > 0 and info['warm_latency_ms'] > 0
+
+
+@requires_tflite
+def test_model_store_shares_one_model_across_interpreters(tmp_path, monkeypatch):
+    from app.core import tflite_utils
+
+    calls = []
+    real_create = tflite_utils.create_interpreter
+
+    def recording_create(model_path=None, model_content=None, **kwargs):
+        interpreter = real_create(model_path, model_content, **kwargs)
+        calls.append((model_path, model_content))
+        return interpreter
+
+    monkeypatch.setattr(tflite_utils, 'create_interpreter', recording_create)
+    store = tflite_utils.ModelStore()
+    path = tiny_tflite_model(tmp_path / "model.tflite", 1.0)
+
+    interpreters = [store.create_interpreter(path) for _ in range(3)]
+    image = np.random.default_rng(0).random((1, 32, 32, 3), dtype=np.float32)
+    outputs = []
+    for interpreter in interpreters:
+        interpreter.allocate_tensors()
+        interpreter.set_tensor(interpreter.get_input_details()[0]['index'], image)
+        interpreter.invoke()
+        outputs.append(interpreter.get_tensor(interpreter.get_output_details()[0]['index']))
+    np.testing.assert_array_equal(outputs[0], outputs[2])
+    assert len(calls) == 3
+
+    stats = store.get_stats()
+    if stats['buffer_content'] is True:
+        # Every interpreter was built over the one mapping
+        mapping = store.get(path)
+        assert all(model_path is None and content is mapping for model_path, content in calls)
+        assert stats['files'] == 1 and stats['mapped_bytes'] == os.path.getsize(path)
+    else:
+        # Runtimes that only take bytes get the path: the store then maps nothing itself
+        assert stats['buffer_content'] is False
+        assert calls == [(os.path.realpath(path), None)] * 3
+        assert stats['files'] == 0 and stats['mapped_bytes'] == 0
+
+
+def test_model_store_closes_replaced_mappings_once_unused(tmp_path, monkeypatch):
+    from app.core import tflite_utils
+
+    class BufferInterpreter:
+        """Runtime that accepts a buffer as model_content"""
+        def __init__(self, model_content):
+            if model_content[:3] == b"bad":
+                raise ValueError("Model provided has model identifier 'bad'")
+            self.model_content = model_content
+
+    monkeypatch.setattr(tflite_utils, 'create_interpreter',
+                        lambda model_path=None, model_content=None, **kwargs: BufferInterpreter(model_content))
+    store = tflite_utils.ModelStore()
+    path = tmp_path / "model.tflite"
+    path.write_bytes(b"v1" * 64)
+
+    # A corrupt file is an error of that file, not proof that buffers are unsupported
+    corrupt = tmp_path / "corrupt.tflite"
+    corrupt.write_bytes(b"bad" * 64)
+    with pytest.raises(ValueError):
+        store.create_interpreter(str(corrupt))
+    assert store.buffer_content is None
+
+    first = store.create_interpreter(str(path))
+    old_mapping = first.model_content
+    assert store.get(str(path)) is store.get(str(path.resolve())) is old_mapping
+
+    # A replaced file is mapped again; the old mapping stays open while its interpreter lives
+    replacement = tmp_path / "replacement.tflite"
+    replacement.write_bytes(b"v2" * 64)
+    os.replace(replacement, path)
+    second = store.create_interpreter(str(path))
+    assert second.model_content is not old_mapping and store.get_stats()['retired'] == 1
+    assert not old_mapping.closed
+
+    del first
+    gc.collect()
+    assert old_mapping.closed and store.get_stats()['retired'] == 0
+    assert not second.model_content.closed
+
+    # No interpreter left when the file is replaced: closed at once
+    current = second.model_content
+    del second
+    gc.collect()
+    replacement.write_bytes(b"v3" * 80)
+    os.replace(replacement, path)
+    store.get(str(path))
+    assert current.closed and store.get_stats()['retired'] == 0
+    assert store.buffer_content is True
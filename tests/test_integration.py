@@ -0,0 +1,301 @@
+"""
+Integration tests for the ASL recognition pipeline
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from app.core.frame_scheduler import AdaptiveFrameScheduler, STATE_ACTIVE, STATE_STABLE, STATE_IDLE
+from app.core.frame_gate import FrameGate, GATE_RUN, GATE_STATIC, GATE_EMPTY
+from app.core.hand_tracker import HandTracker, SkinDetector
+from app.core.image_processor import FramePreprocessor
+from app.core.inference_worker import InferenceWorker
+from app.core.model_loader import ModelLoader
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_inference_worker_latest_frame_wins():
+    """Frames submitted while the worker is busy overwrite each other"""
+    release = threading.Event()
+    results = []
+
+    def slow_process(frame):
+        release.wait(1.0)
+        return frame
+
+    worker = InferenceWorker(slow_process, on_result=results.append)
+    worker.start()
+    try:
+        worker.submit(0)
+        time.sleep(0.05)  # Let the worker pick up frame 0
+
+        for frame in range(1, 6):
+            worker.submit(frame)
+        release.set()
+
+        deadline = time.time() + 2.0
+        while len(results) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+
+    stats = worker.get_stats()
+    assert results == [0, 5]
+    assert stats['frames_submitted'] == 6
+    assert stats['frames_processed'] == 2
+    assert stats['frames_dropped'] == 4
+
+
+def test_inference_worker_reports_errors():
+    """Exceptions in the processing function go to on_error"""
+    errors = []
+    done = threading.Event()
+
+    def failing_process(frame):
+        raise ValueError("bad frame")
+
+    def on_error(error):
+        errors.append(error)
+        done.set()
+
+    worker = InferenceWorker(failing_process, on_error=on_error)
+    worker.start()
+    try:
+        worker.submit(1)
+        done.wait(1.0)
+    finally:
+        worker.stop()
+
+    assert len(errors) == 1
+    assert worker.get_stats()['errors'] == 1
+
+
+def reference_camera_chain(data, width, height, colorfmt, size=224):
+    """The original texture_to_array -> extract_roi -> preprocess_image chain"""
+    channels = 4 if colorfmt == 'rgba' else 3
+    arr = np.frombuffer(data, dtype=np.uint8).reshape((height, width, channels))
+    code = cv2.COLOR_RGBA2BGR if colorfmt == 'rgba' else cv2.COLOR_RGB2BGR
+    arr = cv2.flip(cv2.cvtColor(arr, code), 0)
+
+    roi_size = min(height, width) // 2
+    x1 = width // 2 - roi_size // 2
+    y1 = height // 2 - roi_size // 2
+    roi = arr[y1:y1 + roi_size, x1:x1 + roi_size]
+
+    image = cv2.resize(roi, (size, size)).astype(np.float32) / 255.0
+    return image[..., ::-1]  # The fused path feeds RGB like file inputs
+
+
+@pytest.mark.parametrize("colorfmt", ["rgba", "rgb"])
+def test_fused_preprocessing_matches_reference_chain(colorfmt):
+    height, width = 480, 640
+    channels = 4 if colorfmt == 'rgba' else 3
+    rng = np.random.default_rng(1)
+    data = rng.integers(0, 256, size=(height, width, channels), dtype=np.uint8).tobytes()
+
+    rgb = FramePreprocessor((224, 224)).process_pixels(data, width, height, colorfmt)
+    fused = rgb.astype(np.float32) / 255.0
+
+    assert fused.shape == (224, 224, 3)
+    np.testing.assert_allclose(fused, reference_camera_chain(data, width, height, colorfmt), atol=1 / 255)
+
+
+def test_model_loader_notifies_subscribers_once_ready():
+    release = threading.Event()
+    early_called = threading.Event()
+    notified = []
+
+    def early(l):
+        time.sleep(0.05)  # A slow subscriber: readiness must not be published before it ran
+        notified.append(("early", l.result))
+        early_called.set()
+
+    loader = ModelLoader(lambda: release.wait(1.0) and "engine")
+    loader.subscribe(early)
+    loader.start()
+    assert not loader.is_ready()
+
+    release.set()
+    assert early_called.wait(2.0)
+    assert loader.wait(2.0)
+    loader.subscribe(lambda l: notified.append(("late", l.result)))
+
+    assert notified == [("early", "engine"), ("late", "engine")]
+    assert loader.error is None
+
+
+def test_model_loader_reports_errors():
+    def failing_load():
+        raise RuntimeError("no model")
+
+    loader = ModelLoader(failing_load)
+    loader.start()
+    assert loader.wait(2.0)
+    assert isinstance(loader.error, RuntimeError)
+    assert loader.result is None
+
+
+def test_pipeline_helpers_do_not_import_tensorflow():
+    """Screens import these on startup; TensorFlow must wait for the model loader"""
+    code = ("import sys; import app.core.inference_worker, app.core.image_processor, "
+            "app.core.latency_tracker, app.core.model_loader, app.core.settings_manager; "
+            "sys.exit('tensorflow' in sys.modules)")
+    assert subprocess.run([sys.executable, "-c", code], cwd=ROOT).returncode == 0
+
+
+def test_frame_gate_skips_static_and_empty_frames():
+    rng = np.random.default_rng(2)
+    background = rng.integers(90, 110, size=(224, 224, 3), dtype=np.uint8)
+    hand = background.copy()
+    hand[60:180, 80:150] = 200
+
+    gate = FrameGate(max_reuse=5)
+    assert gate.check(hand) == GATE_RUN
+    gate.record_result(('A', 0.9), 'A', 0.9)
+    assert gate.check(hand) == GATE_STATIC  # Nothing moved: reuse
+
+    assert gate.check(background) == GATE_RUN  # Hand left: model must look
+    gate.record_result(('NOTHING', 0.95), 'NOTHING', 0.95)
+    noisy = np.clip(background.astype(np.int16) + rng.integers(-2, 3, size=background.shape), 0, 255)
+    assert gate.check(noisy.astype(np.uint8)) == GATE_EMPTY
+
+    assert gate.check(hand) == GATE_RUN  # Hand is back
+
+    stats = gate.get_stats()
+    assert stats['frames_run'] == 3
+    assert stats['static_hits'] == 1 and stats['empty_hits'] == 1
+    assert stats['hit_rate'] == pytest.approx(2 / 5)
+
+
+def test_frame_gate_forces_refresh_after_max_reuse():
+    frame = np.full((64, 64, 3), 120, dtype=np.uint8)
+    gate = FrameGate(max_reuse=3)
+    assert gate.check(frame) == GATE_RUN
+    gate.record_result(('B', 0.8), 'B', 0.8)
+
+    decisions = [gate.check(frame) for _ in range(4)]
+    assert decisions == [GATE_STATIC, GATE_STATIC, GATE_STATIC, GATE_RUN]
+
+
+class FakeClocks:
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def advance(self, seconds, cpu_share=0.1):
+        self.wall += seconds
+        self.cpu += seconds * cpu_share
+
+
+def make_scheduler(clocks, **kwargs):
+    return AdaptiveFrameScheduler(min_fps=2, max_fps=30, clock=lambda: clocks.wall,
+                                  cpu_clock=lambda: clocks.cpu, cpu_count=1, **kwargs)
+
+
+def test_frame_scheduler_follows_recognition_state():
+    clocks = FakeClocks()
+    scheduler = make_scheduler(clocks)
+    scheduler.record_inference(0.01)  # 100 fps capacity: not the limit
+
+    clocks.advance(1.0)
+    assert scheduler.update(STATE_IDLE) == pytest.approx(1 / 2)
+    clocks.advance(0.1)
+    assert scheduler.update(STATE_ACTIVE) is None  # Decisions at most every update_interval
+    clocks.advance(1.0)
+    assert scheduler.update(STATE_ACTIVE) == pytest.approx(1 / 30)
+    clocks.advance(1.0)
+    assert scheduler.update(STATE_STABLE) == pytest.approx(1 / 15)
+
+
+def test_frame_scheduler_respects_latency_and_cpu_budget():
+    clocks = FakeClocks()
+    scheduler = make_scheduler(clocks)
+    scheduler.record_inference(0.1)  # Model sustains only 10 fps
+
+    clocks.advance(1.0)
+    assert scheduler.update(STATE_ACTIVE) == pytest.approx(1 / 10)
+
+    # Over the CPU budget: back off step by step, never below min_fps
+    for _ in range(30):
+        clocks.advance(1.0, cpu_share=0.95)
+        scheduler.update(STATE_ACTIVE)
+    assert scheduler.current_fps == pytest.approx(2)
+    assert scheduler.get_stats()['cpu_utilization'] == pytest.approx(0.95)
+
+
+def hand_frame(x, y, size=120, width=640, height=480):
+    """Raw bottom-up RGBA texture bytes with a skin-coloured 'hand' at upright (x, y)"""
+    upright = np.empty((height, width, 4), dtype=np.uint8)
+    upright[:] = (60, 80, 120, 255)
+    cv2.ellipse(upright, (x + size // 2, y + size // 2), (size // 3, size // 2), 0, 0, 360,
+                (200, 150, 120, 255), -1)
+    return np.ascontiguousarray(upright[::-1]).tobytes()
+
+
+def test_hand_tracker_follows_hand_between_detections():
+    preprocessor = FramePreprocessor((224, 224))
+    tracker = HandTracker(detect_every=10, smoothing=1.0, detector=SkinDetector())
+
+    boxes = []
+    for step in range(8):
+        x = 100 + step * 8
+        thumbnail = preprocessor.thumbnail(hand_frame(x, 150), 640, 480, 'rgba')
+        box = tracker.update(thumbnail, (640, 480))
+        assert box is not None
+        x1, y1, x2, y2 = box
+        assert x2 - x1 == y2 - y1  # Square crop
+        assert x1 <= x + 60 <= x2 and y1 <= 210 <= y2  # Hand centre inside the crop
+        boxes.append(box)
+
+    assert tracker.get_stats()['detections'] == 1
+    assert tracker.get_stats()['tracked_frames'] == 7
+    assert boxes[-1][0] > boxes[0][0]
+
+
+def test_skin_detector_skips_the_face_above_the_hand():
+    """A larger skin-coloured face above the hand must not take the crop"""
+    preprocessor = FramePreprocessor((224, 224))
+    tracker = HandTracker(smoothing=1.0, detector=SkinDetector())
+
+    upright = np.ascontiguousarray(np.frombuffer(hand_frame(380, 300), dtype=np.uint8).reshape(480, 640, 4)[::-1])
+    cv2.ellipse(upright, (320, 110), (80, 105), 0, 0, 360, (200, 150, 120, 255), -1)  # Face
+    data = np.ascontiguousarray(upright[::-1]).tobytes()
+
+    for _ in range(3):
+        x1, y1, x2, y2 = tracker.update(preprocessor.thumbnail(data, 640, 480, 'rgba'), (640, 480))
+        assert x1 <= 440 <= x2 and y1 <= 360 <= y2  # Hand centre inside the crop
+        assert not (x1 <= 320 <= x2 and y1 <= 110 <= y2)  # Face centre outside
+
+
+def test_hand_tracker_close_releases_the_detector():
+    class ClosableDetector(SkinDetector):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    detector = ClosableDetector()
+    tracker = HandTracker(detector=detector)
+    tracker.close()
+    assert detector.closed
+    HandTracker(detector=SkinDetector()).close()  # Detectors without close() are fine
+
+
+def test_hand_tracker_returns_none_without_hand():
+    preprocessor = FramePreprocessor((224, 224))
+    tracker = HandTracker(detector=SkinDetector())
+    empty = np.full((480, 640, 4), (60, 80, 120, 255), dtype=np.uint8).tobytes()
+
+    assert tracker.update(preprocessor.thumbnail(empty, 640, 480, 'rgba'), (640, 480)) is None
+
+    # The camera falls back to the centre crop for a None box
+    roi = preprocessor.process_pixels(empty, 640, 480, 'rgba', roi=None)
+    assert roi.shape == (224, 224, 3)
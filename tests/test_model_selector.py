@@ -0,0 +1,120 @@
+"""
+Tests for latency-budget model selection
+"""
+
+import json
+
+import pytest
+
+from app.core.model_selector import ModelSelector, get_cpu_signature
+
+
+def write_models(directory, names):
+    paths = []
+    for i, name in enumerate(names):
+        path = directory / name
+        path.write_bytes(bytes([i]) * 64)
+        paths.append(path)
+    return paths
+
+
+def test_selector_picks_most_accurate_model_within_budget(tmp_path):
+    keras, tflite, quantized = write_models(tmp_path, ["model.h5", "model.tflite", "model_int8.tflite"])
+    measured = {keras: (40.0, 'keras'), tflite: (15.0, 'tflite'), quantized: (6.0, 'tflite_quantized')}
+    calls = []
+
+    def benchmark(path):
+        calls.append(path)
+        latency_ms, model_format = measured[path]
+        return {'latency_ms': latency_ms, 'format': model_format}
+
+    cache_path = tmp_path / "model_selection.json"
+    candidates = [keras, tflite, quantized]
+
+    assert ModelSelector(50.0, benchmark, cache_path).select(candidates) == keras
+    assert len(calls) == 3
+
+    # Later startups reuse the cached measurements for any budget
+    assert ModelSelector(20.0, benchmark, cache_path).select(candidates) == tflite
+    assert ModelSelector(1.0, benchmark, cache_path).select(candidates) == quantized  # Nothing fits: fastest
+    assert len(calls) == 3
+
+    # A measured accuracy outranks the format prior
+    (tmp_path / "model_int8.tflite.json").write_text(json.dumps({'accuracy': 0.99}))
+    assert ModelSelector(20.0, benchmark, cache_path).select(candidates) == quantized
+
+    # A changed model, CPU or runtime config is measured again
+    quantized.write_bytes(b"retrained" * 8)
+    selector = ModelSelector(20.0, benchmark, cache_path)
+    selector.select(candidates)
+    assert calls[-1] == quantized and selector.benchmarks_run == 1
+
+    ModelSelector(20.0, benchmark, cache_path, config="threads=4").select(candidates)
+    assert len(calls) == 7
+
+    cache = json.loads(cache_path.read_text())
+    assert all(get_cpu_signature() in key for key in cache['measurements'])
+
+
+def test_model_manager_selects_by_latency_budget(tmp_path, monkeypatch):
+    from app.core.model_manager import ModelManager, TENSORFLOW_AVAILABLE
+    if not TENSORFLOW_AVAILABLE:
+        pytest.skip("TensorFlow not available")
+    from tests.test_asl_engine import tiny_tflite_model
+
+    models = tmp_path / "assets" / "models"
+    models.mkdir(parents=True)
+    tiny_tflite_model(models / "a.tflite", 1.0)
+    tiny_tflite_model(models / "b.tflite", 0.0)
+    (models / "b.tflite.json").write_text(json.dumps({'accuracy': 0.9}))
+    monkeypatch.chdir(tmp_path)
+
+    manager = ModelManager(latency_budget_ms=1000.0, selection_runs=2)
+    assert manager.is_loaded and manager.model_path.endswith("b.tflite")
+    table = manager.get_model_info()['model_selection']
+    assert {row['format'] for row in table} == {'tflite'}
+    assert all(row['latency_ms'] > 0 and row['fits_budget'] for row in table)
+
+    cache = json.loads((models / "model_selection.json").read_text())
+    assert len(cache['measurements']) == 2
+
+    # Second startup: nothing is benchmarked again
+    monkeypatch.setattr(ModelManager, '_benchmark_model',
+                        lambda self, path: pytest.fail(f"{path} benchmarked again"))
+    manager = ModelManager(latency_budget_ms=1000.0)
+    assert manager.model_path.endswith("b.tflite")
+
+
+def test_model_manager_runs_full_integer_candidates(tmp_path, monkeypatch):
+    """uint8-in/uint8-out models (scripts/convert_int8.py) are benchmarked and served; broken files are skipped"""
+    from app.core.model_manager import ModelManager, TENSORFLOW_AVAILABLE
+    if not TENSORFLOW_AVAILABLE:
+        pytest.skip("TensorFlow not available")
+    import numpy as np
+    import tensorflow as tf
+    from scripts.convert_int8 import convert_keras_to_int8
+
+    model = tf.keras.Sequential([
+        tf.keras.Input((32, 32, 3)),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(29, activation='softmax')
+    ])
+    kernel, _ = model.layers[-1].get_weights()
+    model.layers[-1].set_weights([np.zeros_like(kernel), np.arange(29, dtype=np.float32)])
+    rng = np.random.default_rng(0)
+    calibration = [rng.random((32, 32, 3), dtype=np.float32) for _ in range(10)]
+
+    models = tmp_path / "assets" / "models"
+    models.mkdir(parents=True)
+    (models / "best_model_int8.tflite").write_bytes(convert_keras_to_int8(model, calibration))
+    (models / "best_model_int8.tflite.json").write_text(json.dumps({'accuracy': 0.9}))
+    (models / "broken.tflite").write_bytes(b"not a flatbuffer")
+    monkeypatch.chdir(tmp_path)
+
+    manager = ModelManager(latency_budget_ms=1000.0, selection_runs=2)
+    assert manager.is_loaded and manager.model_path.endswith("best_model_int8.tflite")
+    assert [row['format'] for row in manager.get_model_info()['model_selection']] == ['tflite_quantized']
+
+    # Dequantized probabilities: softmax(arange(29)) puts ~0.63 on the last class
+    class_idx, confidence = manager.predict(rng.random((1, 32, 32, 3), dtype=np.float32))
+    assert class_idx == 28 and confidence == pytest.approx(1 / np.exp(-np.arange(29)).sum(), abs=0.02)
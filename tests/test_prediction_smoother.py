@@ -0,0 +1,93 @@
+"""
+Tests for probability-space prediction smoothing
+"""
+
+import numpy as np
+import pytest
+
+from app.core.prediction_smoother import ProbabilitySmoother, SequentialLetterTest
+
+NUM_CLASSES = 29
+
+
+def frame(index, share=0.8, rival=None, rival_share=0.0):
+    probabilities = np.full(NUM_CLASSES, (1.0 - share - rival_share) / (NUM_CLASSES - 1), dtype=np.float32)
+    probabilities[index] = share
+    if rival is not None:
+        probabilities[rival] = rival_share
+    return probabilities
+
+
+def test_ema_commits_confident_letter_within_two_frames():
+    smoother = ProbabilitySmoother(NUM_CLASSES, mode='ema')
+    assert smoother.update(frame(3)) is None  # min_frames
+    assert smoother.update(frame(3)) == 3
+
+
+def test_distribution_wins_over_argmax_flicker():
+    """A rival that briefly wins argmax does not stop the true letter committing"""
+    smoother = ProbabilitySmoother(NUM_CLASSES, mode='ema')
+    stream = [frame(3), frame(7, share=0.5, rival=3, rival_share=0.4), frame(3), frame(3)]
+    committed = [smoother.update(p) for p in stream]
+    assert 3 in committed
+    assert 7 not in committed
+
+
+def test_hysteresis_holds_until_release():
+    smoother = ProbabilitySmoother(NUM_CLASSES, mode='ema', enter_threshold=0.6, exit_threshold=0.3)
+    committed = [smoother.update(frame(3)) for _ in range(6)]
+    assert committed.count(3) == 1  # Held, not re-committed every frame
+
+    # Hand moves away: the letter is released, then the same letter can commit again
+    for _ in range(4):
+        smoother.update(frame(28, share=0.9))
+    assert smoother.active_index != 3
+    committed = [smoother.update(frame(3)) for _ in range(6)]
+    assert committed.count(3) == 1
+
+
+@pytest.mark.parametrize("window", [1, 3, 5])
+def test_window_mode_is_mean_of_recent_frames(window):
+    rng = np.random.default_rng(0)
+    stream = rng.dirichlet(np.ones(NUM_CLASSES), size=12).astype(np.float32)
+
+    smoother = ProbabilitySmoother(NUM_CLASSES, mode='window', window=window)
+    for probabilities in stream:
+        smoother.update(probabilities)
+
+    np.testing.assert_allclose(smoother.smoothed, stream[-window:].mean(axis=0), atol=1e-6)
+
+
+def test_invalid_configuration_rejected():
+    with pytest.raises(ValueError):
+        ProbabilitySmoother(NUM_CLASSES, mode='median')
+    with pytest.raises(ValueError):
+        ProbabilitySmoother(NUM_CLASSES, enter_threshold=0.3, exit_threshold=0.5)
+
+
+def test_sequential_test_commits_on_evidence_and_rearms_on_gap():
+    nothing = NUM_CLASSES - 1
+    test = SequentialLetterTest(NUM_CLASSES, nothing_index=nothing)
+
+    # A confident letter commits within a few frames, then is held
+    committed = [test.update(frame(3, share=0.7)) for _ in range(8)]
+    assert committed.count(3) == 1
+    assert committed.index(3) <= 2
+
+    # A different letter commits straight away, no cooldown
+    committed = [test.update(frame(7, share=0.7)) for _ in range(8)]
+    assert committed.count(7) == 1
+
+    # Repeating a letter needs a NOTHING gap in between
+    for _ in range(4):
+        test.update(frame(nothing, share=0.9))
+    assert test.active_index is None
+    committed = [test.update(frame(7, share=0.7)) for _ in range(8)]
+    assert committed.count(7) == 1
+
+
+def test_sequential_test_ignores_brief_flicker():
+    test = SequentialLetterTest(NUM_CLASSES, nothing_index=NUM_CLASSES - 1)
+    stream = [frame(3, share=0.3, rival=9, rival_share=0.3), frame(9, share=0.5, rival=3, rival_share=0.4),
+              frame(3, share=0.5, rival=9, rival_share=0.4)]
+    assert [test.update(p) for p in stream] == [None, None, None]
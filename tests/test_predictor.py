@@ -0,0 +1,130 @@
+"""
+Tests for the offline ASL predictor
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from app.core.predictor import ASLPredictor
+from app.core.prediction_result import PredictionResult
+from app.utils.constants import ASL_CLASSES
+
+
+def small_keras_model(input_size=32, seed=0):
+    """Conv classifier with seeded random weights, so every input scores differently"""
+    tf.keras.utils.set_random_seed(seed)
+    return tf.keras.Sequential([
+        tf.keras.Input((input_size, input_size, 3)),
+        tf.keras.layers.Conv2D(8, 3, activation='relu'),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(len(ASL_CLASSES), activation='softmax')
+    ])
+
+
+def small_tflite_model(path, input_size=32, seed=0):
+    """Float TFLite version of small_keras_model"""
+    path.write_bytes(tf.lite.TFLiteConverter.from_keras_model(small_keras_model(input_size, seed)).convert())
+    return str(path)
+
+
+def make_predictor(model_path, input_size=32):
+    config = SimpleNamespace(class_labels=ASL_CLASSES, model=SimpleNamespace(input_size=input_size))
+    predictor = ASLPredictor(config)
+    assert predictor.load_tflite_model(model_path)
+    return predictor
+
+
+def test_predict_batch_matches_per_item_loop(tmp_path):
+    predictor = make_predictor(small_tflite_model(tmp_path / "model.tflite"))
+    batch = np.random.default_rng(0).random((5, 32, 32, 3), dtype=np.float32)
+
+    looped = np.stack([predictor._predict_tflite(image[np.newaxis]) for image in batch])
+    assert predictor.tflite_batch_size == 1
+
+    # One forward pass: the input tensor is resized to the batch, then to a new batch size
+    np.testing.assert_allclose(predictor.predict_batch_probabilities(batch), looped, atol=1e-6)
+    assert predictor.tflite_batch_size == 5
+    np.testing.assert_allclose(predictor.predict_batch_probabilities(batch[:3]), looped[:3], atol=1e-6)
+    assert predictor.tflite_batch_size == 3
+
+    results = predictor.predict_batch(batch)
+    assert [label for label, _ in results] == [ASL_CLASSES[i] for i in looped.argmax(axis=1)]
+    np.testing.assert_allclose([confidence for _, confidence in results], looped.max(axis=1), atol=1e-6)
+    assert predictor.prediction_count == 5 + 3 + 5  # Counted per image
+
+
+def test_predict_batch_quantizes_full_integer_models(tmp_path):
+    """A uint8-in/uint8-out model from scripts/convert_int8.py scores like its float twin"""
+    from scripts.convert_int8 import convert_keras_to_int8
+
+    rng = np.random.default_rng(0)
+    batch = rng.random((6, 32, 32, 3), dtype=np.float32)
+    calibration_images = list(rng.random((20, 32, 32, 3), dtype=np.float32))
+    int8_path = tmp_path / "int8.tflite"
+    int8_path.write_bytes(convert_keras_to_int8(small_keras_model(), calibration_images))
+
+    float_predictor = make_predictor(small_tflite_model(tmp_path / "float.tflite"))
+    int8_predictor = make_predictor(str(int8_path))
+    assert int8_predictor.input_details[0]['dtype'] == np.uint8
+
+    reference = float_predictor.predict_batch_probabilities(batch)
+    probabilities = int8_predictor.predict_batch_probabilities(batch)
+    assert probabilities.dtype == np.float32  # Dequantized, not raw 0-255 scores
+    np.testing.assert_allclose(probabilities, reference, atol=0.02)
+    assert probabilities.sum(axis=1) == pytest.approx(np.ones(len(batch)), abs=0.05)
+
+
+def test_predict_from_image_returns_empty_result_on_failure(tmp_path):
+    predictor = make_predictor(small_tflite_model(tmp_path / "model.tflite"))
+    (tmp_path / "broken.jpg").write_bytes(b"not an image")
+
+    for image_path in [tmp_path / "missing.png", tmp_path / "broken.jpg"]:
+        result = predictor.predict_from_image(str(image_path))
+        assert isinstance(result, PredictionResult)
+        assert result.class_name is None and result.confidence == 0.0
+        assert result.top_k(3) == []
+
+
+def test_top_k_from_probabilities_orders_each_row():
+    predictor = ASLPredictor(SimpleNamespace(class_labels=ASL_CLASSES, model=SimpleNamespace(input_size=32)))
+    probabilities = np.full((2, len(ASL_CLASSES)), 0.01, dtype=np.float32)
+    probabilities[0, [2, 0, 5]] = [0.5, 0.3, 0.1]
+    probabilities[1, [28, 1]] = [0.6, 0.2]
+
+    top = predictor.top_k_from_probabilities(probabilities, k=3)
+    assert [name for name, _ in top[0]] == ['C', 'A', 'F']
+    assert [name for name, _ in top[1]][:2] == [ASL_CLASSES[28], 'B']
+    assert top[0][0][1] == pytest.approx(0.5)
+
+    assert [len(row) for row in predictor.top_k_from_probabilities(probabilities, k=1)] == [1, 1]
+    assert len(predictor.top_k_from_probabilities(probabilities, k=100)[0]) == len(ASL_CLASSES)
+
+
+def test_batch_classify_cli_writes_one_row_per_image(tmp_path, capsys):
+    import cv2
+    from scripts.batch_classify import main
+
+    model_path = small_tflite_model(tmp_path / "model.tflite")
+    images = tmp_path / "images"
+    for folder, value in [("a", 40), ("b", 200)]:
+        (images / folder).mkdir(parents=True)
+        for i in range(3):
+            cv2.imwrite(str(images / folder / f"{i}.png"), np.full((48, 48, 3), value + i, dtype=np.uint8))
+    (images / "b" / "broken.jpg").write_bytes(b"not an image")
+
+    output = tmp_path / "results.jsonl"
+    assert main([str(images), '--model', model_path, '--output', str(output), '--batch-size', '2',
+                 '--workers', '1', '--top-k', '2', '--input-size', '32']) == 0
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(Path(row['path']).relative_to(images).as_posix() for row in rows) == \
+        ['a/0.png', 'a/1.png', 'a/2.png', 'b/0.png', 'b/1.png', 'b/2.png']
+    assert all(len(row['top_k']) == 2 and row['label'] == row['top_k'][0][0] for row in rows)
+    assert all(row['top_k'][0][1] >= row['top_k'][1][1] for row in rows)
+    assert "Classified: 6  Failed: 1" in capsys.readouterr().err
@@ -0,0 +1,86 @@
+"""
+Tests for the dictionary trie and beam decoder
+"""
+
+import numpy as np
+
+from app.core.word_decoder import BeamDecoder, WordTrie, read_word_list
+
+CLASS_NAMES = [chr(ord('A') + i) for i in range(26)] + ['SPACE', 'DELETE', 'NOTHING']
+WORDS = [('THE', 100.0), ('THAT', 40.0), ('THIS', 30.0), ('HELLO', 20.0), ('HELP', 25.0), ('HE', 50.0)]
+
+
+def letter(name, share=0.7, rival=None, rival_share=0.25):
+    probabilities = np.full(len(CLASS_NAMES), (1.0 - share - (rival_share if rival else 0.0)) / 27, dtype=np.float32)
+    probabilities[CLASS_NAMES.index(name)] = share
+    if rival:
+        probabilities[CLASS_NAMES.index(rival)] = rival_share
+    return probabilities
+
+
+def test_trie_layout_and_priors():
+    trie = WordTrie.build(WORDS)
+    node = trie.find('th')
+    assert node > 0 and not trie.is_word(node)
+    assert trie.word(int(trie.best_leaf[node])) == 'THE'  # Most frequent completion
+    assert trie.find('thx') == -1
+    assert trie.is_word(trie.find('he'))
+
+
+def test_decoder_completes_and_corrects_letters():
+    decoder = BeamDecoder(WordTrie.build(WORDS), CLASS_NAMES)
+    assert decoder.suggestions() == []
+
+    for name in 'HEL':
+        decoder.step(letter(name))
+    assert decoder.suggestions(1)[0][0] == 'HELP'
+
+    # A misread first letter (G over T) is recovered from its runner-up
+    decoder.reset()
+    decoder.step(letter('G', share=0.6, rival='T', rival_share=0.35))
+    decoder.step(letter('H'))
+    assert decoder.suggestions(1)[0][0] == 'THE'
+
+    decoder.pop()
+    assert decoder.depth == 1
+
+
+def test_out_of_dictionary_letters_give_no_suggestions():
+    decoder = BeamDecoder(WordTrie.build(WORDS), CLASS_NAMES)
+    for name in 'XQ':
+        decoder.step(letter(name, share=0.99))
+    assert decoder.suggestions() == []
+
+
+def test_compiled_trie_is_memory_mapped(tmp_path):
+    word_list = tmp_path / 'words.txt'
+    word_list.write_text("# comment\nthe\nhello\t5\nhelp\nit's\n", encoding='utf-8')
+    assert dict(read_word_list(word_list)) == {'THE': 1.0, 'HELLO': 5.0, 'HELP': 1.0 / 3}
+
+    built = WordTrie.load(word_list)
+    loaded = WordTrie.load(word_list)
+    assert isinstance(loaded.nodes, np.memmap)
+    np.testing.assert_array_equal(built.nodes, loaded.nodes)
+    assert loaded.word(int(loaded.best_leaf[loaded.find('hel')])) == 'HELLO'
+
+
+def test_signed_letters_are_kept_unless_a_suggestion_is_selected():
+    words = WORDS + [('A', 90.0), ('AND', 95.0), ('I', 80.0), ('IN', 85.0), ('JUST', 60.0)]
+    decoder = BeamDecoder(WordTrie.build(words), CLASS_NAMES)
+
+    # Short words stay as signed even when a longer word ranks first
+    for word, completion in [('A', 'AND'), ('I', 'IN')]:
+        decoder.reset()
+        decoder.step(letter(word, share=1.0))
+        assert decoder.suggestions(1)[0][0] == completion
+        assert decoder.choose_word(word) == word
+        assert decoder.choose_word(word, selection=completion.lower()) == completion
+
+    # A name outside the dictionary: smoothing leaves ~0.4% on every letter,
+    # which must not be enough to read JUVI as JUST
+    decoder.reset()
+    for name in 'JUVI':
+        decoder.step(letter(name, share=0.9))
+    assert decoder.suggestions() == []
+    assert decoder.choose_word('JUVI') == 'JUVI'
+    assert decoder.choose_word('JUVI', selection='JUST') == 'JUVI'  # Not a current suggestion